@@ -0,0 +1,166 @@
+import argparse
+import glob
+import json
+import sys
+
+import colormath
+from jsonc import load as load_json
+
+# WCAG contrast audit for generated Zed themes.
+#
+# Each foreground-like key is paired with the background it is drawn on.
+# Required ratios follow WCAG 2: 4.5 for body text, 3.0 for large text and
+# UI glyphs. Disabled, placeholder and decorative colors are not audited.
+
+TEXT = 4.5
+UI = 3.0
+
+# (foreground key, background key, required ratio)
+CONTRAST_PAIRS = [
+    ("text", "background", TEXT),
+    ("text", "surface.background", TEXT),
+    ("text", "elevated_surface.background", TEXT),
+    ("text.muted", "surface.background", TEXT),
+    ("text.muted", "background", TEXT),
+    ("text.accent", "background", TEXT),
+    ("text", "element.background", TEXT),
+    ("text", "element.selected", TEXT),
+    ("text", "status_bar.background", TEXT),
+    ("text", "title_bar.background", TEXT),
+    ("text", "tab.active_background", TEXT),
+    ("text.muted", "tab.inactive_background", TEXT),
+    ("editor.foreground", "editor.background", TEXT),
+    ("editor.foreground", "editor.active_line.background", TEXT),
+    ("editor.line_number", "editor.gutter.background", UI),
+    ("editor.active_line_number", "editor.gutter.background", UI),
+    ("icon", "surface.background", UI),
+    ("icon.muted", "surface.background", UI),
+    ("icon.accent", "surface.background", UI),
+    ("link_text.hover", "editor.background", TEXT),
+    ("terminal.foreground", "terminal.background", TEXT),
+]
+
+for _status in ("conflict", "created", "deleted", "error", "hint", "info", "modified",
+                "renamed", "success", "warning"):
+    CONTRAST_PAIRS.append((_status, "editor.background", UI))
+    CONTRAST_PAIRS.append((_status, f"{_status}.background", UI))
+
+for _color in ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "white"):
+    CONTRAST_PAIRS.append((f"terminal.ansi.{_color}", "terminal.background", UI))
+    CONTRAST_PAIRS.append((f"terminal.ansi.bright_{_color}", "terminal.background", UI))
+
+# Syntax colors are checked against the editor background. Comments are
+# deliberately dim in these themes, so they only need the UI ratio.
+SYNTAX_BACKGROUND = "editor.background"
+SYNTAX_REQUIRED = {"comment": UI, "comment.doc": UI, "hint": UI, "predictive": UI}
+
+# Where to look when a pair's background key is absent, and what a
+# translucent background is composited onto.
+BACKGROUND_FALLBACKS = ["editor.background", "background"]
+
+
+def resolve_background(style, key):
+    # Returns the background as an opaque color, or None
+    chain = [key] + [k for k in BACKGROUND_FALLBACKS if k != key]
+    layers = []
+    for k in chain:
+        color = colormath.parse(style.get(k))
+        if color is None:
+            continue
+        layers.append(color)
+        if color[3] >= 1:
+            break
+    if not layers:
+        return None
+    # Composite translucent layers onto the first opaque one (or black)
+    result = colormath.BLACK
+    for color in reversed(layers):
+        result = colormath.alpha_over(color, result)
+    return result
+
+
+def theme_pairs(style):
+    # (foreground key, background key, required ratio) for one theme style
+    pairs = [(fg, bg, required) for fg, bg, required in CONTRAST_PAIRS if fg in style]
+    for key, entry in style.get("syntax", {}).items():
+        if isinstance(entry, dict) and entry.get("color"):
+            pairs.append((f"syntax.{key}", SYNTAX_BACKGROUND, SYNTAX_REQUIRED.get(key, TEXT)))
+    return pairs
+
+
+def audit(zed_theme, min_ratio=None):
+    # Returns every audited pair of every theme in the family as a dict,
+    # lowest contrast first. min_ratio overrides the per-pair requirement.
+    rows = []
+    for theme in zed_theme.get("themes", []):
+        style = theme.get("style", {})
+        syntax = style.get("syntax", {})
+        for fg_key, bg_key, required in theme_pairs(style):
+            if fg_key.startswith("syntax."):
+                fg_value = syntax[fg_key[len("syntax."):]]["color"]
+            else:
+                fg_value = style[fg_key]
+            fg = colormath.parse(fg_value)
+            bg = resolve_background(style, bg_key)
+            if fg is None or bg is None:
+                continue
+            rows.append({
+                "theme": theme.get("name"),
+                "foreground": fg_key,
+                "background": bg_key,
+                "fg_color": fg_value,
+                "bg_color": colormath.to_hex(bg),
+                "required": min_ratio if min_ratio is not None else required,
+                "_pair": (fg, bg),
+            })
+
+    # One pass over all pairs; repeated color pairs are computed once
+    ratios = colormath.contrast_many(row.pop("_pair") for row in rows)
+    for row, ratio in zip(rows, ratios):
+        row["ratio"] = round(ratio, 2)
+        row["ok"] = ratio >= row["required"]
+    rows.sort(key=lambda row: row["ratio"])
+    return rows
+
+
+def failures(rows):
+    return [row for row in rows if not row["ok"]]
+
+
+def print_failures(rows, indent="  "):
+    for row in failures(rows):
+        print(f"{indent}{row['ratio']:>5.2f} < {row['required']:<4} {row['foreground']} {row['fg_color']} "
+              f"on {row['background']} {row['bg_color']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check foreground/background contrast in Zed themes.")
+    parser.add_argument("paths", nargs="*", help="Zed theme files (default: themes/*.json)")
+    parser.add_argument("--min-ratio", type=float,
+                        help="required contrast for every pair, instead of the WCAG level per pair")
+    parser.add_argument("--json", metavar="PATH", help="write every audited pair to a JSON report")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 if any pair fails")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob("themes/*.json"))
+    report = {}
+    failed = 0
+    for path in paths:
+        rows = audit(load_json(path), args.min_ratio)
+        report[path] = rows
+        bad = failures(rows)
+        failed += len(bad)
+        print(f"{path}: {len(rows)} pairs, {len(bad)} below the required contrast")
+        print_failures(rows)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.json}")
+
+    if args.strict and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import convert_theme
+import expand_theme
+import jsonc
+from mapping import DERIVE_OPERATIONS, UI_CHAINS, build_scope_index
+
+# Benchmarks for the conversion pipeline.
+#
+#   python bench.py                      time each pipeline stage on synthetic themes
+#   python bench.py --colors 5000 --scopes 50000 --depth 12
+#   python bench.py --compare            old vs new implementations of single steps
+#   python bench.py --startup            import time of the CLIs against their budgets
+#
+# Stage results are written to bench_output.json so runs on different
+# commits can be compared.
+
+OUTPUT_PATH = "bench_output.json"
+
+# Import-time budgets in milliseconds (median cumulative -X importtime,
+# bytecode cached). A single-theme run is mostly startup, so a new eager
+# import that blows these should be made lazy instead.
+STARTUP_BUDGETS_MS = {
+    "convert_theme": 60,
+    "expand_theme": 60,
+    "validate_theme": 40,
+}
+
+# Modules a plain conversion must not import at startup
+LAZY_MODULES = ("audit_theme", "quantize", "concurrent.futures", "multiprocessing", "numpy")
+
+
+def linear_lookup(scope, mapping):
+    # The original convert_syntax scan, kept here as the baseline.
+    best_match_val = None
+    best_match_len = 0
+    for vs_scope, zed_val in mapping.items():
+        if scope == vs_scope or scope.startswith(vs_scope + "."):
+            if len(vs_scope) > best_match_len:
+                best_match_len = len(vs_scope)
+                best_match_val = zed_val
+    return best_match_val
+
+
+def synthetic_mapping(size, rng):
+    # Grows SYNTAX_MAPPING with made-up dotted scopes up to `size` keys.
+    mapping = dict(convert_theme.SYNTAX_MAPPING)
+    roots = sorted({k.split(".")[0] for k in mapping})
+    while len(mapping) < size:
+        depth = rng.randint(2, 5)
+        parts = [rng.choice(roots)] + [f"seg{rng.randint(0, 50)}" for _ in range(depth - 1)]
+        mapping[".".join(parts)] = "keyword"
+    return mapping
+
+
+def synthetic_scopes(count, depth, rng, mapping):
+    keys = list(mapping)
+    scopes = []
+    for _ in range(count):
+        base = rng.choice(keys).split(".")
+        extra = [f"x{rng.randint(0, 9)}" for _ in range(max(0, depth - len(base)))]
+        scopes.append(".".join(base + extra))
+    return scopes
+
+
+def legacy_load_jsonc(content):
+    # The regex approach load_json used before jsonc.py, kept as the baseline.
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        pattern = r'("(?:\\.|[^"\\])*")|//.*'
+        content = re.sub(pattern, lambda m: m.group(1) or "", content)
+        content = re.sub(r',(\s*?[}\]])', r'\1', content)
+        return json.loads(content)
+
+
+def synthetic_jsonc(color_count, rng):
+    # A theme file in the style VS Code writes: line comments, URLs in
+    # strings and trailing commas.
+    lines = ['{', '  // Generated theme', '  "$schema": "vscode://schemas/color-theme",',
+             '  "url": "https://example.com/a//b",', '  "colors": {']
+    for i in range(color_count):
+        if i % 10 == 0:
+            lines.append(f'    // group {i // 10}')
+        lines.append(f'    "key{i}.background": "#{rng.randrange(1 << 24):06x}",')
+    lines.append('  },')
+    lines.append('  "tokenColors": [')
+    for i in range(color_count // 4):
+        lines.append(f'    {{ "scope": ["scope{i}.a", "scope{i}.b",], '
+                     f'"settings": {{ "foreground": "#{rng.randrange(1 << 24):06x}", }} }}, // rule {i}')
+    lines.append('  ],')
+    lines.append('}')
+    return "\n".join(lines)
+
+
+def bench_jsonc():
+    rng = random.Random(0)
+    print("JSONC load")
+    print(f"  {'colors':>8} {'KB':>8} {'regex ms':>10} {'jsonc ms':>10}")
+    for count in (500, 5000, 50000):
+        text = synthetic_jsonc(count, rng)
+        assert legacy_load_jsonc(text) == jsonc.loads(text)
+        legacy = timed(legacy_load_jsonc, text)
+        scanner = timed(jsonc.loads, text)
+        print(f"  {count:>8} {len(text) // 1024:>8} {legacy * 1000:>10.1f} {scanner * 1000:>10.1f}")
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def bench_scope_lookup(scope_count=5000):
+    rng = random.Random(0)
+    print(f"Scope lookup ({scope_count} scopes)")
+    print(f"  {'mapping':>8} {'depth':>6} {'linear ms':>10} {'trie ms':>10}")
+    for size in (len(convert_theme.SYNTAX_MAPPING), 500, 2000):
+        mapping = synthetic_mapping(size, rng)
+        index = build_scope_index(mapping)
+        for depth in (3, 8):
+            scopes = synthetic_scopes(scope_count, depth, rng, mapping)
+            for s in scopes[:1000]:
+                assert linear_lookup(s, mapping) == convert_theme.lookup_scope(s, index), s
+
+            linear = timed(lambda: [linear_lookup(s, mapping) for s in scopes])
+            trie = timed(lambda: [convert_theme.lookup_scope(s, index) for s in scopes])
+            print(f"  {len(mapping):>8} {depth:>6} {linear * 1000:>10.1f} {trie * 1000:>10.1f}")
+
+
+def import_profile(module):
+    # One fresh interpreter importing `module` under -X importtime.
+    # Returns {imported module: (depth, cumulative ms)}; depth 0 is the
+    # module itself, 1 its direct imports.
+    env = dict(os.environ)
+    # Measure with cached bytecode, as an installed checkout runs
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                         capture_output=True, text=True, check=True, env=env,
+                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    imported = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        if not total.strip().isdigit():
+            continue  # the header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imported[name.strip()] = (depth, int(total) / 1000)
+    return imported
+
+
+def bench_startup(runs):
+    # Median import time of each CLI against STARTUP_BUDGETS_MS, plus a
+    # check that LAZY_MODULES stay out of the startup path. Returns the
+    # problems found.
+    problems = []
+    print(f"Startup (median of {runs} imports, budgets in ms)")
+    print(f"  {'module':<16} {'ms':>8} {'budget':>8}  heaviest direct imports")
+    for module, budget in STARTUP_BUDGETS_MS.items():
+        import_profile(module)  # warm the bytecode cache
+        profiles = [import_profile(module) for _ in range(runs)]
+        median = statistics.median(p[module][1] for p in profiles)
+        imported = profiles[-1]
+        direct = sorted(((ms, name) for name, (depth, ms) in imported.items() if depth == 1), reverse=True)
+        heaviest = ", ".join(f"{name} {ms:.1f}" for ms, name in direct[:3])
+
+        flag = "" if median <= budget else "  OVER BUDGET"
+        print(f"  {module:<16} {median:>8.1f} {budget:>8}  {heaviest}{flag}")
+        if median > budget:
+            problems.append(f"{module} imports in {median:.1f} ms, budget {budget} ms")
+        eager = [name for name in LAZY_MODULES if name in imported]
+        if eager:
+            problems.append(f"{module} imports {', '.join(eager)} at startup")
+    for problem in problems:
+        print(f"  {problem}")
+    return problems
+
+
+def synthetic_theme(color_count, scope_count, depth, rng):
+    # A VS Code theme with every key the mappings read, padded with random
+    # keys, and token rules whose scopes nest up to `depth` segments.
+    def color():
+        return f"#{rng.randrange(1 << 32):08x}"
+
+    colors = {}
+    for zed_key, chain in UI_CHAINS:
+        for source in chain:
+            # ("key", vs_key), ("ref", zed_key), ("literal", value) or
+            # (op, fg, bg, amount) with ("key" | "ref", name) operands
+            operands = source[1:3] if source[0] in DERIVE_OPERATIONS else [source]
+            for kind, name in operands:
+                if kind == "key":
+                    colors[name] = color()
+    while len(colors) < color_count:
+        colors[f"synthetic{len(colors)}.background"] = color()
+
+    roots = list(convert_theme.SYNTAX_MAPPING) + ["meta", "source", "support", "invalid"]
+    token_colors = []
+    remaining = scope_count
+    while remaining > 0:
+        per_rule = min(remaining, rng.randint(1, 8))
+        scopes = []
+        for _ in range(per_rule):
+            parts = rng.choice(roots).split(".")
+            parts += [f"n{rng.randint(0, 20)}" for _ in range(rng.randint(0, max(0, depth - len(parts))))]
+            scopes.append(".".join(parts))
+        settings = {"foreground": color()}
+        if rng.random() < 0.2:
+            settings["fontStyle"] = rng.choice(["italic", "bold", "italic bold"])
+        token_colors.append({"scope": scopes, "settings": settings})
+        remaining -= per_rule
+
+    return {"name": "Synthetic", "type": "dark", "colors": colors, "tokenColors": token_colors}
+
+
+def best_of(repeat, fn, *args):
+    return min(timed(fn, *args) for _ in range(repeat))
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def bench_pipeline(color_count, scope_count, depth, repeat):
+    rng = random.Random(0)
+    vs_data = synthetic_theme(color_count, scope_count, depth, rng)
+    reference = expand_theme.load_json(expand_theme.DRACULA_PATH)
+    colors = vs_data["colors"]
+    token_colors = vs_data["tokenColors"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, "theme.json")
+        with open(source_path, 'w') as f:
+            json.dump(vs_data, f, indent=2)
+        size = os.path.getsize(source_path)
+
+        def expand():
+            expand_theme.expand(zed_theme, reference, vs_data)
+
+        # Keep the scripts' progress output out of the timings
+        with contextlib.redirect_stdout(io.StringIO()):
+            zed_theme = convert_theme.convert(vs_data)
+            style = zed_theme["themes"][0]["style"]
+            stages = {
+                "load_json": best_of(repeat, convert_theme.load_json, source_path),
+                "map_colors": best_of(repeat, convert_theme.map_colors, colors),
+                "convert_syntax": best_of(repeat, convert_theme.convert_syntax, token_colors),
+                "expand": best_of(repeat, expand),
+                "dump": best_of(repeat, lambda: json.dumps(style, indent=2)),
+            }
+
+    print(f"Pipeline ({len(colors)} colors, {scope_count} scopes, depth {depth}, {size // 1024} KB, best of {repeat})")
+    for name, seconds in stages.items():
+        print(f"  {name:<16} {seconds * 1000:>10.2f} ms")
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "params": {"colors": len(colors), "scopes": scope_count, "depth": depth,
+                   "repeat": repeat, "source_bytes": size},
+        "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in stages.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the theme conversion pipeline.")
+    parser.add_argument("--colors", type=int, default=2000, help="number of colors keys (default: 2000)")
+    parser.add_argument("--scopes", type=int, default=20000, help="number of tokenColors scopes (default: 20000)")
+    parser.add_argument("--depth", type=int, default=8, help="maximum scope depth in segments (default: 8)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per stage, the fastest is kept (default: 5)")
+    parser.add_argument("--output", default=OUTPUT_PATH, help=f"results file (default: {OUTPUT_PATH})")
+    parser.add_argument("--compare", action="store_true",
+                        help="compare old and new implementations instead of timing the pipeline")
+    parser.add_argument("--startup", action="store_true",
+                        help="check the CLIs' import time against their budgets; exits 1 when over")
+    args = parser.parse_args()
+
+    if args.startup:
+        if bench_startup(args.repeat):
+            sys.exit(1)
+        return
+
+    if args.compare:
+        bench_scope_lookup()
+        bench_jsonc()
+        return
+
+    result = bench_pipeline(args.colors, args.scopes, args.depth, args.repeat)
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
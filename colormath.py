@@ -0,0 +1,115 @@
+from functools import lru_cache
+
+# Color math for theme generation.
+#
+# Colors are (r, g, b, a) tuples of floats in 0..1. Themes repeat the same
+# few hex values across hundreds of keys, so parse() is memoized and the
+# batch helpers work on the deduplicated palette: each distinct value is
+# parsed and transformed once, however many keys share it.
+
+WHITE = (1.0, 1.0, 1.0, 1.0)
+BLACK = (0.0, 0.0, 0.0, 1.0)
+TRANSPARENT = (0.0, 0.0, 0.0, 0.0)
+
+
+@lru_cache(maxsize=4096)
+def parse(value):
+    # "#rgb", "#rgba", "#rrggbb" or "#rrggbbaa"; None if not a hex color
+    if not isinstance(value, str) or not value.startswith("#"):
+        return None
+    digits = value[1:]
+    if len(digits) in (3, 4):
+        digits = "".join(c * 2 for c in digits)
+    if len(digits) == 6:
+        digits += "ff"
+    if len(digits) != 8:
+        return None
+    try:
+        n = int(digits, 16)
+    except ValueError:
+        return None
+    return ((n >> 24) / 255, ((n >> 16) & 0xff) / 255, ((n >> 8) & 0xff) / 255, (n & 0xff) / 255)
+
+
+def to_hex(color):
+    # Drops the alpha byte when the color is opaque, like the source themes
+    r, g, b, a = (round(max(0.0, min(1.0, c)) * 255) for c in color)
+    if a == 255:
+        return f"#{r:02x}{g:02x}{b:02x}"
+    return f"#{r:02x}{g:02x}{b:02x}{a:02x}"
+
+
+def parse_palette(colors):
+    # key -> color for every parseable value of a theme's colors dict
+    parsed = {}
+    for value in set(colors.values()):
+        color = parse(value)
+        if color is not None:
+            parsed[value] = color
+    return {key: parsed[value] for key, value in colors.items() if value in parsed}
+
+
+def mix(a, b, t):
+    # Linear interpolation from a (t=0) to b (t=1), alpha included
+    return tuple(x + (y - x) * t for x, y in zip(a, b))
+
+
+def lighten(color, t):
+    return mix(color, WHITE[:3] + color[3:], t)
+
+
+def darken(color, t):
+    return mix(color, BLACK[:3] + color[3:], t)
+
+
+def with_alpha(color, alpha):
+    return color[:3] + (alpha,)
+
+
+def alpha_over(fg, bg):
+    # Source-over compositing of fg onto bg
+    fa, ba = fg[3], bg[3]
+    a = fa + ba * (1 - fa)
+    if a == 0:
+        return TRANSPARENT
+    rgb = tuple((f * fa + b * ba * (1 - fa)) / a for f, b in zip(fg[:3], bg[:3]))
+    return rgb + (a,)
+
+
+def tint(bg, fg, t):
+    # bg with fg laid over it at opacity t, e.g. a faint status background
+    return alpha_over(with_alpha(fg, fg[3] * t), bg)
+
+
+def _channel(c):
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def luminance(color):
+    # WCAG relative luminance of the opaque color
+    r, g, b = (_channel(c) for c in color[:3])
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast(fg, bg):
+    # WCAG contrast ratio, with fg composited onto bg first
+    la = luminance(alpha_over(fg, bg))
+    lb = luminance(bg)
+    if la < lb:
+        la, lb = lb, la
+    return (la + 0.05) / (lb + 0.05)
+
+
+def map_palette(fn, colors):
+    # Applies fn to each distinct color once. colors: key -> color
+    done = {}
+    for color in set(colors.values()):
+        done[color] = fn(color)
+    return {key: done[color] for key, color in colors.items()}
+
+
+def contrast_many(pairs):
+    # pairs: iterable of (fg, bg) colors; repeated pairs are computed once
+    pairs = list(pairs)
+    ratios = {pair: contrast(*pair) for pair in set(pairs)}
+    return [ratios[pair] for pair in pairs]
@@ -1,92 +1,31 @@
 
+import argparse
+import hashlib
 import json
 import os
 import re
+import sys
+import time
+from collections import deque
+from functools import lru_cache
 
-# Extensive Mapping based on dracula.example.json and common VSCode keys
-# Extensive Mapping based on dracula.example.json and common VSCode keys
-COLOR_MAPPING = {
-    # Core Backgrounds
-    "background": "editor.background",
-    "editor.background": "editor.background",
-    "editor.foreground": "editor.foreground",
-    "elevated_surface.background": "editorWidget.background",
-    "surface.background": "sideBar.background",
-    "panel.background": "sideBar.background",
-    "terminal.background": "terminal.background",
-    
-    # UI Elements
-    "element.background": "input.background", # Better for inputs/lists
-    "element.hover": "list.hoverBackground",
-    "element.active": "list.activeSelectionBackground",
-    "element.selected": "list.activeSelectionBackground",
-    
-    # Borders
-    "border": "focusBorder",
-    "border.variant": "sideBar.border",
-    "border.focused": "focusBorder",
-    "border.selected": "focusBorder",
-    "border.disabled": "disabledForeground",
-    
-    # Text
-    "text": "editor.foreground",
-    "text.muted": "descriptionForeground",
-    "text.placeholder": "input.placeholderForeground",
-    "text.disabled": "disabledForeground",
-    "text.accent": "textLink.foreground",
-    
-    # Icons
-    "icon": "icon.foreground",
-    "icon.muted": "foreground", # Fallback
-    "icon.accent": "activityBarBadge.background",
-    
-    # Bars
-    "status_bar.background": "statusBar.background",
-    "title_bar.background": "titleBar.activeBackground",
-    "title_bar.inactive_background": "titleBar.inactiveBackground",
-    "tab_bar.background": "editorGroupHeader.tabsBackground",
-    "toolbar.background": "breadcrumb.background",
-    
-    # Tabs
-    "tab.active_background": "tab.activeBackground",
-    "tab.inactive_background": "tab.inactiveBackground",
-    
-    # Editor
-    "editor.active_line.background": "editor.lineHighlightBackground",
-    "editor.highlighted_line.background": "editor.lineHighlightBackground",
-    "editor.line_number": "editorLineNumber.foreground",
-    "editor.active_line_number": "editorLineNumber.activeForeground",
-    "editor.invisible": "editorWhitespace.foreground",
-    "editor.wrap_guide": "editorIndentGuide.background",
-    "editor.active_wrap_guide": "editorIndentGuide.activeBackground",
-    "editor.indent_guide": "editorIndentGuide.background",
-    "editor.indent_guide_active": "editorIndentGuide.activeBackground",
-    
-    # Search & Highlights
-    "search.match_background": "editor.findMatchBackground",
-    "editor.document_highlight.read_background": "editor.selectionBackground",
-    "editor.document_highlight.write_background": "editor.selectionBackground",
-    "editor.document_highlight.bracket_background": "editorBracketMatch.background",
-    
-    # Git
-    "conflict": "gitDecoration.conflictingResourceForeground",
-    "created": "gitDecoration.addedResourceForeground",
-    "deleted": "gitDecoration.deletedResourceForeground",
-    "modified": "gitDecoration.modifiedResourceForeground",
-    "ignored": "gitDecoration.ignoredResourceForeground",
-    "renamed": "gitDecoration.renamedResourceForeground",
-    
-    # Diagnostics
-    "error": "editorError.foreground",
-    "warning": "editorWarning.foreground",
-    "info": "editorInfo.foreground",
-    "hint": "editorHint.foreground",
-    
-    # Scrollbar
-    "scrollbar.thumb.background": "scrollbarSlider.background",
-    "scrollbar.thumb.hover_background": "scrollbarSlider.hoverBackground",
-    "scrollbar.track.background": "editor.background", # Often transparent in VSCode
-}
+import colormath
+from instrument import Profile, write_report
+from jsonc import load as load_json, loads as parse_json
+from expand_theme import DRACULA_PATH, expand
+from mapping import MAPPING, SYNTAX_MAPPING, UI_CHAINS, resolve
+from validate_theme import lint, validate
+
+# audit_theme, quantize and concurrent.futures (which pulls in
+# multiprocessing) are imported where they are used: a plain conversion
+# needs none of them, and bench.py --startup holds the import time of this
+# module to a budget.
+
+# Shared disabled profile for callers that do not collect stats
+NO_PROFILE = Profile()
+
+# VS Code -> Zed color and syntax tables live in mapping.jsonc, shared with
+# expand_theme.py and reverse_theme.py; see mapping.py.
 
 # Values that might need transparency or specific fallbacks
 DEFAULT_COLORS = {
@@ -95,107 +34,240 @@ DEFAULT_COLORS = {
     "editor.foreground": "#d4d4d4",
 }
 
-# Syntax Mapping (VSCode Scope -> Zed Key)
-# Zed keys based on local schema (dracula.example.json)
-SYNTAX_MAPPING = {
-    "comment": "comment",
-    "string": "string",
-    "string.regexp": "string.regex",
-    "string.escape": "string.escape",
-    
-    "constant": "constant",
-    "constant.numeric": "number",
-    "constant.language": "boolean", # True/False/Null
-    "constant.character.escape": "string.escape",
-    "constant.charcter.escape": "string.escape", # Typo in some themes
-    
-    "keyword": "keyword",
-    "keyword.control": "keyword",
-    "keyword.operator": "operator",
-    "storage": "keyword",
-    "storage.type": "keyword",
-    "storage.modifier": "keyword",
-    
-    "entity.name.type": "type",
-    "entity.name.class": "type",
-    "entity.name.function": "function",
-    "entity.name.function.constructor": "constructor", # Specific Zed key for constructors
-    
-    "entity.name.section": "type",
-    "entity.name.namespace": "type",
-    
-    # Prioritize specific tag name over generic tag
-    "entity.name.tag": "tag",
-    
-    "entity.other.attribute-name": "attribute",
-    
-    "variable": ["variable", "property"],
-    "variable.parameter": ["variable.parameter", "parameter"],
-    "entity.name.variable.parameter": "variable.parameter",
-    "variable.argument": ["variable.parameter", "parameter"], # VSCode often uses this for parameters
-    
-    "variable.language": "variable.special", # "this", "super", etc.
-    "variable.other": "variable",
-    "variable.other.property": "property",
-    "support.type.property-name": "property",
-    
-    "punctuation": "punctuation",
-    "punctuation.definition.tag": "punctuation",
-    "punctuation.definition.string": "punctuation",
-    "punctuation.separator.key-value": "punctuation",
-    "punctuation.section": "punctuation.bracket", # Brackets/Braces
-    "punctuation.terminator": "punctuation.delimiter", # Semicolons
-    
-    # Removing "meta.tag" to avoid overwriting specific tag colors
-    "meta.function-call": "function",
-    
-    # Generic entity.name is often used for functions if entity.name.function is missing
-    "entity.name": "function",
-    
-    "markup.bold": "emphasis.strong",
-    "markup.italic": "emphasis",
+# Neovim highlight groups. UI groups read VS Code colors (a list is tried in
+# order); "syntax.<key>" reads the converted Zed syntax entry, including its
+# italic/bold style. Colors with alpha are composited onto editor.background
+# because nvim_set_hl only takes opaque colors.
+NEOVIM_GROUPS = {
+    # Core editor elements
+    "Normal": {"fg": "editor.foreground", "bg": "editor.background"},
+    "NormalFloat": {"fg": ["editorWidget.foreground", "editor.foreground"], "bg": "editorWidget.background"},
+    "NormalNC": {"fg": "editor.foreground", "bg": "editor.background"},
+    "EndOfBuffer": {"fg": "editor.background"},
+    "Cursor": {"fg": "editor.background", "bg": "editorCursor.foreground"},
+    "CursorLine": {"bg": "editor.lineHighlightBackground"},
+    "CursorColumn": {"bg": "editor.lineHighlightBackground"},
+    "ColorColumn": {"bg": "editor.lineHighlightBackground"},
+    "SignColumn": {"bg": ["editorGutter.background", "editor.background"]},
+    "LineNr": {"fg": "editorLineNumber.foreground"},
+    "CursorLineNr": {"fg": "editorLineNumber.activeForeground"},
+    "WinSeparator": {"fg": ["editorGroup.border", "panel.border", "editorIndentGuide.background"]},
+    "VertSplit": {"fg": ["editorGroup.border", "panel.border", "editorIndentGuide.background"]},
+    "Folded": {"fg": "descriptionForeground", "bg": ["editor.foldBackground", "editorWidget.background"]},
+    "FoldColumn": {"fg": "editorLineNumber.foreground", "bg": ["editorGutter.background", "editor.background"]},
+    "NonText": {"fg": "editorWhitespace.foreground"},
+    "Whitespace": {"fg": "editorWhitespace.foreground"},
+    "Directory": {"fg": ["textLink.foreground", "foreground"]},
+    "Title": {"fg": ["textLink.foreground", "foreground"], "bold": True},
+
+    # Status line and tabs
+    "StatusLine": {"fg": "statusBar.foreground", "bg": "statusBar.background"},
+    "StatusLineNC": {"fg": ["titleBar.inactiveForeground", "statusBar.foreground"], "bg": "statusBar.background"},
+    "TabLine": {"fg": "tab.inactiveForeground", "bg": "tab.inactiveBackground"},
+    "TabLineSel": {"fg": "tab.activeForeground", "bg": "tab.activeBackground"},
+    "TabLineFill": {"bg": ["editorGroupHeader.tabsBackground", "editor.background"]},
+    "WinBar": {"fg": ["breadcrumb.foreground", "foreground"], "bg": ["breadcrumb.background", "editor.background"]},
+    "WinBarNC": {"fg": ["breadcrumb.foreground", "foreground"], "bg": ["breadcrumb.background", "editor.background"]},
+
+    # Popups and menus
+    "Pmenu": {"fg": "editorSuggestWidget.foreground", "bg": "editorSuggestWidget.background"},
+    "PmenuSel": {"fg": ["editorSuggestWidget.selectedForeground", "editor.foreground"],
+                 "bg": ["editorSuggestWidget.selectedBackground", "list.activeSelectionBackground"]},
+    "PmenuSbar": {"bg": "editorSuggestWidget.background"},
+    "PmenuThumb": {"bg": ["scrollbarSlider.activeBackground", "scrollbarSlider.background"]},
+    "FloatBorder": {"fg": ["editorWidget.border", "focusBorder"], "bg": "editorWidget.background"},
+    "FloatTitle": {"fg": "editor.foreground", "bg": "editorWidget.background", "bold": True},
+
+    # Search and selection
+    "Visual": {"bg": "editor.selectionBackground"},
+    "Search": {"bg": ["editor.findMatchHighlightBackground", "editor.selectionBackground"]},
+    "CurSearch": {"bg": ["editor.findMatchBackground", "editor.selectionBackground"]},
+    "IncSearch": {"bg": ["editor.findMatchBackground", "editor.selectionBackground"]},
+    "MatchParen": {"bg": ["editorBracketMatch.background", "editor.selectionBackground"], "bold": True},
+
+    # Diagnostics
+    "Error": {"fg": ["errorForeground", "editorError.foreground"]},
+    "ErrorMsg": {"fg": ["errorForeground", "editorError.foreground"]},
+    "WarningMsg": {"fg": "editorWarning.foreground"},
+    "DiagnosticError": {"fg": "editorError.foreground"},
+    "DiagnosticWarn": {"fg": "editorWarning.foreground"},
+    "DiagnosticInfo": {"fg": "editorInfo.foreground"},
+    "DiagnosticHint": {"fg": "editorHint.foreground"},
+    "DiagnosticUnderlineError": {"sp": "editorError.foreground", "undercurl": True},
+    "DiagnosticUnderlineWarn": {"sp": "editorWarning.foreground", "undercurl": True},
+    "DiagnosticUnderlineInfo": {"sp": "editorInfo.foreground", "undercurl": True},
+    "DiagnosticUnderlineHint": {"sp": "editorHint.foreground", "undercurl": True},
+    "LspInlayHint": {"fg": "editorInlayHint.foreground", "bg": "editorInlayHint.background"},
+    "LspCodeLens": {"fg": "editorCodeLens.foreground"},
+    "LspReferenceText": {"bg": "editor.selectionBackground"},
+    "LspReferenceRead": {"bg": "editor.selectionBackground"},
+    "LspReferenceWrite": {"bg": "editor.selectionBackground", "bold": True},
+
+    # Diffs and git signs
+    "DiffAdd": {"bg": "diffEditor.insertedTextBackground"},
+    "DiffDelete": {"bg": "diffEditor.removedTextBackground"},
+    "DiffChange": {"bg": "editor.lineHighlightBackground"},
+    "DiffText": {"bg": "editor.selectionBackground"},
+    "Added": {"fg": ["editorGutter.addedBackground", "gitDecoration.addedResourceForeground"]},
+    "Changed": {"fg": ["editorGutter.modifiedBackground", "gitDecoration.modifiedResourceForeground"]},
+    "Removed": {"fg": ["editorGutter.deletedBackground", "gitDecoration.deletedResourceForeground"]},
+
+    # Syntax highlighting
+    "Comment": {"fg": "syntax.comment"},
+    "Constant": {"fg": "syntax.constant"},
+    "String": {"fg": "syntax.string"},
+    "Character": {"fg": "syntax.string"},
+    "Number": {"fg": "syntax.number"},
+    "Float": {"fg": "syntax.number"},
+    "Boolean": {"fg": "syntax.boolean"},
+    "Identifier": {"fg": "syntax.variable"},
+    "Function": {"fg": "syntax.function"},
+    "Statement": {"fg": "syntax.keyword"},
+    "Keyword": {"fg": "syntax.keyword"},
+    "Conditional": {"fg": "syntax.keyword"},
+    "Repeat": {"fg": "syntax.keyword"},
+    "Label": {"fg": "syntax.keyword"},
+    "Exception": {"fg": "syntax.keyword"},
+    "Operator": {"fg": "syntax.operator"},
+    "PreProc": {"fg": "syntax.keyword"},
+    "Type": {"fg": "syntax.type"},
+    "StorageClass": {"fg": "syntax.keyword"},
+    "Structure": {"fg": "syntax.type"},
+    "Typedef": {"fg": "syntax.type"},
+    "Special": {"fg": "syntax.string.escape"},
+    "SpecialChar": {"fg": "syntax.string.escape"},
+    "Tag": {"fg": "syntax.tag"},
+    "Delimiter": {"fg": "syntax.punctuation"},
+    "Underlined": {"fg": ["textLink.foreground", "foreground"], "underline": True},
+    "Todo": {"fg": "editorWarning.foreground", "bold": True},
+
+    # Tree-sitter captures
+    "@comment": {"fg": "syntax.comment"},
+    "@string": {"fg": "syntax.string"},
+    "@string.regexp": {"fg": "syntax.string.regex"},
+    "@string.escape": {"fg": "syntax.string.escape"},
+    "@number": {"fg": "syntax.number"},
+    "@boolean": {"fg": "syntax.boolean"},
+    "@constant": {"fg": "syntax.constant"},
+    "@constant.builtin": {"fg": "syntax.boolean"},
+    "@function": {"fg": "syntax.function"},
+    "@function.call": {"fg": "syntax.function"},
+    "@function.method": {"fg": "syntax.function"},
+    "@constructor": {"fg": "syntax.constructor"},
+    "@keyword": {"fg": "syntax.keyword"},
+    "@operator": {"fg": "syntax.operator"},
+    "@type": {"fg": "syntax.type"},
+    "@variable": {"fg": "syntax.variable"},
+    "@variable.builtin": {"fg": "syntax.variable.special"},
+    "@variable.parameter": {"fg": "syntax.variable.parameter"},
+    "@variable.member": {"fg": "syntax.property"},
+    "@property": {"fg": "syntax.property"},
+    "@attribute": {"fg": "syntax.attribute"},
+    "@tag": {"fg": "syntax.tag"},
+    "@tag.attribute": {"fg": "syntax.attribute"},
+    "@punctuation": {"fg": "syntax.punctuation"},
+    "@punctuation.bracket": {"fg": "syntax.punctuation.bracket"},
+    "@punctuation.delimiter": {"fg": "syntax.punctuation.delimiter"},
+    "@markup.strong": {"fg": "syntax.emphasis.strong"},
+    "@markup.italic": {"fg": "syntax.emphasis"},
 }
 
-ANSI_MAPPING = {
-    "terminal.ansiBlack": "terminal.ansi.black",
-    "terminal.ansiRed": "terminal.ansi.red",
-    "terminal.ansiGreen": "terminal.ansi.green",
-    "terminal.ansiYellow": "terminal.ansi.yellow",
-    "terminal.ansiBlue": "terminal.ansi.blue",
-    "terminal.ansiMagenta": "terminal.ansi.magenta",
-    "terminal.ansiCyan": "terminal.ansi.cyan",
-    "terminal.ansiWhite": "terminal.ansi.white",
-    "terminal.ansiBrightBlack": "terminal.ansi.bright_black",
-    "terminal.ansiBrightRed": "terminal.ansi.bright_red",
-    "terminal.ansiBrightGreen": "terminal.ansi.bright_green",
-    "terminal.ansiBrightYellow": "terminal.ansi.bright_yellow",
-    "terminal.ansiBrightBlue": "terminal.ansi.bright_blue",
-    "terminal.ansiBrightMagenta": "terminal.ansi.bright_magenta",
-    "terminal.ansiBrightCyan": "terminal.ansi.bright_cyan",
-    "terminal.ansiBrightWhite": "terminal.ansi.bright_white",
+# Groups that just follow another group
+NEOVIM_LINKS = {
+    "TermCursor": "Cursor",
+    "Question": "Title",
+    "WildMenu": "PmenuSel",
+    "SpecialComment": "Comment",
+    "Macro": "Function",
+    "Debug": "Special",
+    "@module": "Type",
+    "@label": "Label",
+    "TelescopeNormal": "NormalFloat",
+    "TelescopeBorder": "FloatBorder",
+    "TelescopeMatching": "Search",
+    "NvimTreeNormal": "Normal",
+    "GitSignsAdd": "Added",
+    "GitSignsChange": "Changed",
+    "GitSignsDelete": "Removed",
 }
 
-def remove_comments(json_str):
-    # Matches strings (including escaped quotes) OR comments
-    pattern = r'("(?:\\.|[^"\\])*")|//.*'
-    def replace(match):
-        # If it matched a string (group 1), keep it. Otherwise it's a comment, remove it.
-        return match.group(1) or ""
-    return re.sub(pattern, replace, json_str)
-
-def load_json(path):
-    with open(path, 'r') as f:
-        content = f.read()
-        try:
-            # First try strict load (fast path for valid JSON like package.json)
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # Fallback for JSONC (comments, trailing commas)
-            # Remove comments
-            content = remove_comments(content)
-            # Remove trailing commas (simple approach)
-            content = re.sub(r',(\s*?[}\]])', r'\1', content)
-            return json.loads(content)
+# vim.g.terminal_color_0 .. 15, in ANSI order
+NEOVIM_TERMINAL_COLORS = [
+    "terminal.ansiBlack", "terminal.ansiRed", "terminal.ansiGreen", "terminal.ansiYellow",
+    "terminal.ansiBlue", "terminal.ansiMagenta", "terminal.ansiCyan", "terminal.ansiWhite",
+    "terminal.ansiBrightBlack", "terminal.ansiBrightRed", "terminal.ansiBrightGreen", "terminal.ansiBrightYellow",
+    "terminal.ansiBrightBlue", "terminal.ansiBrightMagenta", "terminal.ansiBrightCyan", "terminal.ansiBrightWhite",
+]
+
+# Bump when the conversion logic changes in a way the mapping tables do not
+# capture, so cached outputs are regenerated.
+CONVERTER_VERSION = "7"
+
+# Incremental build manifest: theme label -> input key and output hash
+CACHE_PATH = ".theme-cache.json"
+
+# Hand-tuned values per theme label, applied on top of the generated themes
+OVERRIDES_PATH = "overrides.jsonc"
+
+def sha256(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+MAPPING_HASH = sha256(json.dumps([MAPPING["hash"], NEOVIM_GROUPS, NEOVIM_LINKS, NEOVIM_TERMINAL_COLORS],
+                                 sort_keys=True))
+
+SCOPE_INDEX = MAPPING["scope_index"]
+
+def lookup_scope(scope, index=SCOPE_INDEX):
+    # Equivalent to picking the longest key k with scope == k or
+    # scope.startswith(k + "."), but costs O(depth of scope) instead of
+    # O(len(SYNTAX_MAPPING)).
+    best = None
+    node = index
+    for part in scope.split("."):
+        node = node.get(part)
+        if node is None:
+            break
+        if None in node:
+            best = node[None]
+    return best
+
+PREFIX_INDEX = MAPPING["prefix_index"]
+
+def scope_matches(selector_scope, scope):
+    return scope == selector_scope or scope.startswith(selector_scope + ".")
+
+@lru_cache(maxsize=None)
+def compile_selector(selector):
+    # "source.js meta.tag, string - string.regexp" -> groups of
+    # (path, exclusions). path is the descendant chain, innermost scope last.
+    # Exclusions are kept when they are a single scope; ones with ancestors
+    # only apply inside that context, which a flat Zed theme does not have.
+    groups = []
+    for part in selector.split(","):
+        include, *excludes = re.split(r"\s+-\s*|^\s*-\s*", part)
+        path = tuple(p for p in include.split() if p != ">")
+        if not path:
+            continue
+        exclusions = tuple(e.split()[0] for e in excludes if len(e.split()) == 1)
+        groups.append((path, exclusions))
+    return tuple(groups)
+
+@lru_cache(maxsize=None)
+def scope_candidates(scope):
+    # Zed keys a selector's innermost scope applies to, as
+    # (Zed key, scope that exclusions are tested against, covers). covers is
+    # True when the selector is the mapping key or a prefix of it, as in
+    # TextMate; False when it is more specific than its mapping key (e.g.
+    # "entity.name.function.member"), which only applies to part of it.
+    candidates = [(zed_key, vs_scope, True) for zed_key, vs_scope in PREFIX_INDEX.get(scope, [])]
+    if scope not in SYNTAX_MAPPING:
+        zed_val = lookup_scope(scope)
+        if zed_val:
+            for zed_key in zed_val if isinstance(zed_val, list) else [zed_val]:
+                candidates.append((zed_key, scope, False))
+    return tuple(candidates)
 
 def get_color(colors, key, fallback=None):
     val = colors.get(key)
@@ -203,13 +275,26 @@ def get_color(colors, key, fallback=None):
         return val
     return fallback
 
-def convert_syntax(token_colors):
-    syntax = {}
+def map_colors(colors, stats=NO_PROFILE):
+    # Every Zed UI key whose fallback chain resolves, in mapping.jsonc order
+    resolved = resolve(colors)
+    style = {zed_key: resolved[zed_key][0] for zed_key, chain in UI_CHAINS if zed_key in resolved}
     
-    # Sort token colors by specificy (naively, just process order)
-    # Zed syntax is a flat dict of key -> {color, font_style}
+    stats.count("keys_mapped", len(style))
+    stats.count("keys_unmapped", len(UI_CHAINS) - len(style))
+    return style
+
+def convert_syntax(token_colors, stats=NO_PROFILE, debug=False):
+    # Zed syntax is a flat dict of key -> {color, font_style, font_weight}.
+    # Each key is resolved the way TextMate resolves a token: among the rules
+    # whose selectors apply to it, the most specific wins, separately for the
+    # color and the font style. Ranks compare, in order: no ancestor context,
+    # covering the whole key, depth of the matched scope, then file order.
+    best = {}
+    seen = 0
+    matched = 0
     
-    for token in token_colors:
+    for index, token in enumerate(token_colors):
         scope = token.get("scope")
         settings = token.get("settings", {})
         foreground = settings.get("foreground")
@@ -225,132 +310,731 @@ def convert_syntax(token_colors):
         else:
             continue
             
-        for s in scopes:
-            # Find best match in SYNTAX_MAPPING
-            best_match_val = None
-            best_match_len = 0
+        for selector in scopes:
+            for path, exclusions in compile_selector(selector):
+                seen += 1
+                innermost = path[-1]
+                depth = innermost.count(".") + 1
+                hit = False
+                for zed_key, target, covers in scope_candidates(innermost):
+                    if exclusions and any(scope_matches(x, target) for x in exclusions):
+                        continue
+                    hit = True
+                    rank = (len(path) == 1, covers, depth, index)
+                    slot = best.setdefault(zed_key, {})
+                    if foreground and ("color" not in slot or rank > slot["color"][0]):
+                        slot["color"] = (rank, foreground, innermost)
+                    if font_style and ("font" not in slot or rank > slot["font"][0]):
+                        slot["font"] = (rank, font_style, innermost)
+                matched += hit
+    
+    syntax = {}
+    for zed_key, slot in best.items():
+        entry = {}
+        if "color" in slot:
+            entry["color"] = slot["color"][1]
+        if "font" in slot:
+            font_style = slot["font"][1]
+            entry["font_style"] = "italic" if "italic" in font_style else None
+            if "bold" in font_style:
+                entry["font_weight"] = 700
+        syntax[zed_key] = entry
+        # Debug print
+        if debug and zed_key == "property":
+            source = slot.get("color", slot.get("font"))[2]
+            print(f"DEBUG: Mapped {source} to property with color {entry.get('color')}")
+
+    stats.count("scopes_seen", seen)
+    stats.count("scopes_matched", matched)
+    return syntax
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CONVERTER_VERSION:
+        return {}
+    return cache.get("themes", {})
+
+def save_cache(entries, path=CACHE_PATH):
+    with open(path, 'w') as f:
+        json.dump({"version": CONVERTER_VERSION, "themes": entries}, f, indent=2, sort_keys=True)
+
+def file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return sha256(f.read())
+    except OSError:
+        return None
+
+def write_if_changed(path, content):
+    # Leaves the file (and its mtime) alone when the bytes are identical
+    data = content.encode("utf-8")
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def convert(vs_theme, label=None, author="Unknown", appearance="dark", stats=NO_PROFILE, debug=False):
+    # In-memory conversion: a VS Code theme (dict, JSON/JSONC str or bytes)
+    # to a Zed theme family dict. Touches neither the cwd nor the disk.
+    if not isinstance(vs_theme, dict):
+        vs_theme = parse_json(vs_theme)
+    if label is None:
+        label = vs_theme.get("name", "Untitled")
+    colors = vs_theme.get("colors", {})
+    token_colors = vs_theme.get("tokenColors", [])
+    
+    # Build Style
+    with stats.stage("color_map"):
+        style = map_colors(colors, stats)
+    
+    # Map Syntax
+    with stats.stage("syntax_map"):
+        style["syntax"] = convert_syntax(token_colors, stats, debug)
+    
+    # Players (Cursors)
+    # Use accent color or default
+    cursor_color = colors.get("editorCursor.foreground", "#FFFFFF")
+    selection_color = colors.get("editor.selectionBackground", "#FFFFFF44")
+    
+    style["players"] = [
+        {
+            "cursor": cursor_color,
+            "background": cursor_color,
+            "selection": selection_color
+        }
+    ]
+    
+    # Add implicit Accents if missing
+    style["accents"] = [colors.get("activityBarBadge.background", "#FF0000")]
+    
+    # Construct Final Object
+    return {
+        "$schema": "https://zed.dev/schema/themes/v0.2.0.json",
+        "name": label,
+        "author": author,
+        "themes": [
+            {
+                "name": label,
+                "appearance": appearance,
+                "style": style
+            }
+        ]
+    }
+
+def dumps(zed_theme, compact=False):
+    # compact drops all insignificant whitespace, for files bundled into
+    # the extension package
+    if compact:
+        return json.dumps(zed_theme, separators=(",", ":"))
+    return json.dumps(zed_theme, indent=2)
+
+def output_name(label):
+    # Normalize filename
+    return f"{label}.json".replace(" ", "_")
+
+def neovim_name(label):
+    # Colorscheme name, as in neovim/Blank-Moonlight.lua
+    return label.replace(" ", "-")
+
+# First line of every colorscheme to_neovim writes. A colorscheme without
+# it was written by hand, so --neovim leaves it alone instead of
+# overwriting it; the hand-tuned groups of the bundled themes live in
+# overrides.jsonc instead.
+NEOVIM_MARK = "generated by convert_theme.py"
+
+def is_generated(path):
+    # True unless path exists without the to_neovim header
+    try:
+        with open(path, 'r', encoding="utf-8") as f:
+            return NEOVIM_MARK in f.readline()
+    except FileNotFoundError:
+        return True
+    except (OSError, UnicodeDecodeError):
+        return False
+
+def lua_key(name):
+    if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+        return name
+    return f"[{lua_string(name)}]"
+
+def lua_string(value):
+    return json.dumps(value, ensure_ascii=False)
+
+def lua_value(value):
+    if value is True:
+        return "true"
+    if isinstance(value, int):
+        return str(value)
+    return lua_string(value)
+
+def neovim_groups(vs_theme, zed_theme, overrides=None):
+    from quantize import quantize
+    # Resolves NEOVIM_GROUPS to group name -> nvim_set_hl spec. overrides is
+    # a theme's "neovim" entry in overrides.jsonc: its "groups" replace the
+    # generated group of the same name (or are added after them), with
+    # colors given as hex or as a name in its "palette".
+    overrides = overrides or {}
+    colors = vs_theme.get("colors", {})
+    syntax = zed_theme["themes"][0]["style"].get("syntax", {})
+    palette = colormath.parse_palette(colors)
+    base = colormath.alpha_over(palette.get("editor.background", colormath.BLACK), colormath.BLACK)
+    names = overrides.get("palette", {})
+    
+    def opaque(color):
+        # Hex of a visible color composited onto the background, else None
+        if color is not None and color[3] > 0:
+            return colormath.to_hex(colormath.alpha_over(color, base))
+        return None
+    
+    def resolve_color(keys):
+        # First visible color among keys, made opaque, and its syntax entry
+        for key in [keys] if isinstance(keys, str) else keys:
+            entry = None
+            if key.startswith("syntax."):
+                entry = syntax.get(key[len("syntax."):]) or {}
+                color = colormath.parse(entry.get("color"))
+            else:
+                color = palette.get(key)
+            if opaque(color):
+                return opaque(color), entry
+        return None, None
+    
+    def finish(hl, spec):
+        # 256-color fallbacks for terminals without termguicolors
+        for attr in ("fg", "bg"):
+            if attr in hl:
+                hl[f"cterm{attr}"] = quantize(hl[attr])[0]
+        for flag in ("bold", "italic", "underline", "undercurl"):
+            if spec.get(flag):
+                hl[flag] = True
+        return hl
+    
+    groups = {}
+    for name, spec in NEOVIM_GROUPS.items():
+        hl = {}
+        for attr in ("fg", "bg", "sp"):
+            if attr in spec:
+                value, entry = resolve_color(spec[attr])
+                if value:
+                    hl[attr] = value
+                if entry and attr == "fg":
+                    if entry.get("font_style") == "italic":
+                        hl["italic"] = True
+                    if (entry.get("font_weight") or 0) >= 700:
+                        hl["bold"] = True
+        if hl:
+            groups[name] = finish(hl, spec)
+    for name, target in NEOVIM_LINKS.items():
+        groups[name] = {"link": target}
+    for name, spec in overrides.get("groups", {}).items():
+        if "link" in spec:
+            groups[name] = {"link": spec["link"]}
+            continue
+        hl = {}
+        for attr in ("fg", "bg", "sp"):
+            value = opaque(colormath.parse(names.get(spec.get(attr), spec.get(attr))))
+            if value:
+                hl[attr] = value
+        groups[name] = finish(hl, spec)
+    return groups
+
+def to_neovim(vs_theme, zed_theme, source=None, compact=False, overrides=None):
+    # Lua colorscheme that applies every group from one precomputed table
+    # with nvim_set_hl, instead of one :highlight command per group. With
+    # compact, each distinct color is written once to a palette table `c`
+    # (most used first) and groups refer to it by index. overrides is the
+    # theme's "neovim" entry in overrides.jsonc; its "terminal" list replaces
+    # the 16 terminal colors.
+    label = zed_theme["name"]
+    overrides = overrides or {}
+    groups = neovim_groups(vs_theme, zed_theme, overrides)
+    colors = vs_theme.get("colors", {})
+    names = overrides.get("palette", {})
+    if "terminal" in overrides:
+        terminal = [(i, colormath.parse(names.get(value, value))) for i, value in enumerate(overrides["terminal"])]
+    else:
+        terminal = [(i, colormath.parse(colors.get(key))) for i, key in enumerate(NEOVIM_TERMINAL_COLORS)]
+    terminal = [(i, colormath.to_hex(color[:3] + (1.0,))) for i, color in terminal if color is not None]
+    
+    palette = []
+    if compact:
+        uses = {}
+        for hl in groups.values():
+            for attr in ("fg", "bg", "sp"):
+                if attr in hl:
+                    uses[hl[attr]] = uses.get(hl[attr], 0) + 1
+        for i, value in terminal:
+            uses[value] = uses.get(value, 0) + 1
+        palette = sorted(uses, key=lambda value: -uses[value])
+    index = {value: i + 1 for i, value in enumerate(palette)}
+    
+    def color_value(value):
+        return f"c[{index[value]}]" if index else lua_string(value)
+    
+    origin = f" from {source}" if source else ""
+    lines = [
+        f"-- {neovim_name(label)}.lua - {NEOVIM_MARK}{origin}.",
+        "-- Do not edit by hand; rerun convert_theme.py --neovim instead.",
+        'vim.cmd("highlight clear")',
+        'if vim.fn.exists("syntax_on") == 1 then',
+        '  vim.cmd("syntax reset")',
+        "end",
+    ]
+    # Before colors_name: setting 'background' reloads the colorscheme
+    # that colors_name names
+    if zed_theme["themes"][0].get("appearance") == "light":
+        lines.append('vim.o.background = "light"')
+    lines += [f"vim.g.colors_name = {lua_string(neovim_name(label))}", ""]
+    if palette:
+        lines.append("local c = {")
+        lines += [f"  {lua_string(value)}," for value in palette]
+        lines += ["}", ""]
+    lines.append("local groups = {")
+    for name, hl in groups.items():
+        fields = ", ".join(f"{attr} = {color_value(value) if attr in ('fg', 'bg', 'sp') else lua_value(value)}"
+                           for attr, value in hl.items())
+        lines.append(f"  {lua_key(name)} = {{ {fields} }},")
+    lines += [
+        "}",
+        "",
+        "local set_hl = vim.api.nvim_set_hl",
+        "for name, spec in pairs(groups) do",
+        "  set_hl(0, name, spec)",
+        "end",
+    ]
+    
+    if terminal:
+        lines.append("")
+        for i, value in terminal:
+            lines.append(f"vim.g.terminal_color_{i} = {color_value(value)}")
+    
+    return "\n".join(lines) + "\n"
+
+def to_cterm(zed_theme, compact=False):
+    from quantize import quantize_style
+    # Zed has no 256-color settings, so the xterm-256 and ANSI-16 fallbacks
+    # for every color (terminal.ansi.* included) go to a sidecar file.
+    theme = zed_theme["themes"][0]
+    return dumps({"name": zed_theme["name"], "colors": quantize_style(theme["style"])}, compact)
+
+def apply_overrides(zed_theme, overrides):
+    # Sets the style keys in overrides on the first theme of the family;
+    # "syntax" entries are merged key by key, so an override can change a
+    # color and keep the generated font style
+    style = zed_theme["themes"][0]["style"]
+    for key, value in overrides.items():
+        if key == "syntax":
+            syntax = style.setdefault("syntax", {})
+            for name, entry in value.items():
+                syntax.setdefault(name, {}).update(entry)
+        else:
+            style[key] = value
+    return zed_theme
+
+@lru_cache(maxsize=None)
+def load_reference(path):
+    # The Zed theme expand() copies missing keys from, once per process
+    return load_json(path)
+
+def convert_entry(theme_entry, pkg, cached=None, debug=False, profile=False, base_dir="", out_dir="themes",
+                  neovim_dir=None, cterm_dir=None, compact=False, overrides=None, reference_path=None):
+    # Converts one package.json theme entry and writes it to out_dir, plus a
+    # Neovim colorscheme to neovim_dir and terminal color fallbacks to
+    # cterm_dir when given; a handwritten colorscheme already in neovim_dir
+    # is skipped, not overwritten. Source paths are resolved against
+    # base_dir, the directory of package.json. compact writes minified JSON
+    # and a palette-referenced Lua file. The Zed theme is expanded with the
+    # keys of the reference theme at reference_path, when given, and then
+    # takes this label's entry in overrides (see overrides.jsonc).
+    # Runs in a worker process under --jobs, so it returns its outcome as a
+    # dict instead of printing. "status" is "ok", "unchanged", "cached",
+    # "invalid" (the output fails the Zed schema, listed in "problems") or
+    # "error"; "profile" holds the stage timers and counters when enabled.
+    label = theme_entry.get("label")
+    theme_path = theme_entry.get("path")
+    path = os.path.join(base_dir, theme_path)
+    ui_theme = theme_entry.get("uiTheme", "vs-dark")
+    appearance = "light" if "light" in ui_theme else "dark"
+    author = pkg.get("publisher", "Unknown")
+    stats = Profile(enabled=profile)
+    theme_overrides = (overrides or {}).get(label, {})
+    out_path = os.path.join(out_dir, output_name(label))
+    out_paths = [out_path]
+    skipped = []
+    if neovim_dir:
+        neovim_path = os.path.join(neovim_dir, f"{neovim_name(label)}.lua")
+        if is_generated(neovim_path):
+            out_paths.append(neovim_path)
+        else:
+            skipped.append(neovim_path)
+            neovim_dir = None
+    if cterm_dir:
+        out_paths.append(os.path.join(cterm_dir, output_name(label)))
+    
+    try:
+        with stats.stage("parse"):
+            with open(path, 'rb') as f:
+                source = f.read()
             
-            for vs_scope, zed_val in SYNTAX_MAPPING.items():
-                if s == vs_scope or s.startswith(vs_scope + "."):
-                    if len(vs_scope) > best_match_len:
-                        best_match_len = len(vs_scope)
-                        best_match_val = zed_val
+            # Everything the outputs depend on
+            key = sha256(json.dumps([CONVERTER_VERSION, MAPPING_HASH, sha256(source), label, appearance, author,
+                                     theme_path, out_paths, compact, theme_overrides,
+                                     reference_path and file_hash(reference_path)], sort_keys=True))
+            if cached and cached.get("key") == key and all(
+                    file_hash(p) == h for p, h in cached.get("outputs", {}).items()):
+                return {"status": "cached", "path": out_path, "outputs": out_paths, "written": [],
+                        "skipped": skipped, "warnings": cached.get("warnings", []), "cache": cached,
+                        "profile": stats.as_dict()}
+            
+            vs_data = parse_json(source)
+        
+        zed_theme = convert(vs_data, label, author, appearance, stats, debug)
+        if reference_path:
+            zed_theme = expand(zed_theme, load_reference(reference_path), vs_data, stats)
+        apply_overrides(zed_theme, theme_overrides.get("zed", {}))
+        
+        with stats.stage("validate"):
+            problems = validate(zed_theme)
+            warnings = [] if problems else lint(zed_theme)
+        if problems:
+            # Nothing is written or cached, so every run reports it again
+            return {"status": "invalid", "path": out_path, "outputs": out_paths, "written": [],
+                    "skipped": skipped, "problems": problems, "profile": stats.as_dict()}
+        
+        with stats.stage("write"):
+            contents = [dumps(zed_theme, compact)]
+            if neovim_dir:
+                contents.append(to_neovim(vs_data, zed_theme, os.path.normpath(theme_path), compact,
+                                              theme_overrides.get("neovim")))
+            if cterm_dir:
+                contents.append(to_cterm(zed_theme, compact))
+            written = [p for p, content in zip(out_paths, contents) if write_if_changed(p, content)]
+        return {"status": "ok" if written else "unchanged", "path": out_path, "outputs": out_paths,
+                "written": written, "skipped": skipped, "warnings": warnings,
+                "cache": {"key": key, "outputs": {p: sha256(c) for p, c in zip(out_paths, contents)},
+                          "warnings": warnings},
+                "profile": stats.as_dict()}
+        
+    except Exception as e:
+        import traceback
+        return {"status": "error", "error": str(e), "traceback": traceback.format_exc(),
+                "profile": stats.as_dict()}
+
+def report(label, result):
+    status = result["status"]
+    if status == "error":
+        print(f"  -> Error converting {label}: {result['error']}")
+        sys.stdout.flush()
+        sys.stderr.write(result["traceback"])
+        return
+    for path in result["outputs"]:
+        if status == "invalid":
+            print(f"  -> Not written {path}: output fails the Zed schema")
+        elif path in result["written"]:
+            print(f"  -> Generated {path}")
+        elif status == "cached":
+            print(f"  -> Up to date {path}")
+        else:
+            print(f"  -> Unchanged {path}")
+    for path in result.get("skipped", []):
+        print(f"  -> Skipped {path}: handwritten, not {NEOVIM_MARK}")
+    for problem in result.get("problems", []):
+        print(f"  -> Schema: {problem}")
+    # Kept in the build cache, so an up-to-date theme still shows them
+    for warning in result.get("warnings", []):
+        print(f"  -> Warning: {warning}")
+
+def audit_output(result):
+    # Contrast audit of a written theme; returns the number of failing pairs
+    from audit_theme import audit, failures, print_failures
+    rows = audit(load_json(result["path"]))
+    bad = failures(rows)
+    if bad:
+        print(f"  -> {len(bad)} of {len(rows)} color pairs below the required contrast")
+        print_failures(rows, indent="     ")
+    return len(bad)
+
+def source_stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def watch(themes, pkg, cache, options, cache_path=CACHE_PATH, check_contrast=False, interval=0.1, debounce=0.15):
+    # Polls the source files and reconverts only the themes whose source
+    # changed. pkg, the mapping tables and the scope index stay loaded.
+    # A burst of saves to one file restarts its debounce timer, so it is
+    # converted once after the writes settle.
+    by_path = {}
+    for theme_entry in themes:
+        path = os.path.join(options.get("base_dir", ""), theme_entry.get("path"))
+        by_path.setdefault(path, []).append(theme_entry)
+    stamps = {path: source_stamp(path) for path in by_path}
+    pending = {}
+    
+    print(f"Watching {len(by_path)} source files (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            now = time.monotonic()
+            for path in by_path:
+                stamp = source_stamp(path)
+                if stamp != stamps[path]:
+                    stamps[path] = stamp
+                    pending[path] = now
             
-            if best_match_val:
-                # Handle list of Zed keys or single string
-                if isinstance(best_match_val, list):
-                    zed_keys = best_match_val
-                else:
-                    zed_keys = [best_match_val]
-                
-                for zed_key in zed_keys:
-                    entry = {}
-                    if foreground:
-                        entry["color"] = foreground
-                    if font_style:
-                        entry["font_style"] = font_style
-                        if "bold" in font_style:
-                            entry["font_weight"] = 700
-                        if "italic" in font_style:
-                            entry["font_style"] = "italic"
-                        else:
-                            entry["font_style"] = None 
-                            
-                    if zed_key not in syntax:
-                         syntax[zed_key] = entry
-                         # Debug print
-                         if zed_key == "property":
-                             print(f"DEBUG: Mapped {s} to property with color {foreground}")
-                    else:
-                        # Update existing
-                        syntax[zed_key].update(entry)
+            for path, changed_at in list(pending.items()):
+                if now - changed_at < debounce:
+                    continue
+                del pending[path]
+                for theme_entry in by_path[path]:
+                    label = theme_entry.get("label")
+                    start = time.perf_counter()
+                    result = convert_entry(theme_entry, pkg, cache.get(label), **options)
+                    elapsed = (time.perf_counter() - start) * 1000
+                    print(f"{path} changed, reconverted {label} in {elapsed:.1f} ms")
+                    report(label, result)
+                    if result["status"] not in ("error", "invalid"):
+                        cache[label] = result["cache"]
+                        save_cache(cache, cache_path)
+                        if check_contrast:
+                            audit_output(result)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
 
-    return syntax
+# Corpus mode: converts every theme in a directory tree or a JSON Lines
+# stream (one VS Code theme object per line, "-" for stdin). Items are read
+# lazily and at most CORPUS_WINDOW per worker are in flight, so memory stays
+# bounded however large the corpus is. Workers write their own output and
+# return a small status dict; failures go to a JSON Lines report as they
+# happen and do not stop the run.
+CORPUS_WINDOW = 4
+
+def iter_corpus(source):
+    # Yields (name, kind, data): kind "path" with a file path, or "text"
+    # with one JSONL line
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith((".json", ".jsonc")):
+                    path = os.path.join(root, name)
+                    yield os.path.relpath(path, source), "path", path
+        return
+    f = sys.stdin if source == "-" else open(source, 'r', encoding="utf-8")
+    try:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                yield f"{source}:{number}", "text", line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+def corpus_output(name, vs_theme, kind):
+    # Directory items keep their relative path; JSONL items are named after
+    # the theme, with the line number to keep duplicate names apart
+    if kind == "path":
+        return os.path.splitext(name)[0] + ".json"
+    label = vs_theme.get("name") if isinstance(vs_theme.get("name"), str) else "Untitled"
+    return f"{output_name(label)[:-len('.json')]}-{name.rsplit(':', 1)[1]}.json"
+
+def convert_corpus_item(name, kind, data, out_dir, compact=False):
+    # Runs in a worker process; returns a small dict, never raises
+    size = 0
+    try:
+        if kind == "path":
+            with open(data, 'rb') as f:
+                data = f.read()
+        size = len(data)
+        vs_theme = parse_json(data)
+        if not isinstance(vs_theme, dict):
+            raise ValueError("not a theme object")
+        theme_type = vs_theme.get("type", "dark")
+        appearance = "light" if isinstance(theme_type, str) and "light" in theme_type else "dark"
+        zed_theme = convert(vs_theme, appearance=appearance)
+        problems = validate(zed_theme)
+        if problems:
+            more = f" (+{len(problems) - 1} more)" if len(problems) > 1 else ""
+            raise ValueError(f"output fails the Zed schema: {problems[0]}{more}")
+        out_path = os.path.join(out_dir, corpus_output(name, vs_theme, kind))
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        written = write_if_changed(out_path, dumps(zed_theme, compact))
+        return {"name": name, "status": "ok" if written else "unchanged", "path": out_path, "bytes": size}
+    except Exception as e:
+        return {"name": name, "status": "error", "error": f"{type(e).__name__}: {e}", "bytes": size}
+
+def convert_corpus(source, out_dir, jobs=1, failures_path=None, verbose=False, compact=False):
+    # Returns the throughput stats printed at the end of the run
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {"ok": 0, "unchanged": 0, "error": 0}
+    total_bytes = 0
+    failures_file = open(failures_path, 'w') if failures_path else None
+    start = time.perf_counter()
+    
+    def handle(result):
+        nonlocal total_bytes
+        counts[result["status"]] += 1
+        total_bytes += result["bytes"]
+        if result["status"] == "error":
+            print(f"  -> Error converting {result['name']}: {result['error']}")
+            if failures_file:
+                failures_file.write(json.dumps(result) + "\n")
+                failures_file.flush()
+        elif verbose:
+            print(f"  -> {'Generated' if result['status'] == 'ok' else 'Unchanged'} {result['path']}")
+    
+    try:
+        if jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            # Results are handled in input order, so the log is stable
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                for item in iter_corpus(source):
+                    if len(pending) >= jobs * CORPUS_WINDOW:
+                        handle(pending.popleft().result())
+                    pending.append(pool.submit(convert_corpus_item, *item, out_dir, compact))
+                while pending:
+                    handle(pending.popleft().result())
+        else:
+            for item in iter_corpus(source):
+                handle(convert_corpus_item(*item, out_dir, compact))
+    finally:
+        if failures_file:
+            failures_file.close()
+    
+    elapsed = time.perf_counter() - start
+    themes = sum(counts.values())
+    return {"themes": themes, "generated": counts["ok"], "unchanged": counts["unchanged"],
+            "failed": counts["error"], "seconds": round(elapsed, 3),
+            "themes_per_second": round(themes / elapsed, 1) if elapsed else 0.0,
+            "mb_per_second": round(total_bytes / 1e6 / elapsed, 2) if elapsed else 0.0}
 
 def main():
-    package_path = "package.json"
+    parser = argparse.ArgumentParser(description="Convert the VS Code themes in package.json to Zed themes.")
+    parser.add_argument("--package", default="package.json",
+                        help="extension manifest listing the themes (default: package.json)")
+    parser.add_argument("--out-dir",
+                        help="directory for the Zed themes (default: themes/ next to the manifest, "
+                             "or zed-corpus/ with --corpus)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="convert themes in N worker processes (default: 1, serial)")
+    parser.add_argument("--force", action="store_true",
+                        help=f"ignore {CACHE_PATH} and regenerate every theme")
+    parser.add_argument("--watch", action="store_true",
+                        help="after converting, keep running and reconvert themes whose source changes")
+    parser.add_argument("--neovim", nargs="?", const="", metavar="DIR",
+                        help="also generate Neovim colorschemes (default DIR: neovim/ next to the manifest); "
+                             "existing handwritten colorschemes are not overwritten")
+    parser.add_argument("--cterm", nargs="?", const="", metavar="DIR",
+                        help="also write xterm-256/ANSI-16 fallbacks for every color "
+                             "(default DIR: cterm/ next to the manifest)")
+    parser.add_argument("--compact", action="store_true",
+                        help="write minified JSON, and Neovim colorschemes that reference a palette table")
+    parser.add_argument("--audit", action="store_true",
+                        help="check foreground/background contrast of each theme and exit with status 1 on failures")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write per-stage timings and counters to a JSON report")
+    parser.add_argument("--debug", action="store_true",
+                        help="print debug output while mapping syntax scopes")
+    parser.add_argument("--corpus", metavar="SOURCE",
+                        help="convert every theme in a directory or JSON Lines file ('-' for stdin) "
+                             "instead of the manifest's themes")
+    parser.add_argument("--failures", metavar="PATH",
+                        help="with --corpus, write failed themes to a JSON Lines report")
+    parser.add_argument("--verbose", action="store_true",
+                        help="with --corpus, print every generated file, not just failures")
+    args = parser.parse_args()
+    
+    if args.corpus:
+        stats = convert_corpus(args.corpus, args.out_dir or "zed-corpus", args.jobs, args.failures, args.verbose,
+                               args.compact)
+        print(f"Converted {stats['themes']} themes in {stats['seconds']}s "
+              f"({stats['themes_per_second']} themes/s, {stats['mb_per_second']} MB/s): "
+              f"{stats['generated']} generated, {stats['unchanged']} unchanged, {stats['failed']} failed")
+        if args.failures and stats["failed"]:
+            print(f"Wrote failures to {args.failures}")
+        if stats["failed"]:
+            sys.exit(1)
+        return
+    
+    package_path = args.package
     if not os.path.exists(package_path):
-        print("package.json not found")
+        print(f"{package_path} not found")
         return
         
     pkg = load_json(package_path)
     themes = pkg.get("contributes", {}).get("themes", [])
     
-    os.makedirs("themes", exist_ok=True) # Output to "themes" dir as per user request
+    base_dir = os.path.dirname(package_path)
+    out_dir = args.out_dir or os.path.join(base_dir, "themes")
+    os.makedirs(out_dir, exist_ok=True) # Output to "themes" dir as per user request
     
-    for theme_entry in themes:
+    cache_path = os.path.join(base_dir, CACHE_PATH)
+    cache = {} if args.force else load_cache(cache_path)
+    new_cache = {}
+    profiles = {}
+    contrast_failures = 0
+    invalid = 0
+    overrides_path = os.path.join(base_dir, OVERRIDES_PATH)
+    reference_path = os.path.join(base_dir, DRACULA_PATH)
+    options = {"debug": args.debug, "profile": bool(args.profile), "base_dir": base_dir, "out_dir": out_dir,
+               "compact": args.compact,
+               "overrides": load_json(overrides_path) if os.path.exists(overrides_path) else {},
+               "reference_path": reference_path if os.path.exists(reference_path) else None}
+    if args.neovim is not None:
+        options["neovim_dir"] = args.neovim or os.path.join(base_dir, "neovim")
+        os.makedirs(options["neovim_dir"], exist_ok=True)
+    if args.cterm is not None:
+        options["cterm_dir"] = args.cterm or os.path.join(base_dir, "cterm")
+        os.makedirs(options["cterm_dir"], exist_ok=True)
+    
+    def handle(theme_entry, result):
+        nonlocal contrast_failures, invalid
         label = theme_entry.get("label")
-        path = theme_entry.get("path")
-        ui_theme = theme_entry.get("uiTheme", "vs-dark")
-        appearance = "light" if "light" in ui_theme else "dark"
-        
         print(f"Processing {label}...")
-        
-        try:
-            vs_data = load_json(path)
-            colors = vs_data.get("colors", {})
-            token_colors = vs_data.get("tokenColors", [])
-            
-            # Build Style
-            style = {}
-            
-            # Map Colors
-            for zed_key, vs_key in COLOR_MAPPING.items():
-                if vs_key in colors:
-                    style[zed_key] = colors[vs_key]
-            
-            # Map ANSI
-            for vs_key, zed_key in ANSI_MAPPING.items():
-                if vs_key in colors:
-                    style[zed_key] = colors[vs_key]
-            
-            # Map Syntax
-            style["syntax"] = convert_syntax(token_colors)
-            
-            # Players (Cursors)
-            # Use accent color or default
-            cursor_color = colors.get("editorCursor.foreground", "#FFFFFF")
-            selection_color = colors.get("editor.selectionBackground", "#FFFFFF44")
-            
-            style["players"] = [
-                {
-                    "cursor": cursor_color,
-                    "background": cursor_color,
-                    "selection": selection_color
-                }
-            ]
-            
-            # Add implicit Accents if missing
-            style["accents"] = [colors.get("activityBarBadge.background", "#FF0000")]
-            
-            # Construct Final Object
-            zed_theme = {
-                "$schema": "https://zed.dev/schema/themes/v0.2.0.json",
-                "name": label,
-                "author": pkg.get("publisher", "Unknown"),
-                "themes": [
-                    {
-                        "name": label,
-                        "appearance": appearance,
-                        "style": style
-                    }
-                ]
-            }
-            
-            out_name = f"{label}.json"
-            # Normalize filename
-            out_name = out_name.replace(" ", "_")
-            out_path = os.path.join("themes", out_name)
-            
-            with open(out_path, 'w') as f:
-                json.dump(zed_theme, f, indent=2)
-                
-            print(f"  -> Generated {out_path}")
-            
-        except Exception as e:
-            print(f"  -> Error converting {label}: {e}")
-            import traceback
-            traceback.print_exc()
+        report(label, result)
+        profiles[label] = result["profile"]
+        if result["status"] == "invalid":
+            invalid += 1
+        elif result["status"] != "error":
+            new_cache[label] = result["cache"]
+            if args.audit:
+                contrast_failures += audit_output(result)
+    
+    if args.jobs > 1 and len(themes) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        # Results are collected in package.json order, so the log and the
+        # written files match a serial run.
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [pool.submit(convert_entry, entry, pkg, cache.get(entry.get("label")), **options)
+                       for entry in themes]
+            for theme_entry, future in zip(themes, futures):
+                handle(theme_entry, future.result())
+    else:
+        for theme_entry in themes:
+            handle(theme_entry, convert_entry(theme_entry, pkg, cache.get(theme_entry.get("label")), **options))
+    
+    if new_cache != cache:
+        save_cache(new_cache, cache_path)
+    
+    if args.profile:
+        write_report(args.profile, profiles)
+        print(f"Wrote profile to {args.profile}")
+    
+    if args.watch:
+        watch(themes, pkg, new_cache, options, cache_path, args.audit)
+    elif contrast_failures or invalid:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,301 @@
+import argparse
+import json
+import math
+import os
+import re
+import time
+from collections import deque
+
+from convert_theme import CORPUS_WINDOW, compile_selector, convert, iter_corpus, scope_candidates
+from jsonc import load as load_json, loads as parse_json
+from mapping import DERIVE_OPERATIONS, SYNTAX_MAPPING, UI_CHAINS
+
+# Mapping coverage of VS Code themes: which `colors` keys and tokenColors
+# selectors never reach Zed, and which Zed keys of the reference theme
+# (dracula.example.json) stay empty, with suggested mappings for each.
+#
+# Suggestions come from a token-similarity index built once per run: key
+# names are split into words ("editorLineNumber.activeForeground" ->
+# editor line number active foreground) and weighted by TF-IDF, and every
+# Zed key's document also carries the words of the VS Code keys or scopes
+# already mapped to it. A lookup only visits the postings of the query's
+# words, and each distinct name is looked up once however many themes drop
+# it, so a corpus is one batch run.
+#
+#   python coverage_theme.py                       vscode-themes/*.json
+#   python coverage_theme.py corpus/ -j 8 --top 30 --json coverage.json
+#   python coverage_theme.py vscode-themes/Blank-Ghibli.json --details
+
+REFERENCE_PATH = "dracula.example.json"
+DEFAULT_SOURCES = "vscode-themes"
+
+# Suggestions scoring below this are not shown
+MIN_SCORE = 0.3
+
+# Abbreviations spelled out before indexing
+SYNONYMS = {
+    "fg": "foreground",
+    "bg": "background",
+    "bgcolor": "background",
+    "num": "number",
+    "ln": "line",
+}
+
+_WORD = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+
+def words(name):
+    # "editorLineNumber.activeForeground" -> ["editor", "line", "number",
+    # "active", "foreground"]; works for Zed keys and TextMate scopes too
+    return [SYNONYMS.get(w.lower(), w.lower()) for w in _WORD.findall(name)]
+
+
+def build_index(documents):
+    # documents: name -> list of words. Returns the inverted index used by
+    # suggest(): word -> [(name, weight)], with TF-IDF weights normalized
+    # per document so a dot product is the cosine similarity.
+    count = len(documents) or 1
+    frequency = {}
+    for doc_words in documents.values():
+        for word in set(doc_words):
+            frequency[word] = frequency.get(word, 0) + 1
+    idf = {word: math.log((1 + count) / (1 + n)) + 1 for word, n in frequency.items()}
+
+    postings = {}
+    for name, doc_words in documents.items():
+        tf = {}
+        for word in doc_words:
+            tf[word] = tf.get(word, 0) + 1
+        weights = {word: n * idf[word] for word, n in tf.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        for word, weight in weights.items():
+            postings.setdefault(word, []).append((name, weight / norm))
+    return {"idf": idf, "postings": postings}
+
+
+def suggest(index, name, top=3):
+    # Best matches for name as [(candidate, score)], highest first
+    tf = {}
+    for word in words(name):
+        if word in index["idf"]:
+            tf[word] = tf.get(word, 0) + 1
+    weights = {word: n * index["idf"][word] for word, n in tf.items()}
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    if not norm:
+        return []
+    scores = {}
+    for word, weight in weights.items():
+        for candidate, doc_weight in index["postings"][word]:
+            scores[candidate] = scores.get(candidate, 0.0) + weight / norm * doc_weight
+    ranked = sorted(((score, candidate) for candidate, score in scores.items()
+                     if score >= MIN_SCORE), reverse=True)
+    return [(candidate, round(score, 3)) for score, candidate in ranked[:top]]
+
+
+def chain_keys(chain):
+    # VS Code keys a compiled chain reads, derived operands included
+    for source in chain:
+        if source[0] == "key":
+            yield source[1]
+        elif source[0] in DERIVE_OPERATIONS:
+            for operand in source[1:3]:
+                if operand[0] == "key":
+                    yield operand[1]
+
+
+MAPPED_KEYS = {key for _, chain in UI_CHAINS for key in chain_keys(chain)}
+
+
+def reference_keys(path=REFERENCE_PATH):
+    # (UI keys, syntax keys) of every theme in the reference family
+    doc = load_json(path)
+    ui = {}
+    syntax = {}
+    for theme in doc.get("themes", []):
+        style = theme.get("style", {})
+        for key in style:
+            if key not in ("syntax", "players", "accents"):
+                ui[key] = True
+        for key in style.get("syntax", {}):
+            syntax[key] = True
+    return list(ui), list(syntax)
+
+
+def zed_indexes(ui_keys, syntax_keys):
+    # Zed UI keys, documented with the VS Code keys their chains read, and
+    # Zed syntax keys, documented with the scopes mapped to them
+    ui_docs = {key: words(key) for key in ui_keys}
+    for zed_key, chain in UI_CHAINS:
+        for vs_key in chain_keys(chain):
+            ui_docs.setdefault(zed_key, words(zed_key)).extend(words(vs_key))
+    syntax_docs = {key: words(key) for key in syntax_keys}
+    for vs_scope, zed_val in SYNTAX_MAPPING.items():
+        for zed_key in zed_val if isinstance(zed_val, list) else [zed_val]:
+            syntax_docs.setdefault(zed_key, words(zed_key)).extend(words(vs_scope))
+    return build_index(ui_docs), build_index(syntax_docs)
+
+
+def analyze(name, kind, data, ui_keys, syntax_keys):
+    # Coverage of one theme; runs in a worker process under --jobs, so it
+    # returns plain data and never raises
+    try:
+        if kind == "path":
+            vs_theme = load_json(data)
+        else:
+            vs_theme = parse_json(data)
+        if not isinstance(vs_theme, dict):
+            raise ValueError("not a theme object")
+        colors = vs_theme.get("colors", {})
+        token_colors = vs_theme.get("tokenColors", [])
+
+        dropped_keys = [key for key in colors if key not in MAPPED_KEYS]
+        # Dicts as ordered sets: a theme can repeat a scope in many selectors
+        dropped_scopes = {}
+        source_scopes = {}
+        selectors = 0
+        for rule in token_colors:
+            settings = rule.get("settings", {})
+            if not settings.get("foreground") and not settings.get("fontStyle"):
+                continue
+            scope = rule.get("scope")
+            for selector in [scope] if isinstance(scope, str) else scope if isinstance(scope, list) else []:
+                for path, _ in compile_selector(selector):
+                    selectors += 1
+                    source_scopes[path[-1]] = True
+                    if not scope_candidates(path[-1]):
+                        dropped_scopes[path[-1]] = True
+
+        zed_theme = convert(vs_theme)
+        style = zed_theme["themes"][0]["style"]
+        empty_ui = [key for key in ui_keys if key not in style]
+        empty_syntax = [key for key in syntax_keys if key not in style.get("syntax", {})]
+        return {"name": name, "status": "ok", "colors": len(colors), "selectors": selectors,
+                "dropped_keys": dropped_keys, "dropped_scopes": list(dropped_scopes),
+                "empty_ui": empty_ui, "empty_syntax": empty_syntax,
+                "source_keys": list(colors), "source_scopes": list(source_scopes)}
+    except Exception as e:
+        return {"name": name, "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+
+def format_suggestions(suggestions):
+    if not suggestions:
+        return "no close match"
+    return ", ".join(f"{candidate} {score:.2f}" for candidate, score in suggestions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report VS Code keys and scopes that do not reach Zed, "
+                                                 "with suggested mappings.")
+    parser.add_argument("sources", nargs="*",
+                        help=f"VS Code themes, directories or JSON Lines files (default: {DEFAULT_SOURCES}/)")
+    parser.add_argument("--reference", default=REFERENCE_PATH,
+                        help=f"Zed theme listing the keys to fill (default: {REFERENCE_PATH})")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="analyze themes in N worker processes (default: 1, serial)")
+    parser.add_argument("--top", type=int, default=20, metavar="N",
+                        help="most often dropped keys, scopes and empty Zed keys to list (default: 20)")
+    parser.add_argument("--suggestions", type=int, default=3, metavar="N",
+                        help="suggestions per item (default: 3)")
+    parser.add_argument("--details", action="store_true", help="list every dropped item of every theme")
+    parser.add_argument("--json", metavar="PATH", help="write the full report, suggestions included, as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    ui_keys, syntax_keys = reference_keys(args.reference)
+    ui_index, syntax_index = zed_indexes(ui_keys, syntax_keys)
+
+    def items():
+        # Read lazily, so a large corpus is never held in memory at once
+        for source in args.sources or [DEFAULT_SOURCES]:
+            if os.path.isdir(source) or source == "-" or source.endswith(".jsonl"):
+                yield from iter_corpus(source)
+            else:
+                yield (source, "path", source)
+
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        # As in convert_theme.py's corpus mode, at most CORPUS_WINDOW themes
+        # per worker are in flight; results come back in input order
+        results = []
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            pending = deque()
+            for item in items():
+                if len(pending) >= args.jobs * CORPUS_WINDOW:
+                    results.append(pending.popleft().result())
+                pending.append(pool.submit(analyze, *item, ui_keys, syntax_keys))
+            while pending:
+                results.append(pending.popleft().result())
+    else:
+        results = [analyze(*item, ui_keys, syntax_keys) for item in items()]
+
+    ok = [r for r in results if r["status"] == "ok"]
+    # How many themes drop each item, in first-seen order for ties
+    totals = {"dropped_keys": {}, "dropped_scopes": {}, "empty_ui": {}, "empty_syntax": {}}
+    source_keys = {}
+    source_scopes = {}
+    for result in ok:
+        for field, counts in totals.items():
+            for item in result[field]:
+                counts[item] = counts.get(item, 0) + 1
+        for key in result["source_keys"]:
+            source_keys[key] = True
+        for scope in result["source_scopes"]:
+            source_scopes[scope] = True
+
+    # Empty Zed keys are matched against the keys and scopes the themes have
+    indexes = {
+        "dropped_keys": ui_index,
+        "dropped_scopes": syntax_index,
+        "empty_ui": build_index({key: words(key) for key in source_keys}),
+        "empty_syntax": build_index({scope: words(scope) for scope in source_scopes}),
+    }
+    suggestions = {field: {item: suggest(indexes[field], item, args.suggestions) for item in counts}
+                   for field, counts in totals.items()}
+
+    for result in results:
+        if result["status"] == "error":
+            print(f"{result['name']}: error: {result['error']}")
+            continue
+        reached = result["colors"] - len(result["dropped_keys"])
+        percent = 100 * reached // max(result["colors"], 1)
+        print(f"{result['name']}: {reached} of {result['colors']} colors reach Zed ({percent}%), "
+              f"{len(result['dropped_scopes'])} of {result['selectors']} selectors dropped, "
+              f"{len(result['empty_ui'])} UI and {len(result['empty_syntax'])} syntax keys empty")
+        if args.details:
+            for field, label in (("dropped_scopes", "dropped scope"), ("empty_ui", "empty UI key"),
+                                 ("empty_syntax", "empty syntax key"), ("dropped_keys", "dropped key")):
+                for item in result[field]:
+                    print(f"  {label} {item}: {format_suggestions(suggestions[field][item])}")
+
+    titles = {
+        "dropped_keys": "VS Code keys dropped -> Zed keys to map them to",
+        "dropped_scopes": "Scopes dropped -> Zed syntax keys to map them to",
+        "empty_ui": "Zed UI keys left empty -> VS Code keys to read",
+        "empty_syntax": "Zed syntax keys left empty -> scopes the themes style",
+    }
+    for field, counts in totals.items():
+        if not counts:
+            continue
+        ranked = sorted(counts.items(), key=lambda item: -item[1])
+        print(f"\n{titles[field]} ({len(counts)}, top {min(args.top, len(counts))} of {len(ok)} themes)")
+        for item, n in ranked[:args.top]:
+            print(f"  {n:>4}x {item}: {format_suggestions(suggestions[field][item])}")
+
+    elapsed = time.perf_counter() - start
+    print(f"\nAnalyzed {len(results)} themes in {elapsed * 1000:.1f} ms "
+          f"({len(results) - len(ok)} failed)")
+
+    if args.json:
+        report = {"themes": [{k: v for k, v in r.items() if k not in ("source_keys", "source_scopes")}
+                             for r in results],
+                  "totals": totals,
+                  "suggestions": {field: {item: [{"key": c, "score": s} for c, s in found]
+                                          for item, found in items.items()}
+                                  for field, items in suggestions.items()}}
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+import argparse
+import copy
+import json
+import os
+import subprocess
+import sys
+
+import colormath
+from convert_theme import convert, write_if_changed
+from jsonc import load as load_json, loads as parse_json
+
+# Structural diff and patch for theme documents.
+#
+# Both documents are flattened to {path: leaf value}, so a diff compares
+# keys rather than lines: VS Code `colors`, `tokenColors` settings addressed
+# by scope (not by rule position, which shifts whenever a rule is added) and
+# Zed themes addressed by name, with their style keys and `syntax` entries.
+# Colors that change are reported with a perceptual delta (CIE76 dE).
+#
+# A patch is the list of changes, each with the value it replaces. Applying
+# it changes only the values at those paths, so a derived file keeps every
+# other value, hand edits included, and a path whose current value is not
+# the expected one is reported as a conflict instead of being overwritten.
+# The patched file is written back as plain JSON in the target's indent:
+# values elsewhere are kept but layout such as blank lines is not, and a
+# JSONC target is refused, since writing it back would drop its comments.
+#
+#   python diff_theme.py v1.0.5:vscode-themes/Blank-Moonlight.json vscode-themes/Blank-Moonlight.json
+#   python diff_theme.py OLD.json NEW.json --as-zed --patch moonlight.patch.json
+#   python diff_theme.py --apply moonlight.patch.json themes/Blank_Moonlight.json
+
+PATCH_FORMAT = "blank-theme-patch"
+PATCH_VERSION = 1
+
+
+def rule_scopes(rule):
+    # A tokenColors rule's scope as a list of selectors; "" for the
+    # scopeless rule that sets the defaults
+    scope = rule.get("scope")
+    if scope is None:
+        return [""]
+    if isinstance(scope, str):
+        scope = scope.split(",")
+    return [s.strip() for s in scope if isinstance(s, str) and s.strip()]
+
+
+def walk(node, path, out):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            walk(value, path + (key,), out)
+    elif isinstance(node, list):
+        if path == ("tokenColors",):
+            # Later rules win for the same selector, as in VS Code
+            for rule in node:
+                if isinstance(rule, dict):
+                    for scope in rule_scopes(rule):
+                        walk(rule.get("settings", {}), path + (scope,), out)
+        elif path == ("themes",):
+            for theme in node:
+                walk(theme, path + (theme.get("name", ""),), out)
+        else:
+            for i, value in enumerate(node):
+                walk(value, path + (i,), out)
+    else:
+        out[path] = node
+
+
+def flatten(doc):
+    # Theme document -> {path tuple: leaf value}. tokenColors paths are
+    # ("tokenColors", scope, setting), Zed theme paths start with
+    # ("themes", theme name); other lists are indexed by position.
+    out = {}
+    walk(doc, (), out)
+    return out
+
+
+def diff(old, new):
+    # Changes from old to new as dicts with "op" (add, remove or replace),
+    # "path" and "old"/"new" values, in document order
+    old_flat = flatten(old)
+    new_flat = flatten(new)
+    changes = []
+    for path, value in old_flat.items():
+        if path not in new_flat:
+            changes.append({"op": "remove", "path": list(path), "old": value})
+        elif new_flat[path] != value:
+            changes.append({"op": "replace", "path": list(path), "old": value, "new": new_flat[path]})
+    for path, value in new_flat.items():
+        if path not in old_flat:
+            changes.append({"op": "add", "path": list(path), "new": value})
+    return changes
+
+
+def color_delta(a, b):
+    # CIE76 dE between two color strings, alpha composited over black; None
+    # unless both are colors
+    from quantize import to_lab
+    a, b = colormath.parse(a), colormath.parse(b)
+    if a is None or b is None:
+        return None
+    la = to_lab(colormath.alpha_over(a, colormath.BLACK)[:3])
+    lb = to_lab(colormath.alpha_over(b, colormath.BLACK)[:3])
+    return sum((x - y) ** 2 for x, y in zip(la, lb)) ** 0.5
+
+
+def format_path(path):
+    out = ""
+    for i, part in enumerate(path):
+        keyed = i == 1 and path[0] in ("tokenColors", "themes")
+        if isinstance(part, int) or keyed:
+            out += f"[{part}]"
+        else:
+            out += f".{part}" if out else str(part)
+    return out
+
+
+def swatch(value, enabled):
+    color = colormath.parse(value)
+    if not enabled or color is None:
+        return ""
+    r, g, b = (round(c * 255) for c in colormath.alpha_over(color, colormath.BLACK)[:3])
+    return f"\x1b[48;2;{r};{g};{b}m  \x1b[0m "
+
+
+def print_report(changes, color=False, details=True):
+    counts = {"add": 0, "remove": 0, "replace": 0}
+    for change in changes:
+        counts[change["op"]] += 1
+    print(f"{counts['add']} added, {counts['remove']} removed, {counts['replace']} changed")
+    if not details:
+        return
+    marks = {"add": "+", "remove": "-", "replace": "~"}
+    for change in changes:
+        line = f"  {marks[change['op']]} {format_path(change['path'])}  "
+        if change["op"] == "add":
+            line += f"{swatch(change['new'], color)}{json.dumps(change['new'])}"
+        elif change["op"] == "remove":
+            line += f"{swatch(change['old'], color)}{json.dumps(change['old'])}"
+        else:
+            line += (f"{swatch(change['old'], color)}{json.dumps(change['old'])} -> "
+                     f"{swatch(change['new'], color)}{json.dumps(change['new'])}")
+            delta = color_delta(change["old"], change["new"])
+            if delta is not None:
+                line += f"  dE {delta:.1f}"
+        print(line)
+
+
+def find_rule(rules, scope):
+    # Index of the last rule that styles scope, or None
+    for i in range(len(rules) - 1, -1, -1):
+        if isinstance(rules[i], dict) and scope in rule_scopes(rules[i]):
+            return i
+    return None
+
+
+def set_token_setting(rules, scope, setting, value, remove=False):
+    # Changes one setting for one selector. A rule shared with other
+    # selectors is split: the selector moves to a copy placed right after
+    # it, so precedence is unchanged and the other selectors keep their style.
+    i = find_rule(rules, scope)
+    if i is None:
+        if not remove:
+            rules.append({"scope": scope, "settings": {setting: value}})
+        return
+    rule = rules[i]
+    if rule_scopes(rule) != [scope]:
+        others = [s for s in rule_scopes(rule) if s != scope]
+        rule["scope"] = others if isinstance(rule.get("scope"), list) else ", ".join(others)
+        rule = {"scope": scope, "settings": dict(rule.get("settings", {}))}
+        i += 1
+        rules.insert(i, rule)
+    settings = rule.setdefault("settings", {})
+    if remove:
+        settings.pop(setting, None)
+        if not settings:
+            del rules[i]
+    else:
+        settings[setting] = value
+
+
+def set_path(doc, path, value, remove=False):
+    if path[0] == "tokenColors" and len(path) == 3:
+        set_token_setting(doc.setdefault("tokenColors", []), path[1], path[2], value, remove)
+        return
+    node = doc
+    for i, part in enumerate(path[:-1]):
+        following = path[i + 1]
+        if i == 1 and path[0] == "themes":
+            matches = [t for t in node if t.get("name") == part]
+            if not matches:
+                if remove:
+                    return
+                matches = [{"name": part}]
+                node.append(matches[0])
+            node = matches[0]
+            continue
+        if isinstance(node, list):
+            if part >= len(node):
+                if remove:
+                    return
+                node.append({} if not isinstance(following, int) else [])
+            node = node[part]
+        else:
+            if part not in node:
+                if remove:
+                    return
+                node[part] = [] if isinstance(following, int) or (part == "themes" and not i) else {}
+            node = node[part]
+    last = path[-1]
+    if remove:
+        if isinstance(node, list):
+            if last < len(node):
+                del node[last]
+        else:
+            node.pop(last, None)
+    elif isinstance(node, list) and last >= len(node):
+        node.append(value)
+    else:
+        node[last] = value
+
+
+def apply(doc, changes, force=False):
+    # Returns (patched copy, applied changes, conflicts). A change conflicts
+    # when the target's current value is not the one the patch replaces;
+    # conflicts are skipped unless force is set.
+    doc = copy.deepcopy(doc)
+    current = flatten(doc)
+    applied = []
+    conflicts = []
+    # Removals first, from the end of lists, so earlier indexes stay valid;
+    # additions keep the patch order, so list items are appended in order
+    ordered = sorted(changes, key=lambda c: (0, [-p if isinstance(p, int) else 0 for p in c["path"]])
+                     if c["op"] == "remove" else (1, []))
+    for change in ordered:
+        path = tuple(change["path"])
+        expected = change.get("old") if change["op"] != "add" else None
+        actual = current.get(path)
+        if (path not in current) if change["op"] == "remove" else (path in current and actual == change["new"]):
+            continue  # already applied
+        if actual != expected and not force:
+            conflicts.append((change, actual))
+            continue
+        set_path(doc, path, change.get("new"), remove=change["op"] == "remove")
+        applied.append(change)
+    return doc, applied, conflicts
+
+
+def load_doc(spec):
+    # A file path, or REV:PATH for a file as of a git revision
+    if os.path.exists(spec) or ":" not in spec:
+        return load_json(spec)
+    out = subprocess.run(["git", "show", spec], capture_output=True, check=True)
+    return parse_json(out.stdout)
+
+
+def as_zed(vs_theme, label):
+    theme_type = vs_theme.get("type", "dark")
+    appearance = "light" if isinstance(theme_type, str) and "light" in theme_type else "dark"
+    return convert(vs_theme, label, appearance=appearance)
+
+
+def json_style(text):
+    # (indent, trailing newline) of the target's text, kept when it is
+    # written back
+    lines = text.splitlines()
+    second = lines[1] if len(lines) > 1 else ""
+    indent = second[:len(second) - len(second.lstrip())]
+    return ("\t" if indent.startswith("\t") else len(indent) or 2), ("\n" if text.endswith("\n") else "")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare theme documents by key, and write or apply patches.")
+    parser.add_argument("paths", nargs="*",
+                        help="OLD NEW to compare (files or git REV:PATH), or with --apply the files to patch")
+    parser.add_argument("--patch", metavar="PATH", help="write the changes from OLD to NEW as a patch")
+    parser.add_argument("--as-zed", action="store_true",
+                        help="compare the Zed conversions of two VS Code themes, so the patch applies to "
+                             "the generated Zed themes")
+    parser.add_argument("--apply", metavar="PATCH", help="apply PATCH to each file in paths, in place")
+    parser.add_argument("--force", action="store_true",
+                        help="with --apply, overwrite values that differ from the ones the patch expects")
+    parser.add_argument("--color", choices=("auto", "always", "never"), default="auto",
+                        help="color swatches in the report (default: auto)")
+    parser.add_argument("--quiet", action="store_true", help="print only the summary line")
+    args = parser.parse_args()
+
+    if args.apply:
+        with open(args.apply) as f:
+            patch = json.load(f)
+        if patch.get("format") != PATCH_FORMAT or patch.get("version") != PATCH_VERSION:
+            parser.error(f"{args.apply} is not a {PATCH_FORMAT} v{PATCH_VERSION} file")
+        if not args.paths:
+            parser.error("--apply needs the files to patch")
+        failed = False
+        for path in args.paths:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+            try:
+                doc = json.loads(text)
+            except json.JSONDecodeError:
+                # Comments or trailing commas would be lost on write
+                print(f"{path}: not plain JSON (JSONC comments or trailing commas), not patched")
+                failed = True
+                continue
+            patched, applied, conflicts = apply(doc, patch["changes"], args.force)
+            if applied:
+                indent, newline = json_style(text)
+                write_if_changed(path, json.dumps(patched, indent=indent, ensure_ascii=False) + newline)
+            print(f"{path}: {len(applied)} of {len(patch['changes'])} changes applied, {len(conflicts)} conflicts")
+            for change, actual in conflicts:
+                print(f"  ! {format_path(change['path'])}: expected {json.dumps(change.get('old'))}, "
+                      f"found {json.dumps(actual)}")
+            failed = failed or bool(conflicts)
+        if failed:
+            sys.exit(1)
+        return
+
+    if len(args.paths) != 2:
+        parser.error("give OLD and NEW to compare, or --apply PATCH with files to patch")
+    try:
+        old, new = (load_doc(spec) for spec in args.paths)
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        parser.error(f"cannot load: {e}")
+    if args.as_zed:
+        # One label for both, so the themes line up by name
+        label = new.get("name", "Untitled")
+        old, new = as_zed(old, label), as_zed(new, label)
+
+    changes = diff(old, new)
+    color = args.color == "always" or (args.color == "auto" and sys.stdout.isatty())
+    if args.patch:
+        with open(args.patch, 'w') as f:
+            json.dump({"format": PATCH_FORMAT, "version": PATCH_VERSION, "changes": changes}, f, indent=2)
+    print_report(changes, color, not args.quiet)
+    if args.patch:
+        print(f"Wrote {args.patch}")
+
+
+if __name__ == "__main__":
+    main()
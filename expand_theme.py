@@ -1,264 +1,62 @@
+import argparse
+import copy
 import json
 import os
-import re
 
+from instrument import Profile, write_report
 # Load JSON with comment stripping
-def load_json(path):
-    with open(path, 'r') as f:
-        content = f.read()
-        pattern = r'("(?:\\.|[^"\\])*")|//.*'
-        def replace(match):
-            return match.group(1) or ""
-        content = re.sub(pattern, replace, content)
-        content = re.sub(r',(\s*?[}\]])', r'\1', content)
-        return json.loads(content)
+from jsonc import load as load_json, loads
+from mapping import resolve
+from validate_theme import lint, validate
+
+# Shared disabled profile for callers that do not collect stats
+NO_PROFILE = Profile()
 
 # Source paths
 DRACULA_PATH = "dracula.example.json"
 CURRENT_THEME_PATH = "themes/Blank_Moonlight.json"
 VSCODE_THEME_PATH = "vscode-themes/Blank-Moonlight.json"
 
-# Expanded Mapping based on standard VSCode to Zed
-EXPANDED_MAPPING = {
-    # Backgrounds
-    "background.appearance": "opaque", # Default
-    "border": "focusBorder",
-    "border.variant": "sideBar.border",
-    "border.focused": "focusBorder",
-    "border.selected": "focusBorder",
-    "border.transparent": "#00000000",
-    "border.disabled": "disabledForeground",
-    
-    "elevated_surface.background": "editorWidget.background",
-    "surface.background": "sideBar.background",
-    "background": "editor.background",
-    "element.background": "input.background",
-    "element.hover": "list.hoverBackground",
-    "element.active": "list.activeSelectionBackground",
-    "element.selected": "list.activeSelectionBackground",
-    "element.disabled": "disabledForeground",
-    
-    "drop_target.background": "list.dropBackground",
-    
-    "ghost_element.background": "#00000000",
-    "ghost_element.hover": "list.hoverBackground",
-    "ghost_element.active": "list.activeSelectionBackground",
-    "ghost_element.selected": "list.activeSelectionBackground",
-    "ghost_element.disabled": "disabledForeground",
-    
-    "text": "editor.foreground",
-    "text.muted": "descriptionForeground",
-    "text.placeholder": "input.placeholderForeground",
-    "text.disabled": "disabledForeground",
-    "text.accent": "textLink.foreground",
-    
-    "icon": "icon.foreground",
-    "icon.muted": "foreground",
-    "icon.disabled": "disabledForeground",
-    "icon.placeholder": "input.placeholderForeground",
-    "icon.accent": "activityBarBadge.background",
-    
-    "status_bar.background": "statusBar.background",
-    "title_bar.background": "titleBar.activeBackground",
-    "title_bar.inactive_background": "titleBar.inactiveBackground",
-    "toolbar.background": "breadcrumb.background",
-    "tab_bar.background": "editorGroupHeader.tabsBackground",
-    "tab.inactive_background": "tab.inactiveBackground",
-    "tab.active_background": "tab.activeBackground",
-    
-    "search.match_background": "editor.findMatchBackground",
-    "panel.background": "panel.background",
-    "panel.focused_border": "focusBorder",
-    "panel.indent_guide": "editorIndentGuide.background",
-    "panel.indent_guide_active": "editorIndentGuide.activeBackground",
-    "panel.indent_guide_hover": "editorIndentGuide.activeBackground",
-    
-    "pane.focused_border": "focusBorder",
-    "pane_group.border": "editorGroup.border",
-    
-    "scrollbar.thumb.background": "scrollbarSlider.background",
-    "scrollbar.thumb.hover_background": "scrollbarSlider.hoverBackground",
-    "scrollbar.thumb.border": "scrollbarSlider.background",
-    "scrollbar.track.background": "editor.background",
-    "scrollbar.track.border": "editor.background",
-    
-    "editor.foreground": "editor.foreground",
-    "editor.background": "editor.background",
-    "editor.gutter.background": "editorGutter.background",
-    "editor.subheader.background": "editorWidget.background",
-    "editor.active_line.background": "editor.lineHighlightBackground",
-    "editor.highlighted_line.background": "editor.lineHighlightBackground",
-    "editor.line_number": "editorLineNumber.foreground",
-    "editor.active_line_number": "editorLineNumber.activeForeground",
-    "editor.invisible": "editorWhitespace.foreground",
-    "editor.wrap_guide": "editorIndentGuide.background",
-    "editor.active_wrap_guide": "editorIndentGuide.activeBackground",
-    
-    "editor.document_highlight.read_background": "editor.selectionBackground",
-    "editor.document_highlight.write_background": "editor.selectionBackground",
-    "editor.document_highlight.bracket_background": "editorBracketMatch.background",
-    
-    "editor.indent_guide": "editorIndentGuide.background",
-    "editor.indent_guide_active": "editorIndentGuide.activeBackground",
-    
-    "link_text.hover": "textLink.activeForeground",
-    
-    "conflict": "gitDecoration.conflictingResourceForeground",
-    "conflict.background": "diffEditor.removedTextBackground", # Approximate
-    "conflict.border": "gitDecoration.conflictingResourceForeground",
-    
-    "created": "gitDecoration.addedResourceForeground",
-    "created.background": "diffEditor.insertedTextBackground",
-    "created.border": "gitDecoration.addedResourceForeground",
-    
-    "deleted": "gitDecoration.deletedResourceForeground",
-    "deleted.background": "diffEditor.removedTextBackground",
-    "deleted.border": "gitDecoration.deletedResourceForeground",
-    
-    "error": "editorError.foreground",
-    "error.background": "inputValidation.errorBackground",
-    "error.border": "inputValidation.errorBorder",
-    
-    "hidden": "editorWhitespace.foreground",
-    "hidden.background": "editor.background",
-    "hidden.border": "editorWhitespace.foreground",
-    
-    "hint": "editorHint.foreground",
-    "hint.background": "editor.background",
-    "hint.border": "editorHint.border",
-    
-    "ignored": "gitDecoration.ignoredResourceForeground",
-    "ignored.background": "editor.background",
-    "ignored.border": "gitDecoration.ignoredResourceForeground",
-    
-    "info": "editorInfo.foreground",
-    "info.background": "inputValidation.infoBackground",
-    "info.border": "inputValidation.infoBorder",
-    
-    "modified": "gitDecoration.modifiedResourceForeground",
-    "modified.background": "editor.background",
-    "modified.border": "gitDecoration.modifiedResourceForeground",
-    
-    "predictive": "editorGhostText.foreground",
-    "predictive.background": "editor.background",
-    "predictive.border": "editorGhostText.foreground",
-    
-    "renamed": "gitDecoration.renamedResourceForeground",
-    "renamed.background": "editor.background",
-    "renamed.border": "gitDecoration.renamedResourceForeground",
-    
-    "success": "debugIcon.startForeground", # Fallback
-    "success.background": "editor.background",
-    "success.border": "debugIcon.startForeground",
-    
-    "unreachable": "editorUnnecessaryCode.opacity",
-    "unreachable.border": "editorUnnecessaryCode.border",
-    
-    "warning": "editorWarning.foreground",
-    "warning.background": "inputValidation.warningBackground",
-    "warning.border": "inputValidation.warningBorder",
-}
-
-def main():
-    print("Loading files...")
-    dracula = load_json(DRACULA_PATH)
-    moonlight = load_json(CURRENT_THEME_PATH)
-    vscode = load_json(VSCODE_THEME_PATH)
-    
-    dracula_theme = dracula['themes'][0]
-    moonlight_theme = moonlight['themes'][0]
-    vscode_colors = vscode.get('colors', {})
-    
-    # Target structure
-    target_style = moonlight_theme['style']
-    
-    # 1. Expand UI Keys
-    print("Expanding UI keys...")
-    dracula_style = dracula_theme['style']
-    
+def expand_ui_keys(dracula_style, target_style, vscode_colors, stats=NO_PROFILE, verbose=False):
+    # Fills keys the reference has and the target lacks from the fallback
+    # graph in mapping.jsonc. One pass resolves every key in dependency
+    # order; references to other Zed keys read the target's own values
+    # first, so filled keys stay consistent with what the theme already has.
+    resolved = resolve(vscode_colors, target_style)
+    unresolved = []
     for key, val in dracula_style.items():
         if key == "syntax" or key == "players" or key == "accents":
             continue
             
         if key not in target_style:
             # Missing key, try to fill it
-            print(f"  Adding missing key: {key}")
+            if verbose:
+                print(f"  Adding missing key: {key}")
+            stats.count("keys_missing")
             
-            # Check explicit mapping
-            if key in EXPANDED_MAPPING:
-                mapped_vs_key = EXPANDED_MAPPING[key]
-                if mapped_vs_key in vscode_colors:
-                    target_style[key] = vscode_colors[mapped_vs_key]
-                elif mapped_vs_key.startswith("#"): # static color
-                     target_style[key] = mapped_vs_key
-                elif mapped_vs_key in ["opaque", "transparent", "blurred"]:
-                    target_style[key] = mapped_vs_key
-                else:
-                    # Try to infer from usage type (border, background, text) to provide sensible default
-                    # if we can't map it.
-                    if "border" in key:
-                         target_style[key] = vscode_colors.get("focusBorder", "#00000000")
-                    elif "background" in key:
-                        target_style[key] = vscode_colors.get("editor.background", "#000000")
-                    elif "foreground" in key or "text" in key:
-                        target_style[key] = vscode_colors.get("editor.foreground", "#888888")
-                    else:
-                        # Use Dracula's value if structure compatible (strings mostly)
-                        # But Dracula colors might be wrong hue. Be careful.
-                        pass
-                        
-            # Special logic for terminal ansi if missing
-            if key.startswith("terminal.ansi") and key not in target_style:
-                 # Map camelCase from VSCode
-                 vs_ansi = key.replace("terminal.ansi.", "terminal.ansi")
-                 parts = vs_ansi.split("ansi")
-                 if len(parts) > 1:
-                     # terminal.ansi.bright_red -> terminal.ansiBrightRed
-                     suffix = parts[1]
-                     # handle underscore to Camel
-                     suffix_parts = suffix.split("_")
-                     camel_suffix = "".join([x.capitalize() for x in suffix_parts])
-                     vs_key = f"terminal.ansi{camel_suffix}"
-                     
-                     # manual corrections
-                     if "Bright" in vs_key and not "Bright" in key.replace("_", ""):
-                         # logic fix
-                         pass
-                     
-                     # Simple map for standard keys
-                     simple_map = {
-                         "terminal.ansi.black": "terminal.ansiBlack",
-                         "terminal.ansi.red": "terminal.ansiRed",
-                         "terminal.ansi.green": "terminal.ansiGreen",
-                         "terminal.ansi.yellow": "terminal.ansiYellow",
-                         "terminal.ansi.blue": "terminal.ansiBlue",
-                         "terminal.ansi.magenta": "terminal.ansiMagenta",
-                         "terminal.ansi.cyan": "terminal.ansiCyan",
-                         "terminal.ansi.white": "terminal.ansiWhite",
-                         "terminal.ansi.bright_black": "terminal.ansiBrightBlack",
-                         "terminal.ansi.bright_red": "terminal.ansiBrightRed",
-                         "terminal.ansi.bright_green": "terminal.ansiBrightGreen",
-                         "terminal.ansi.bright_yellow": "terminal.ansiBrightYellow",
-                         "terminal.ansi.bright_blue": "terminal.ansiBrightBlue",
-                         "terminal.ansi.bright_magenta": "terminal.ansiBrightMagenta",
-                         "terminal.ansi.bright_cyan": "terminal.ansiBrightCyan",
-                         "terminal.ansi.bright_white": "terminal.ansiBrightWhite"
-                     }
-                     if key in simple_map:
-                         if simple_map[key] in vscode_colors:
-                             target_style[key] = vscode_colors[simple_map[key]]
+            if key in resolved:
+                value, how = resolved[key]
+                target_style[key] = value
+                stats.count(f"keys_filled_{how}")
+            else:
+                unresolved.append(key)
+                stats.count("keys_unmapped")
+    
+    if unresolved and verbose:
+        print(f"  Left unresolved ({len(unresolved)}): {', '.join(unresolved)}")
+    return unresolved
 
-    # 2. Expand Syntax Keys
-    print("Expanding Syntax keys...")
-    dracula_syntax = dracula_style['syntax']
-    target_syntax = target_style['syntax']
-    
+def expand_syntax_keys(dracula_syntax, target_syntax, vscode_colors, stats=NO_PROFILE, default_color="#ffffff",
+                       verbose=False):
     for key, val in dracula_syntax.items():
         if key not in target_syntax:
-            print(f"  Adding missing syntax: {key}")
+            if verbose:
+                print(f"  Adding missing syntax: {key}")
+            stats.count("syntax_filled_fallback")
             # Initialize with default structure
             target_syntax[key] = {
-                "color": vscode_colors.get("editor.foreground"), # Default fallback
+                # Default fallback; a null color is invalid in a Zed theme
+                "color": vscode_colors.get("editor.foreground") or default_color,
                 "font_style": None,
                 "font_weight": None
             }
@@ -267,14 +65,40 @@ def main():
             
             # Map specific missing keys
             if key == "variable.special": 
-                target_syntax[key]["color"] = vscode_colors.get("editor.foreground") # Default
+                target_syntax[key]["color"] = vscode_colors.get("editor.foreground") or default_color # Default
                 # In convert_theme we mapped variable.language to this.
                 
             # If we really can't find a color, defaulting to foreground is safe, 
             # as it wont be invisible.
+
+def expand(zed, reference, vscode, stats=NO_PROFILE, verbose=False):
+    # In-memory expansion: returns a copy of the Zed theme family `zed` with
+    # the keys present in `reference` (a Zed theme such as the Dracula
+    # example) filled from the VS Code theme `vscode`. Each argument may be a
+    # dict or JSON/JSONC str or bytes. verbose prints each key as it is
+    # filled; otherwise nothing is printed.
+    zed, reference, vscode = [doc if isinstance(doc, dict) else loads(doc) for doc in (zed, reference, vscode)]
+    zed = copy.deepcopy(zed)
+    
+    reference_style = reference['themes'][0]['style']
+    target_style = zed['themes'][0]['style']
+    vscode_colors = vscode.get('colors', {})
+    
+    # 1. Expand UI Keys
+    if verbose:
+        print("Expanding UI keys...")
+    with stats.stage("expand_ui"):
+        expand_ui_keys(reference_style, target_style, vscode_colors, stats, verbose)
+
+    # 2. Expand Syntax Keys
+    if verbose:
+        print("Expanding Syntax keys...")
+    with stats.stage("expand_syntax"):
+        expand_syntax_keys(reference_style['syntax'], target_style['syntax'], vscode_colors, stats,
+                           target_style.get("editor.foreground") or target_style.get("text") or "#ffffff", verbose)
             
     # 3. Ensure Players (User wants full structure)
-    if "players" not in target_style or len(target_style["players"]) < len(dracula_style["players"]):
+    if "players" not in target_style or len(target_style["players"]) < len(reference_style["players"]):
         # Add players up to Dracula count?
         # Dracula has 7 players. Moonlight has 1.
         # Let's just ensure we have "players" key. (Already present)
@@ -286,11 +110,46 @@ def main():
         # Populate with copies if needed, but usually 1 is fine for local. 
         # But user said "add all other parameters".
         pass
+    
+    return zed
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill keys missing from a Zed theme using the Dracula example as reference.")
+    parser.add_argument("--reference", default=DRACULA_PATH,
+                        help=f"Zed theme listing the keys to fill (default: {DRACULA_PATH})")
+    parser.add_argument("--theme", default=CURRENT_THEME_PATH,
+                        help=f"Zed theme to expand (default: {CURRENT_THEME_PATH})")
+    parser.add_argument("--vscode", default=VSCODE_THEME_PATH,
+                        help=f"VS Code theme the colors come from (default: {VSCODE_THEME_PATH})")
+    parser.add_argument("--output",
+                        help="where to write the expanded theme (default: overwrite --theme)")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write per-stage timings and counters to a JSON report")
+    args = parser.parse_args()
+    stats = Profile(enabled=bool(args.profile))
+    
+    print("Loading files...")
+    with stats.stage("parse"):
+        reference = load_json(args.reference)
+        theme = load_json(args.theme)
+        vscode = load_json(args.vscode)
+    
+    expanded = expand(theme, reference, vscode, stats, verbose=True)
 
     # Write back
-    with open(CURRENT_THEME_PATH, 'w') as f:
-        json.dump(moonlight, f, indent=2)
+    with stats.stage("write"):
+        with open(args.output or args.theme, 'w') as f:
+            json.dump(expanded, f, indent=2)
     print("Done expanding theme.")
+    problems = validate(expanded)
+    for problem in problems:
+        print(f"  Schema: {problem}")
+    for warning in [] if problems else lint(expanded):
+        print(f"  Warning: {warning}")
+    
+    if args.profile:
+        write_report(args.profile, {expanded.get("name"): stats.as_dict()})
+        print(f"Wrote profile to {args.profile}")
 
 if __name__ == "__main__":
     main()
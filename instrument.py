@@ -0,0 +1,54 @@
+import json
+import time
+from contextlib import contextmanager
+
+# Stage timers and counters for convert_theme.py and expand_theme.py.
+#
+# A disabled Profile does no timing and ignores counts, so callers can pass
+# one down unconditionally. Inner loops should keep plain local counts and
+# report them once with count(), not call it per item.
+
+
+class Profile:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.timers = {}
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] = self.timers.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def as_dict(self):
+        return {
+            "timers_ms": {name: round(seconds * 1000, 3) for name, seconds in self.timers.items()},
+            "counters": dict(self.counters),
+        }
+
+
+def merge(reports):
+    # Sums per-theme as_dict() reports into one total
+    total = {"timers_ms": {}, "counters": {}}
+    for report in reports:
+        for section in ("timers_ms", "counters"):
+            for name, value in report[section].items():
+                total[section][name] = total[section].get(name, 0) + value
+    total["timers_ms"] = {name: round(ms, 3) for name, ms in total["timers_ms"].items()}
+    return total
+
+
+def write_report(path, reports):
+    # reports: label -> as_dict()
+    with open(path, 'w') as f:
+        json.dump({"themes": reports, "total": merge(reports.values())}, f, indent=2)
@@ -0,0 +1,102 @@
+import json
+import re
+
+# JSON with comments (// and /* */) and trailing commas, as used by VS Code
+# theme files. Shared by convert_theme.py and expand_theme.py.
+#
+# strip() walks the text once. _PLAIN consumes everything that needs no
+# rewriting (including whole string literals and ordinary commas) in C, so
+# Python only runs at comments and possible trailing commas. Those are
+# replaced with spaces rather than removed, and newlines are kept, so every
+# offset in the cleaned text is the same offset in the source and json's
+# error positions point at the original file.
+
+_PLAIN = re.compile(r'(?:[^"/,]+|"[^"\\]*(?:\\.[^"\\]*)*"|,(?![ \t\r\n]*[}\]/]))*', re.S)
+_NOT_NEWLINE = re.compile(r'[^\n]')
+_WHITESPACE = " \t\r\n"
+
+
+def _comment_end(text, i):
+    # Returns the end of the comment starting at i, or None if there is none
+    nxt = text[i + 1:i + 2]
+    if nxt == "/":
+        end = text.find("\n", i)
+        return len(text) if end == -1 else end
+    if nxt == "*":
+        end = text.find("*/", i + 2)
+        return len(text) if end == -1 else end + 2
+    return None
+
+
+def _next_significant(text, i):
+    # Skips whitespace and comments after a comma
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c in _WHITESPACE:
+            i += 1
+        elif c == "/":
+            end = _comment_end(text, i)
+            if end is None:
+                return i
+            i = end
+        else:
+            return i
+    return i
+
+
+def strip(text):
+    out = []
+    copied = 0
+    n = len(text)
+    plain = _PLAIN.match
+    i = plain(text, 0).end()
+    while i < n:
+        c = text[i]
+        if c == "/":
+            end = _comment_end(text, i)
+            if end is None:
+                end = i + 1
+            else:
+                out.append(text[copied:i])
+                out.append(_NOT_NEWLINE.sub(" ", text[i:end]))
+                copied = end
+        elif c == ",":
+            k = _next_significant(text, i + 1)
+            if k < n and text[k] in "}]":
+                out.append(text[copied:i])
+                out.append(" ")
+                copied = i + 1
+            end = i + 1
+        else:
+            # Unterminated string, leave it for json to report
+            break
+        i = plain(text, end).end()
+    if not out:
+        return text
+    out.append(text[copied:])
+    return "".join(out)
+
+
+def loads(text):
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode("utf-8")
+    try:
+        # Strict load first (fast path for plain JSON like package.json)
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return json.loads(strip(text))
+    except json.JSONDecodeError as e:
+        # Same offsets, so line/column are computed against the source
+        raise json.JSONDecodeError(e.msg, text, e.pos) from None
+
+
+def load(path):
+    with open(path, 'r') as f:
+        content = f.read()
+    try:
+        return loads(content)
+    except json.JSONDecodeError as e:
+        raise json.JSONDecodeError(f"{path}: {e.msg}", e.doc, e.pos) from None
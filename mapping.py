@@ -0,0 +1,258 @@
+import argparse
+import hashlib
+import os
+import pickle
+
+import colormath
+from jsonc import loads
+
+# The VS Code <-> Zed mapping tables, compiled from mapping.jsonc.
+#
+# convert_theme.py, expand_theme.py and reverse_theme.py all read the same
+# compiled tables, so they cannot drift apart. Compiling turns every fallback
+# chain into a tuple of typed sources and builds the scope lookup indexes.
+#
+# `python mapping.py --compile` pickles the result next to the spec, behind
+# a header line naming COMPILER_VERSION and the spec's hash. Importing this
+# module reads that cache only when the header matches, and otherwise (no
+# cache, a stale one, any read error) compiles in memory. Importing never
+# writes to the source tree, so worker processes and read-only checkouts
+# behave the same.
+#
+# Chains may refer to other Zed keys ("@border"), which makes the UI table a
+# dependency graph. It is ordered topologically at compile time (a cycle is
+# a compile error), so resolve() is a single pass in which every reference
+# is already computed.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SPEC_PATH = os.path.join(BASE_DIR, "mapping.jsonc")
+CACHE_PATH = os.path.join(BASE_DIR, ".mapping-cache.pickle")
+
+# Bump when the compiled layout changes
+COMPILER_VERSION = 2
+
+# Non-color values Zed accepts for background.appearance
+LITERALS = ("opaque", "transparent", "blurred")
+
+DERIVE_OPERATIONS = {
+    "tint": lambda fg, bg, t: colormath.tint(bg, fg, t),
+    "mix": lambda fg, bg, t: colormath.mix(bg, fg, t),
+}
+
+
+def compile_operand(zed_key, operand):
+    if not isinstance(operand, str):
+        raise ValueError(f"{zed_key}: invalid operand {operand!r}")
+    if operand.startswith("@"):
+        return ("ref", operand[1:])
+    return ("key", operand)
+
+
+def compile_source(zed_key, source):
+    # One chain element -> ("key", vs_key), ("ref", zed_key),
+    # ("literal", value) or (operation, fg, bg, amount) with fg and bg as
+    # ("key", ...) or ("ref", ...)
+    if isinstance(source, dict):
+        if len(source) != 1:
+            raise ValueError(f"{zed_key}: a derived source needs exactly one operation, got {source}")
+        (op, args), = source.items()
+        if op not in DERIVE_OPERATIONS:
+            raise ValueError(f"{zed_key}: unknown operation {op!r}")
+        fg, bg, amount = args
+        return (op, compile_operand(zed_key, fg), compile_operand(zed_key, bg), float(amount))
+    if not isinstance(source, str):
+        raise ValueError(f"{zed_key}: invalid source {source!r}")
+    if source.startswith("#") or source in LITERALS:
+        return ("literal", source)
+    return compile_operand(zed_key, source)
+
+
+def references(chain):
+    # Zed keys a compiled chain refers to
+    for source in chain:
+        if source[0] == "ref":
+            yield source[1]
+        elif source[0] in DERIVE_OPERATIONS:
+            for operand in source[1:3]:
+                if operand[0] == "ref":
+                    yield operand[1]
+
+
+def resolution_order(ui):
+    # Depth-first topological sort of the Zed keys, dependencies first.
+    # Keys keep their spec order where the graph allows, so the result is
+    # deterministic. Raises ValueError on unknown references and cycles.
+    chains = dict(ui)
+    order = []
+    state = {}  # key -> "visiting" or "done"
+
+    def visit(key, path):
+        if state.get(key) == "done":
+            return
+        if state.get(key) == "visiting":
+            cycle = path[path.index(key):] + [key]
+            raise ValueError(f"fallback cycle: {' -> '.join(cycle)}")
+        state[key] = "visiting"
+        for ref in references(chains[key]):
+            if ref not in chains:
+                raise ValueError(f"{key}: reference to unknown key @{ref}")
+            visit(ref, path + [key])
+        state[key] = "done"
+        order.append((key, chains[key]))
+
+    for key, _ in ui:
+        visit(key, [])
+    return tuple(order)
+
+
+# Longest-prefix index over the syntax table, split on dot segments.
+# Each node is a dict of segment -> child node; the value of a mapping key
+# is stored under the None key of its last segment's node.
+def build_scope_index(mapping):
+    root = {}
+    for vs_scope, zed_val in mapping.items():
+        node = root
+        for part in vs_scope.split("."):
+            node = node.setdefault(part, {})
+        node[None] = zed_val
+    return root
+
+
+# Every dot-prefix of every syntax table key -> (Zed key, mapping key).
+# A selector such as "keyword" applies to the scope "keyword.operator" in
+# TextMate, so it is a candidate for every Zed key whose scope it prefixes.
+def build_prefix_index(mapping):
+    index = {}
+    for vs_scope, zed_val in mapping.items():
+        zed_keys = zed_val if isinstance(zed_val, list) else [zed_val]
+        parts = vs_scope.split(".")
+        for i in range(1, len(parts) + 1):
+            prefix = ".".join(parts[:i])
+            for zed_key in zed_keys:
+                index.setdefault(prefix, []).append((zed_key, vs_scope))
+    return index
+
+
+def compile_spec(spec, digest):
+    ui = tuple(
+        (zed_key, tuple(compile_source(zed_key, s) for s in (chain if isinstance(chain, list) else [chain])))
+        for zed_key, chain in spec["ui"].items())
+    syntax = spec["syntax"]
+    return {
+        "version": COMPILER_VERSION,
+        "hash": digest,
+        "ui": ui,
+        "resolution_order": resolution_order(ui),
+        "syntax": syntax,
+        "scope_index": build_scope_index(syntax),
+        "prefix_index": build_prefix_index(syntax),
+    }
+
+
+def cache_header(digest):
+    return f"blank-theme-mapping {COMPILER_VERSION} {digest}\n".encode()
+
+
+def read_cache(cache_path, digest):
+    # The compiled tables, or None unless the cache was built from this
+    # spec by this compiler. The header is checked before anything is
+    # unpickled.
+    try:
+        with open(cache_path, 'rb') as f:
+            if f.readline() != cache_header(digest):
+                return None
+            compiled = pickle.load(f)
+        if compiled.get("version") == COMPILER_VERSION and compiled.get("hash") == digest:
+            return compiled
+    except Exception:
+        pass
+    return None
+
+
+def load(spec_path=SPEC_PATH, cache_path=CACHE_PATH):
+    with open(spec_path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    compiled = read_cache(cache_path, digest)
+    if compiled is None:
+        compiled = compile_spec(loads(data), digest)
+    return compiled
+
+
+def write_cache(spec_path=SPEC_PATH, cache_path=CACHE_PATH):
+    # Compiles the spec and writes the cache; a temporary file first, so a
+    # concurrent reader never sees a partial one
+    with open(spec_path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    compiled = compile_spec(loads(data), digest)
+    tmp_path = f"{cache_path}.{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(cache_header(digest))
+        pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return compiled
+
+
+MAPPING = load()
+UI_CHAINS = MAPPING["ui"]
+RESOLUTION_ORDER = MAPPING["resolution_order"]
+SYNTAX_MAPPING = MAPPING["syntax"]
+
+
+def resolve(vscode_colors, existing=None, order=RESOLUTION_ORDER):
+    # Walks each Zed key's chain against a VS Code colors dict, dependencies
+    # first. `existing` holds Zed values already known (such as the theme
+    # being expanded); a reference reads those before the resolved ones.
+    # Returns Zed key -> (value, how): "derived" for a computed color,
+    # "mapped" for the first plain source, "fallback" for a later one. Keys
+    # whose chain does not resolve are left out.
+    existing = existing or {}
+    resolved = {}
+
+    def lookup(operand):
+        kind, name = operand
+        if kind == "key":
+            return vscode_colors.get(name)
+        if name in existing:
+            return existing[name]
+        return resolved[name][0] if name in resolved else None
+
+    for zed_key, chain in order:
+        plain = 0
+        for source in chain:
+            kind = source[0]
+            if kind == "literal":
+                resolved[zed_key] = (source[1], "fallback" if plain else "mapped")
+                break
+            if kind in DERIVE_OPERATIONS:
+                _, fg_operand, bg_operand, amount = source
+                fg = colormath.parse(lookup(fg_operand))
+                bg = colormath.parse(lookup(bg_operand))
+                if fg is not None and bg is not None:
+                    resolved[zed_key] = (colormath.to_hex(DERIVE_OPERATIONS[kind](fg, bg, amount)), "derived")
+                    break
+                continue
+            value = lookup(source)
+            if value is not None:
+                resolved[zed_key] = (value, "fallback" if plain else "mapped")
+                break
+            plain += 1
+    return resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile mapping.jsonc into the cache the converters load.")
+    parser.add_argument("--compile", action="store_true",
+                        help=f"write {os.path.basename(CACHE_PATH)} next to the spec")
+    args = parser.parse_args()
+    if not args.compile:
+        parser.print_help()
+        return
+    compiled = write_cache()
+    print(f"Compiled {len(compiled['ui'])} UI chains and {len(compiled['syntax'])} syntax scopes "
+          f"to {CACHE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,294 +1,271 @@
--- Blank-Ghibli.lua - Enhanced for Neovim
-vim.cmd[[highlight clear]]
-
-local highlight = function(group, bg, fg, attr)
-    fg = fg and 'guifg=' .. fg or ''
-    bg = bg and 'guibg=' .. bg or ''
-    attr = attr and 'gui=' .. attr or ''
-
-    vim.api.nvim_command('highlight ' .. group .. ' '.. fg .. ' ' .. bg .. ' '.. attr)
-end
-
-local link = function(target, group)
-    vim.api.nvim_command('highlight! link ' .. target .. ' '.. group)
+-- Blank-Ghibli.lua - generated by convert_theme.py from vscode-themes/Blank-Ghibli.json.
+-- Do not edit by hand; rerun convert_theme.py --neovim instead.
+vim.cmd("highlight clear")
+if vim.fn.exists("syntax_on") == 1 then
+  vim.cmd("syntax reset")
 end
+vim.g.colors_name = "Blank-Ghibli"
 
--- Core color palette
-local black = '#000000'       -- True black background
-local dark_gray = '#111216'   -- Slightly lighter black for UI elements
-local comment_gray = '#43444D'
-local light_gray = '#575861'
-local text_gray = '#868690'
-local inactive_gray = '#131317'
-
--- Ghibli-specific accent colors
-local green = '#648f68'       -- Forest green
-local blue = '#5c87a4'        -- Muted blue
-local brown = '#a27e57'       -- Earthy brown
-local coral = '#da674b'       -- Reddish coral
-local teal = '#829fa7'        -- Blue-gray teal
-local yellow = '#e8b246'      -- Warm yellow
-
--- Additional UI colors
-local transparent = '#0000'
-local selection_bg = '#817c9c26'
-local highlight_bg = '#817c9c14'
-local diff_add_bg = '#070a0c'
-local diff_change_bg = '#0a0c0d'
-local diff_delete_bg = '#0a090c'
-
--- Core editor elements
-highlight('Normal', black, text_gray, nil)
-highlight('NormalFloat', dark_gray, text_gray, nil)
-highlight('EndOfBuffer', black, comment_gray, nil)
-highlight('Cursor', nil, blue, nil)
-highlight('CursorLine', inactive_gray, nil, nil)
-highlight('CursorColumn', inactive_gray, nil, nil)
-highlight('ColorColumn', inactive_gray, nil, nil)
-highlight('SignColumn', black, nil, nil)
-highlight('LineNr', nil, light_gray, nil)
-highlight('CursorLineNr', nil, brown, nil)
-highlight('VertSplit', nil, light_gray, nil)
-highlight('WinSeparator', nil, light_gray, nil) -- Neovim 0.9+
-highlight('Folded', black, comment_gray, nil)
-highlight('FoldColumn', black, light_gray, nil)
-
--- Status line and tabs
-highlight('StatusLine', light_gray, black, nil)
-highlight('StatusLineNC', black, light_gray, nil)
-highlight('TabLine', transparent, light_gray, nil)
-highlight('TabLineSel', yellow, dark_gray, nil)
-highlight('TabLineFill', transparent, light_gray, nil)
-
--- Popups and menus
-highlight('Pmenu', black, text_gray, nil)
-highlight('PmenuSel', text_gray, dark_gray, nil)
-highlight('PmenuSbar', dark_gray, nil, nil)
-highlight('PmenuThumb', black, text_gray, nil)
-highlight('WildMenu', black, text_gray, nil)
-highlight('Question', nil, brown, nil)
-highlight('Title', nil, brown, 'bold')
-
--- Search and selection
-highlight('Visual', inactive_gray, nil, nil)
-highlight('VisualNOS', inactive_gray, nil, 'underline')
-highlight('Search', selection_bg, text_gray, nil)
-highlight('IncSearch', brown, black, nil)
-highlight('MatchParen', selection_bg, nil, 'bold')
-
--- Diagnostics and errors
-highlight('Error', nil, coral, nil)
-highlight('ErrorMsg', nil, coral, nil)
-highlight('WarningMsg', nil, yellow, nil)
-highlight('DiagnosticError', nil, coral, nil)
-highlight('DiagnosticWarn', nil, yellow, nil)
-highlight('DiagnosticInfo', nil, blue, nil)
-highlight('DiagnosticHint', nil, green, nil)
-highlight('DiagnosticUnderlineError', nil, nil, 'undercurl,fg=' .. coral)
-highlight('DiagnosticUnderlineWarn', nil, nil, 'undercurl,fg=' .. yellow)
-highlight('DiagnosticUnderlineInfo', nil, nil, 'undercurl,fg=' .. blue)
-highlight('DiagnosticUnderlineHint', nil, nil, 'undercurl,fg=' .. green)
-highlight('DiagnosticVirtualTextError', nil, coral, nil)
-highlight('DiagnosticVirtualTextWarn', nil, yellow, nil)
-highlight('DiagnosticVirtualTextInfo', nil, blue, nil)
-highlight('DiagnosticVirtualTextHint', nil, green, nil)
-highlight('DiagnosticFloatingError', nil, coral, nil)
-highlight('DiagnosticFloatingWarn', nil, yellow, nil)
-highlight('DiagnosticFloatingInfo', nil, blue, nil)
-highlight('DiagnosticFloatingHint', nil, green, nil)
-highlight('DiagnosticSignError', nil, coral, nil)
-highlight('DiagnosticSignWarn', nil, yellow, nil)
-highlight('DiagnosticSignInfo', nil, blue, nil)
-highlight('DiagnosticSignHint', nil, green, nil)
-
--- Diffs
-highlight('DiffAdd', diff_add_bg, nil, nil)
-highlight('DiffChange', diff_change_bg, nil, nil)
-highlight('DiffDelete', diff_delete_bg, nil, nil)
-highlight('DiffText', nil, text_gray, nil)
-
--- Syntax highlighting
-highlight('Comment', nil, comment_gray, 'italic')
-highlight('Constant', nil, green, nil)
-highlight('Number', nil, brown, nil)
-highlight('String', nil, coral, nil)
-highlight('Identifier', nil, brown, 'italic')
-highlight('Function', nil, teal, 'italic')
-highlight('Statement', nil, green, nil)
-highlight('Keyword', nil, green, nil)
-highlight('Operator', nil, green, nil)
-highlight('PreProc', nil, green, nil)
-highlight('Type', nil, blue, nil)
-highlight('Special', nil, teal, nil)
-highlight('Underlined', nil, blue, 'underline')
-highlight('Todo', nil, yellow, 'bold')
-
--- TreeSitter specific
-highlight('TSPunctDelimiter', nil, text_gray, nil)
-highlight('TSVariable', nil, brown, 'italic')
-highlight('TSType', nil, blue, nil)
-highlight('TSFunction', nil, teal, 'italic')
-highlight('TSComment', nil, comment_gray, 'italic')
-highlight('TSString', nil, coral, nil)
-highlight('TSKeyword', nil, green, nil)
-highlight('TSOperator', nil, green, nil)
+local groups = {
+  Normal = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  NormalFloat = { fg = "#868690", bg = "#111216", ctermfg = 102, ctermbg = 233 },
+  NormalNC = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  EndOfBuffer = { fg = "#43444d", bg = "#000000", ctermfg = 238, ctermbg = 16 },
+  Cursor = { fg = "#5c87a4", ctermfg = 67 },
+  CursorLine = { bg = "#131317", ctermbg = 233 },
+  CursorColumn = { bg = "#131317", ctermbg = 233 },
+  ColorColumn = { bg = "#131317", ctermbg = 233 },
+  SignColumn = { bg = "#000000", ctermbg = 16 },
+  LineNr = { fg = "#575861", ctermfg = 240 },
+  CursorLineNr = { fg = "#a27e57", ctermfg = 137 },
+  WinSeparator = { fg = "#575861", ctermfg = 240 },
+  VertSplit = { fg = "#575861", ctermfg = 240 },
+  Folded = { fg = "#43444d", bg = "#000000", ctermfg = 238, ctermbg = 16 },
+  FoldColumn = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  NonText = { link = "Comment" },
+  Whitespace = { link = "Comment" },
+  Directory = { fg = "#e8b246", ctermfg = 221 },
+  Title = { fg = "#a27e57", ctermfg = 137, bold = true },
+  StatusLine = { fg = "#000000", bg = "#575861", ctermfg = 16, ctermbg = 240 },
+  StatusLineNC = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  TabLine = { fg = "#575861", ctermfg = 240 },
+  TabLineSel = { fg = "#111216", bg = "#e8b246", ctermfg = 233, ctermbg = 221 },
+  TabLineFill = { fg = "#575861", ctermfg = 240 },
+  WinBar = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  WinBarNC = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  Pmenu = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  PmenuSel = { fg = "#111216", bg = "#868690", ctermfg = 233, ctermbg = 102 },
+  PmenuSbar = { bg = "#111216", ctermbg = 233 },
+  PmenuThumb = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  FloatBorder = { fg = "#575861", ctermfg = 240 },
+  FloatTitle = { fg = "#e8b246", bg = "#111216", ctermfg = 221, ctermbg = 233, bold = true },
+  Visual = { bg = "#131317", ctermbg = 233 },
+  Search = { fg = "#868690", bg = "#131217", ctermfg = 102, ctermbg = 233 },
+  CurSearch = { bg = "#27252f", ctermbg = 235 },
+  IncSearch = { fg = "#000000", bg = "#a27e57", ctermfg = 16, ctermbg = 137 },
+  MatchParen = { bg = "#131217", ctermbg = 233, bold = true },
+  Error = { fg = "#da674b", ctermfg = 209 },
+  ErrorMsg = { fg = "#da674b", ctermfg = 209 },
+  WarningMsg = { fg = "#e8b246", ctermfg = 221 },
+  DiagnosticError = { fg = "#da674b", ctermfg = 209 },
+  DiagnosticWarn = { fg = "#e8b246", ctermfg = 221 },
+  DiagnosticInfo = { fg = "#5c87a4", ctermfg = 67 },
+  DiagnosticHint = { fg = "#648f68", ctermfg = 65 },
+  DiagnosticUnderlineError = { sp = "#da674b", undercurl = true },
+  DiagnosticUnderlineWarn = { sp = "#e8b246", undercurl = true },
+  DiagnosticUnderlineInfo = { sp = "#5c87a4", undercurl = true },
+  DiagnosticUnderlineHint = { sp = "#648f68", undercurl = true },
+  LspInlayHint = { fg = "#43444d", bg = "#111216", ctermfg = 238, ctermbg = 233, italic = true },
+  LspCodeLens = { fg = "#43444d", ctermfg = 238, italic = true },
+  LspReferenceText = { bg = "#131217", ctermbg = 233 },
+  LspReferenceRead = { bg = "#131217", ctermbg = 233 },
+  LspReferenceWrite = { bg = "#131217", ctermbg = 233, bold = true },
+  DiffAdd = { bg = "#070a0c", ctermbg = 232 },
+  DiffDelete = { bg = "#0a090c", ctermbg = 232 },
+  DiffChange = { bg = "#0a0c0d", ctermbg = 232 },
+  DiffText = { fg = "#868690", ctermfg = 102 },
+  Added = { fg = "#5c87a4", ctermfg = 67 },
+  Changed = { fg = "#a27e57", ctermfg = 137 },
+  Removed = { fg = "#829fa7", ctermfg = 109 },
+  Comment = { fg = "#43444d", ctermfg = 238, italic = true },
+  Constant = { fg = "#648f68", ctermfg = 65 },
+  String = { fg = "#da674b", ctermfg = 209 },
+  Character = { fg = "#da674b", ctermfg = 209 },
+  Number = { fg = "#a27e57", ctermfg = 137 },
+  Float = { fg = "#a27e57", ctermfg = 137 },
+  Boolean = { fg = "#a27e57", ctermfg = 137 },
+  Identifier = { fg = "#a27e57", ctermfg = 137, italic = true },
+  Function = { fg = "#829fa7", ctermfg = 109, italic = true },
+  Statement = { fg = "#648f68", ctermfg = 65 },
+  Keyword = { fg = "#648f68", ctermfg = 65 },
+  Conditional = { link = "Keyword" },
+  Repeat = { link = "Conditional" },
+  Label = { link = "Keyword" },
+  Exception = { fg = "#648f68", ctermfg = 65 },
+  Operator = { fg = "#648f68", ctermfg = 65 },
+  PreProc = { fg = "#648f68", ctermfg = 65 },
+  Type = { fg = "#5c87a4", ctermfg = 67 },
+  StorageClass = { fg = "#648f68", ctermfg = 65 },
+  Structure = { link = "Type" },
+  Typedef = { link = "Type" },
+  Special = { fg = "#829fa7", ctermfg = 109 },
+  SpecialChar = { link = "Special" },
+  Tag = { link = "Special" },
+  Delimiter = { link = "Special" },
+  Underlined = { fg = "#5c87a4", ctermfg = 67, underline = true },
+  Todo = { fg = "#e8b246", ctermfg = 221, bold = true },
+  ["@comment"] = { fg = "#43444d", italic = true, ctermfg = 238 },
+  ["@string"] = { fg = "#da674b", ctermfg = 209 },
+  ["@string.regexp"] = { fg = "#da674b", ctermfg = 209 },
+  ["@string.escape"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@number"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@boolean"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@constant"] = { fg = "#648f68", ctermfg = 65 },
+  ["@constant.builtin"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@function"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@function.call"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@function.method"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@constructor"] = { fg = "#a27e57", ctermfg = 137 },
+  ["@keyword"] = { fg = "#648f68", ctermfg = 65 },
+  ["@operator"] = { fg = "#648f68", ctermfg = 65 },
+  ["@type"] = { fg = "#5c87a4", ctermfg = 67 },
+  ["@variable"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@variable.builtin"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@variable.parameter"] = { fg = "#e8b246", italic = true, ctermfg = 221 },
+  ["@variable.member"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@property"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@attribute"] = { fg = "#e8b246", italic = true, ctermfg = 221 },
+  ["@tag"] = { fg = "#5c87a4", ctermfg = 67 },
+  ["@tag.attribute"] = { fg = "#e8b246", italic = true, ctermfg = 221 },
+  ["@punctuation"] = { fg = "#43444d", ctermfg = 238 },
+  ["@punctuation.bracket"] = { fg = "#575861", ctermfg = 240 },
+  ["@punctuation.delimiter"] = { fg = "#575861", ctermfg = 240 },
+  ["@markup.strong"] = { fg = "#868690", ctermfg = 102 },
+  ["@markup.italic"] = { fg = "#868690", ctermfg = 102 },
+  TermCursor = { fg = "#5c87a4", ctermfg = 67 },
+  Question = { fg = "#a27e57", ctermfg = 137 },
+  WildMenu = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  SpecialComment = { link = "Special" },
+  Macro = { link = "Function" },
+  Debug = { link = "Special" },
+  ["@module"] = { link = "Type" },
+  ["@label"] = { link = "Label" },
+  TelescopeNormal = { link = "Normal" },
+  TelescopeBorder = { link = "FloatBorder" },
+  TelescopeMatching = { link = "Search" },
+  NvimTreeNormal = { link = "Normal" },
+  GitSignsAdd = { fg = "#648f68", ctermfg = 65 },
+  GitSignsChange = { fg = "#e8b246", ctermfg = 221 },
+  GitSignsDelete = { fg = "#da674b", ctermfg = 209 },
+  VisualNOS = { bg = "#131317", ctermbg = 233, underline = true },
+  DiagnosticVirtualTextError = { fg = "#da674b", ctermfg = 209 },
+  DiagnosticVirtualTextWarn = { fg = "#e8b246", ctermfg = 221 },
+  DiagnosticVirtualTextInfo = { fg = "#5c87a4", ctermfg = 67 },
+  DiagnosticVirtualTextHint = { fg = "#648f68", ctermfg = 65 },
+  DiagnosticFloatingError = { fg = "#da674b", ctermfg = 209 },
+  DiagnosticFloatingWarn = { fg = "#e8b246", ctermfg = 221 },
+  DiagnosticFloatingInfo = { fg = "#5c87a4", ctermfg = 67 },
+  DiagnosticFloatingHint = { fg = "#648f68", ctermfg = 65 },
+  DiagnosticSignError = { fg = "#da674b", ctermfg = 209 },
+  DiagnosticSignWarn = { fg = "#e8b246", ctermfg = 221 },
+  DiagnosticSignInfo = { fg = "#5c87a4", ctermfg = 67 },
+  DiagnosticSignHint = { fg = "#648f68", ctermfg = 65 },
+  TSPunctDelimiter = { fg = "#868690", ctermfg = 102 },
+  TSVariable = { fg = "#a27e57", ctermfg = 137, italic = true },
+  TSType = { fg = "#5c87a4", ctermfg = 67 },
+  TSFunction = { fg = "#829fa7", ctermfg = 109, italic = true },
+  TSComment = { fg = "#43444d", ctermfg = 238, italic = true },
+  TSString = { fg = "#da674b", ctermfg = 209 },
+  TSKeyword = { fg = "#648f68", ctermfg = 65 },
+  TSOperator = { fg = "#648f68", ctermfg = 65 },
+  LspCodeLensSeparator = { fg = "#575861", ctermfg = 240 },
+  LspSignatureActiveParameter = { fg = "#a27e57", ctermfg = 137, bold = true },
+  FloatFooter = { fg = "#43444d", bg = "#111216", ctermfg = 238, ctermbg = 233 },
+  FloatShadow = { bg = "#000000", ctermbg = 16 },
+  FloatShadowThrough = { bg = "#000000", ctermbg = 16 },
+  TermCursorNC = { fg = "#575861", ctermfg = 240 },
+  NotifyERRORBorder = { fg = "#da674b", ctermfg = 209 },
+  NotifyWARNBorder = { fg = "#e8b246", ctermfg = 221 },
+  NotifyINFOBorder = { fg = "#648f68", ctermfg = 65 },
+  NotifyDEBUGBorder = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACEBorder = { fg = "#5c87a4", ctermfg = 67 },
+  NotifyERRORIcon = { fg = "#da674b", ctermfg = 209 },
+  NotifyWARNIcon = { fg = "#e8b246", ctermfg = 221 },
+  NotifyINFOIcon = { fg = "#648f68", ctermfg = 65 },
+  NotifyDEBUGIcon = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACEIcon = { fg = "#5c87a4", ctermfg = 67 },
+  NotifyERRORTitle = { fg = "#da674b", ctermfg = 209 },
+  NotifyWARNTitle = { fg = "#e8b246", ctermfg = 221 },
+  NotifyINFOTitle = { fg = "#648f68", ctermfg = 65 },
+  NotifyDEBUGTitle = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACETitle = { fg = "#5c87a4", ctermfg = 67 },
+  PreCondit = { link = "PreProc" },
+  TSConstant = { link = "Constant" },
+  TSNumber = { link = "Number" },
+  TSFloat = { link = "Number" },
+  TSBoolean = { link = "Constant" },
+  TSConstructor = { link = "Type" },
+  TSField = { link = "Identifier" },
+  TSParameter = { link = "Identifier" },
+  TSParameterReference = { link = "TSParameter" },
+  TSProperty = { link = "TSField" },
+  TSMethod = { link = "Function" },
+  TSConditional = { link = "Conditional" },
+  TSRepeat = { link = "Repeat" },
+  TSLabel = { link = "Label" },
+  TSException = { link = "Exception" },
+  TSNamespace = { link = "Type" },
+  TSTag = { link = "Tag" },
+  TSTagDelimiter = { link = "Delimiter" },
+  TSPunctSpecial = { link = "TSPunctDelimiter" },
+  TelescopeTitle = { link = "FloatTitle" },
+  TelescopePromptPrefix = { link = "Identifier" },
+  TelescopePromptCounter = { link = "Comment" },
+  NvimTreeFolderName = { link = "Directory" },
+  NvimTreeRootFolder = { link = "Type" },
+  NvimTreeFolderIcon = { link = "Type" },
+  NvimTreeFileIcon = { link = "Type" },
+  NvimTreeSpecialFile = { link = "Type" },
+  NvimTreeOpenedFile = { link = "Type" },
+  NvimTreeIndentMarker = { link = "IndentBlanklineChar" },
+  NvimTreeWindowPicker = { link = "FloatTitle" },
+  BufferLineFill = { link = "TabLineFill" },
+  BufferLineBackground = { link = "TabLine" },
+  BufferLineBufferSelected = { link = "TabLineSel" },
+  IlluminatedWordRead = { link = "LspReferenceRead" },
+  IlluminatedWordText = { link = "LspReferenceText" },
+  IlluminatedWordWrite = { link = "LspReferenceWrite" },
+  NavicIconsFile = { fg = "#648f68", ctermfg = 65 },
+  NavicIconsModule = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsNamespace = { fg = "#648f68", ctermfg = 65 },
+  NavicIconsPackage = { fg = "#575861", ctermfg = 240 },
+  NavicIconsClass = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsMethod = { fg = "#829fa7", ctermfg = 109 },
+  NavicIconsProperty = { fg = "#da674b", ctermfg = 209 },
+  NavicIconsField = { fg = "#da674b", ctermfg = 209 },
+  NavicIconsConstructor = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsEnum = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsInterface = { fg = "#5c87a4", ctermfg = 67 },
+  NavicIconsFunction = { fg = "#829fa7", ctermfg = 109 },
+  NavicIconsVariable = { fg = "#da674b", ctermfg = 209 },
+  NavicIconsConstant = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsString = { fg = "#da674b", ctermfg = 209 },
+  NavicIconsNumber = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsBoolean = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsArray = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsObject = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsKey = { fg = "#648f68", ctermfg = 65 },
+  NavicIconsNull = { fg = "#43444d", ctermfg = 238 },
+  NavicIconsEnumMember = { fg = "#da674b", ctermfg = 209 },
+  NavicIconsStruct = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsEvent = { fg = "#a27e57", ctermfg = 137 },
+  NavicIconsOperator = { fg = "#648f68", ctermfg = 65 },
+  NavicIconsTypeParameter = { fg = "#da674b", ctermfg = 209 },
+  NavicText = { fg = "#868690", ctermfg = 102 },
+  NavicSeparator = { fg = "#575861", ctermfg = 240 },
+  GitSignsCurrentLineBlame = { fg = "#43444d", ctermfg = 238, italic = true },
+  IndentBlanklineChar = { fg = "#575861", ctermfg = 240 },
+  IndentBlanklineContextChar = { fg = "#e8b246", ctermfg = 221 },
+}
 
--- LSP Specific (enhanced)
-highlight('LspReferenceText', selection_bg, nil, nil)
-highlight('LspReferenceRead', selection_bg, nil, nil)
-highlight('LspReferenceWrite', selection_bg, nil, 'bold')
-highlight('LspCodeLens', nil, comment_gray, 'italic')
-highlight('LspCodeLensSeparator', nil, light_gray, nil)
-highlight('LspSignatureActiveParameter', nil, brown, 'bold')
-highlight('LspInlayHint', dark_gray, comment_gray, 'italic')
-
--- Floating windows (Neovim 0.9+)
-highlight('FloatBorder', nil, light_gray, nil)
-highlight('FloatTitle', dark_gray, yellow, 'bold')
-highlight('FloatFooter', dark_gray, comment_gray, nil)
-highlight('FloatShadow', '#000000', nil, nil)
-highlight('FloatShadowThrough', '#00000088', nil, nil)
-
--- Winbar (Neovim 0.9+)
-highlight('WinBar', black, text_gray, nil)
-highlight('WinBarNC', black, light_gray, nil)
-
--- Neovim terminal colors
-highlight('TermCursor', nil, blue, nil)
-highlight('TermCursorNC', nil, light_gray, nil)
-vim.g.terminal_color_0 = black
-vim.g.terminal_color_1 = coral
-vim.g.terminal_color_2 = green
-vim.g.terminal_color_3 = brown
-vim.g.terminal_color_4 = blue
-vim.g.terminal_color_5 = teal
-vim.g.terminal_color_6 = yellow
-vim.g.terminal_color_7 = text_gray
-vim.g.terminal_color_8 = light_gray
-vim.g.terminal_color_9 = coral
-vim.g.terminal_color_10 = green
-vim.g.terminal_color_11 = brown
-vim.g.terminal_color_12 = blue
-vim.g.terminal_color_13 = teal
-vim.g.terminal_color_14 = yellow
-vim.g.terminal_color_15 = '#e6e6e6'  -- Light gray/almost white
-
--- Neovim notifications (0.9+)
-highlight('NotifyERRORBorder', nil, coral, nil)
-highlight('NotifyWARNBorder', nil, yellow, nil)
-highlight('NotifyINFOBorder', nil, green, nil)
-highlight('NotifyDEBUGBorder', nil, light_gray, nil)
-highlight('NotifyTRACEBorder', nil, blue, nil)
-highlight('NotifyERRORIcon', nil, coral, nil)
-highlight('NotifyWARNIcon', nil, yellow, nil)
-highlight('NotifyINFOIcon', nil, green, nil)
-highlight('NotifyDEBUGIcon', nil, light_gray, nil)
-highlight('NotifyTRACEIcon', nil, blue, nil)
-highlight('NotifyERRORTitle', nil, coral, nil)
-highlight('NotifyWARNTitle', nil, yellow, nil)
-highlight('NotifyINFOTitle', nil, green, nil)
-highlight('NotifyDEBUGTitle', nil, light_gray, nil)
-highlight('NotifyTRACETitle', nil, blue, nil)
-
--- Links to standard groups
-link('NonText', 'Comment')
-link('Whitespace', 'Comment')
-link('Conditional', 'Keyword')
-link('Repeat', 'Conditional')
-link('Label', 'Keyword')
-link('Macro', 'Function')
-link('PreCondit', 'PreProc')
-link('Structure', 'Type')
-link('Typedef', 'Type')
-link('SpecialChar', 'Special')
-link('Tag', 'Special')
-link('Delimiter', 'Special')
-link('SpecialComment', 'Special')
-link('Debug', 'Special')
-
--- Additional TreeSitter links
-link('TSConstant', 'Constant')
-link('TSNumber', 'Number')
-link('TSFloat', 'Number')
-link('TSBoolean', 'Constant')
-link('TSConstructor', 'Type')
-link('TSField', 'Identifier')
-link('TSParameter', 'Identifier')
-link('TSParameterReference', 'TSParameter')
-link('TSProperty', 'TSField')
-link('TSMethod', 'Function')
-link('TSConditional', 'Conditional')
-link('TSRepeat', 'Repeat')
-link('TSLabel', 'Label')
-link('TSException', 'Exception')
-link('TSNamespace', 'Type')
-link('TSTag', 'Tag')
-link('TSTagDelimiter', 'Delimiter')
-link('TSPunctSpecial', 'TSPunctDelimiter')
-
--- UI elements for plugins
-link('TelescopeNormal', 'Normal')
-link('TelescopeBorder', 'FloatBorder')
-link('TelescopeTitle', 'FloatTitle')
-link('TelescopePromptPrefix', 'Identifier')
-link('TelescopeMatching', 'Search')
-link('TelescopePromptCounter', 'Comment')
-
-link('NvimTreeNormal', 'Normal')
-link('NvimTreeFolderName', 'Directory')
-link('NvimTreeRootFolder', 'Type')
-link('NvimTreeFolderIcon', 'Type')
-link('NvimTreeFileIcon', 'Type')
-link('NvimTreeSpecialFile', 'Type')
-link('NvimTreeOpenedFile', 'Type')
-link('NvimTreeIndentMarker', 'IndentBlanklineChar')
-link('NvimTreeWindowPicker', 'FloatTitle')
-
-link('BufferLineFill', 'TabLineFill')
-link('BufferLineBackground', 'TabLine')
-link('BufferLineBufferSelected', 'TabLineSel')
-
--- Additional Neovim 0.9+ highlights
-link('IlluminatedWordRead', 'LspReferenceRead')
-link('IlluminatedWordText', 'LspReferenceText')
-link('IlluminatedWordWrite', 'LspReferenceWrite')
-
--- Navic (breadcrumbs) support
-highlight('NavicIconsFile', nil, green, nil)
-highlight('NavicIconsModule', nil, brown, nil)
-highlight('NavicIconsNamespace', nil, green, nil)
-highlight('NavicIconsPackage', nil, light_gray, nil)
-highlight('NavicIconsClass', nil, brown, nil)
-highlight('NavicIconsMethod', nil, teal, nil)
-highlight('NavicIconsProperty', nil, coral, nil)
-highlight('NavicIconsField', nil, coral, nil)
-highlight('NavicIconsConstructor', nil, brown, nil)
-highlight('NavicIconsEnum', nil, brown, nil)
-highlight('NavicIconsInterface', nil, blue, nil)
-highlight('NavicIconsFunction', nil, teal, nil)
-highlight('NavicIconsVariable', nil, coral, nil)
-highlight('NavicIconsConstant', nil, brown, nil)
-highlight('NavicIconsString', nil, coral, nil)
-highlight('NavicIconsNumber', nil, brown, nil)
-highlight('NavicIconsBoolean', nil, brown, nil)
-highlight('NavicIconsArray', nil, brown, nil)
-highlight('NavicIconsObject', nil, brown, nil)
-highlight('NavicIconsKey', nil, green, nil)
-highlight('NavicIconsNull', nil, comment_gray, nil)
-highlight('NavicIconsEnumMember', nil, coral, nil)
-highlight('NavicIconsStruct', nil, brown, nil)
-highlight('NavicIconsEvent', nil, brown, nil)
-highlight('NavicIconsOperator', nil, green, nil)
-highlight('NavicIconsTypeParameter', nil, coral, nil)
-highlight('NavicText', nil, text_gray, nil)
-highlight('NavicSeparator', nil, light_gray, nil)
-
--- Git and diff highlighting enhancements
-highlight('GitSignsAdd', nil, green, nil)
-highlight('GitSignsChange', nil, yellow, nil)
-highlight('GitSignsDelete', nil, coral, nil)
-highlight('GitSignsCurrentLineBlame', nil, comment_gray, 'italic')
+local set_hl = vim.api.nvim_set_hl
+for name, spec in pairs(groups) do
+  set_hl(0, name, spec)
+end
 
--- Indent guides
-highlight('IndentBlanklineChar', nil, light_gray, nil)
-highlight('IndentBlanklineContextChar', nil, yellow, nil)
+vim.g.terminal_color_0 = "#000000"
+vim.g.terminal_color_1 = "#da674b"
+vim.g.terminal_color_2 = "#648f68"
+vim.g.terminal_color_3 = "#a27e57"
+vim.g.terminal_color_4 = "#5c87a4"
+vim.g.terminal_color_5 = "#829fa7"
+vim.g.terminal_color_6 = "#e8b246"
+vim.g.terminal_color_7 = "#868690"
+vim.g.terminal_color_8 = "#575861"
+vim.g.terminal_color_9 = "#da674b"
+vim.g.terminal_color_10 = "#648f68"
+vim.g.terminal_color_11 = "#a27e57"
+vim.g.terminal_color_12 = "#5c87a4"
+vim.g.terminal_color_13 = "#829fa7"
+vim.g.terminal_color_14 = "#e8b246"
+vim.g.terminal_color_15 = "#e6e6e6"
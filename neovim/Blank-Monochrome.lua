@@ -1,282 +1,268 @@
--- Colorscheme generated by https://github.com/arcticlimer/djanho
-vim.cmd[[highlight clear]]
-
-local highlight = function(group, bg, fg, attr)
-    fg = fg and 'guifg=' .. fg or ''
-    bg = bg and 'guibg=' .. bg or ''
-    attr = attr and 'gui=' .. attr or ''
-
-    vim.api.nvim_command('highlight ' .. group .. ' '.. fg .. ' ' .. bg .. ' '.. attr)
-end
-
-local link = function(target, group)
-    vim.api.nvim_command('highlight! link ' .. target .. ' '.. group)
+-- Blank-Monochrome.lua - generated by convert_theme.py from vscode-themes/Blank-Monochrome.json.
+-- Do not edit by hand; rerun convert_theme.py --neovim instead.
+vim.cmd("highlight clear")
+if vim.fn.exists("syntax_on") == 1 then
+  vim.cmd("syntax reset")
 end
+vim.g.colors_name = "Blank-Monochrome"
 
--- Core color palette (monochrome gray scale)
-local black = '#000000'           -- True black background
-local dark_gray = '#111216'       -- Slightly lighter black for UI elements
-local comment_gray = '#43444D'    -- Dark gray for comments
-local light_gray = '#575861'      -- Light gray for less important elements
-local text_gray = '#868690'       -- Main text color
-local inactive_gray = '#131317'   -- Inactive element background
-
--- Monochrome accent shades
-local blue_gray = '#626983'       -- Slight blue tint gray for keywords
-local mid_gray_blue = '#7C829D'   -- Medium gray with blue tint
-local mid_gray = '#999EB2'        -- Medium gray
-local light_mid_gray = '#B6BAC8'  -- Lighter medium gray
-local light_gray_2 = '#D3D5DE'    -- Light gray for strings
-local whitish = '#E2E4ED'         -- Almost white
-local pure_white = '#fff'         -- Pure white for selections
-
--- Additional UI colors
-local transparent = '#0000'
-local selection_bg = '#817c9c26'
-local highlight_bg = '#817c9c14'
-
--- Core editor elements
-highlight('Normal', black, text_gray, nil)
-highlight('NormalFloat', dark_gray, text_gray, nil)
-highlight('EndOfBuffer', black, comment_gray, nil)
-highlight('Cursor', nil, mid_gray_blue, nil)
-highlight('CursorLine', inactive_gray, nil, nil)
-highlight('CursorColumn', inactive_gray, nil, nil)
-highlight('ColorColumn', inactive_gray, nil, nil)
-highlight('SignColumn', black, nil, nil)
-highlight('LineNr', nil, light_gray, nil)
-highlight('CursorLineNr', nil, light_mid_gray, nil)
-highlight('VertSplit', nil, light_gray, nil)
-highlight('WinSeparator', nil, light_gray, nil) -- Neovim 0.9+
-highlight('Folded', black, comment_gray, nil)
-highlight('FoldColumn', black, light_gray, nil)
-
--- Status line and tabs
-highlight('StatusLine', light_gray, black, nil)
-highlight('StatusLineNC', black, light_gray, nil)
-highlight('TabLine', transparent, light_gray, nil)
-highlight('TabLineSel', pure_white, dark_gray, nil)
-highlight('TabLineFill', transparent, light_gray, nil)
-
--- Popups and menus
-highlight('Pmenu', black, text_gray, nil)
-highlight('PmenuSel', text_gray, dark_gray, nil)
-highlight('PmenuSbar', dark_gray, nil, nil)
-highlight('PmenuThumb', black, text_gray, nil)
-highlight('WildMenu', black, text_gray, nil)
-highlight('Question', nil, light_mid_gray, nil)
-highlight('Title', nil, light_mid_gray, 'bold')
-
--- Search and selection
-highlight('Visual', inactive_gray, nil, nil)
-highlight('VisualNOS', inactive_gray, nil, 'underline')
-highlight('Search', selection_bg, text_gray, nil)
-highlight('IncSearch', light_mid_gray, black, nil)
-highlight('MatchParen', selection_bg, nil, 'bold')
-
--- Diagnostics and errors
-highlight('Error', nil, mid_gray, nil)
-highlight('ErrorMsg', nil, mid_gray, nil)
-highlight('WarningMsg', nil, light_mid_gray, nil)
-highlight('DiagnosticError', nil, mid_gray, nil)
-highlight('DiagnosticWarn', nil, light_mid_gray, nil)
-highlight('DiagnosticInfo', nil, mid_gray_blue, nil)
-highlight('DiagnosticHint', nil, blue_gray, nil)
-highlight('DiagnosticUnderlineError', nil, nil, 'undercurl,fg=' .. mid_gray)
-highlight('DiagnosticUnderlineWarn', nil, nil, 'undercurl,fg=' .. light_mid_gray)
-highlight('DiagnosticUnderlineInfo', nil, nil, 'undercurl,fg=' .. mid_gray_blue)
-highlight('DiagnosticUnderlineHint', nil, nil, 'undercurl,fg=' .. blue_gray)
-highlight('DiagnosticVirtualTextError', nil, mid_gray, nil)
-highlight('DiagnosticVirtualTextWarn', nil, light_mid_gray, nil)
-highlight('DiagnosticVirtualTextInfo', nil, mid_gray_blue, nil)
-highlight('DiagnosticVirtualTextHint', nil, blue_gray, nil)
-highlight('DiagnosticFloatingError', nil, mid_gray, nil)
-highlight('DiagnosticFloatingWarn', nil, light_mid_gray, nil)
-highlight('DiagnosticFloatingInfo', nil, mid_gray_blue, nil)
-highlight('DiagnosticFloatingHint', nil, blue_gray, nil)
-highlight('DiagnosticSignError', nil, mid_gray, nil)
-highlight('DiagnosticSignWarn', nil, light_mid_gray, nil)
-highlight('DiagnosticSignInfo', nil, mid_gray_blue, nil)
-highlight('DiagnosticSignHint', nil, blue_gray, nil)
-
--- Diffs
-highlight('DiffAdd', '#090a0c', nil, nil)
-highlight('DiffChange', '#0c0c0d', nil, nil)
-highlight('DiffDelete', '#0c0c0d', nil, nil)
-highlight('DiffText', nil, text_gray, nil)
-
--- Syntax highlighting (monochrome)
-highlight('Comment', nil, comment_gray, 'italic')
-highlight('Constant', nil, blue_gray, nil)
-highlight('Number', nil, light_mid_gray, nil)
-highlight('String', nil, light_gray_2, nil)
-highlight('Identifier', nil, light_mid_gray, 'italic')
-highlight('Function', nil, mid_gray, 'italic')
-highlight('Statement', nil, blue_gray, nil)
-highlight('Keyword', nil, blue_gray, nil)
-highlight('Operator', nil, blue_gray, nil)
-highlight('PreProc', nil, blue_gray, nil)
-highlight('Type', nil, mid_gray_blue, nil)
-highlight('Special', nil, mid_gray, nil)
-highlight('Underlined', nil, mid_gray_blue, 'underline')
-highlight('Todo', nil, light_mid_gray, 'bold')
+local groups = {
+  Normal = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  NormalFloat = { fg = "#868690", bg = "#111216", ctermfg = 102, ctermbg = 233 },
+  NormalNC = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  EndOfBuffer = { fg = "#43444d", bg = "#000000", ctermfg = 238, ctermbg = 16 },
+  Cursor = { fg = "#7c829d", ctermfg = 103 },
+  CursorLine = { bg = "#131317", ctermbg = 233 },
+  CursorColumn = { bg = "#131317", ctermbg = 233 },
+  ColorColumn = { bg = "#131317", ctermbg = 233 },
+  SignColumn = { bg = "#000000", ctermbg = 16 },
+  LineNr = { fg = "#575861", ctermfg = 240 },
+  CursorLineNr = { fg = "#b6bac8", ctermfg = 250 },
+  WinSeparator = { fg = "#575861", ctermfg = 240 },
+  VertSplit = { fg = "#575861", ctermfg = 240 },
+  Folded = { fg = "#43444d", bg = "#000000", ctermfg = 238, ctermbg = 16 },
+  FoldColumn = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  NonText = { link = "Comment" },
+  Whitespace = { link = "Comment" },
+  Directory = { fg = "#e2e4ed", ctermfg = 254 },
+  Title = { fg = "#b6bac8", ctermfg = 250, bold = true },
+  StatusLine = { fg = "#000000", bg = "#575861", ctermfg = 16, ctermbg = 240 },
+  StatusLineNC = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  TabLine = { fg = "#575861", ctermfg = 240 },
+  TabLineSel = { fg = "#111216", bg = "#ffffff", ctermfg = 233, ctermbg = 231 },
+  TabLineFill = { fg = "#575861", ctermfg = 240 },
+  WinBar = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  WinBarNC = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  Pmenu = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  PmenuSel = { fg = "#111216", bg = "#868690", ctermfg = 233, ctermbg = 102 },
+  PmenuSbar = { bg = "#111216", ctermbg = 233 },
+  PmenuThumb = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  FloatBorder = { fg = "#575861", ctermfg = 240 },
+  FloatTitle = { fg = "#b6bac8", bg = "#111216", ctermfg = 250, ctermbg = 233, bold = true },
+  Visual = { bg = "#131317", ctermbg = 233 },
+  Search = { fg = "#868690", bg = "#131217", ctermfg = 102, ctermbg = 233 },
+  CurSearch = { bg = "#27252f", ctermbg = 235 },
+  IncSearch = { fg = "#000000", bg = "#b6bac8", ctermfg = 16, ctermbg = 250 },
+  MatchParen = { bg = "#131217", ctermbg = 233, bold = true },
+  Error = { fg = "#999eb2", ctermfg = 247 },
+  ErrorMsg = { fg = "#999eb2", ctermfg = 247 },
+  WarningMsg = { fg = "#b6bac8", ctermfg = 250 },
+  DiagnosticError = { fg = "#999eb2", ctermfg = 247 },
+  DiagnosticWarn = { fg = "#b6bac8", ctermfg = 250 },
+  DiagnosticInfo = { fg = "#7c829d", ctermfg = 103 },
+  DiagnosticHint = { fg = "#626983", ctermfg = 60 },
+  DiagnosticUnderlineError = { sp = "#999eb2", undercurl = true },
+  DiagnosticUnderlineWarn = { sp = "#b6bac8", undercurl = true },
+  DiagnosticUnderlineInfo = { sp = "#7c829d", undercurl = true },
+  DiagnosticUnderlineHint = { sp = "#626983", undercurl = true },
+  LspInlayHint = { fg = "#43444d", bg = "#111216", ctermfg = 238, ctermbg = 233, italic = true },
+  LspCodeLens = { fg = "#43444d", ctermfg = 238, italic = true },
+  LspReferenceText = { bg = "#131217", ctermbg = 233 },
+  LspReferenceRead = { bg = "#131217", ctermbg = 233 },
+  LspReferenceWrite = { bg = "#131217", ctermbg = 233, bold = true },
+  DiffAdd = { bg = "#090a0c", ctermbg = 232 },
+  DiffDelete = { bg = "#0c0c0d", ctermbg = 232 },
+  DiffChange = { bg = "#0c0c0d", ctermbg = 232 },
+  DiffText = { fg = "#868690", ctermfg = 102 },
+  Added = { fg = "#7c829d", ctermfg = 103 },
+  Changed = { fg = "#b6bac8", ctermfg = 250 },
+  Removed = { fg = "#999eb2", ctermfg = 247 },
+  Comment = { fg = "#43444d", ctermfg = 238, italic = true },
+  Constant = { fg = "#626983", ctermfg = 60 },
+  String = { fg = "#d3d5de", ctermfg = 188 },
+  Character = { fg = "#d3d5de", ctermfg = 188 },
+  Number = { fg = "#b6bac8", ctermfg = 250 },
+  Float = { fg = "#b6bac8", ctermfg = 250 },
+  Boolean = { fg = "#b6bac8", ctermfg = 250 },
+  Identifier = { fg = "#b6bac8", ctermfg = 250, italic = true },
+  Function = { fg = "#999eb2", ctermfg = 247, italic = true },
+  Statement = { fg = "#626983", ctermfg = 60 },
+  Keyword = { fg = "#626983", ctermfg = 60 },
+  Conditional = { link = "Keyword" },
+  Repeat = { link = "Conditional" },
+  Label = { link = "Keyword" },
+  Exception = { fg = "#626983", ctermfg = 60 },
+  Operator = { fg = "#626983", ctermfg = 60 },
+  PreProc = { fg = "#626983", ctermfg = 60 },
+  Type = { fg = "#7c829d", ctermfg = 103 },
+  StorageClass = { fg = "#626983", ctermfg = 60 },
+  Structure = { link = "Type" },
+  Typedef = { link = "Type" },
+  Special = { fg = "#999eb2", ctermfg = 247 },
+  SpecialChar = { link = "Special" },
+  Tag = { link = "Special" },
+  Delimiter = { link = "Special" },
+  Underlined = { fg = "#7c829d", ctermfg = 103, underline = true },
+  Todo = { fg = "#b6bac8", ctermfg = 250, bold = true },
+  ["@comment"] = { fg = "#43444d", italic = true, ctermfg = 238 },
+  ["@string"] = { fg = "#d3d5de", ctermfg = 188 },
+  ["@string.regexp"] = { fg = "#d3d5de", ctermfg = 188 },
+  ["@string.escape"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@number"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@boolean"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@constant"] = { fg = "#626983", ctermfg = 60 },
+  ["@constant.builtin"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@function"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@function.call"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@function.method"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@constructor"] = { fg = "#b6bac8", ctermfg = 250 },
+  ["@keyword"] = { fg = "#626983", ctermfg = 60 },
+  ["@operator"] = { fg = "#626983", ctermfg = 60 },
+  ["@type"] = { fg = "#7c829d", ctermfg = 103 },
+  ["@variable"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@variable.builtin"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@variable.parameter"] = { fg = "#e2e4ed", italic = true, ctermfg = 254 },
+  ["@variable.member"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@property"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@attribute"] = { fg = "#e2e4ed", italic = true, ctermfg = 254 },
+  ["@tag"] = { fg = "#7c829d", ctermfg = 103 },
+  ["@tag.attribute"] = { fg = "#e2e4ed", italic = true, ctermfg = 254 },
+  ["@punctuation"] = { fg = "#43444d", ctermfg = 238 },
+  ["@punctuation.bracket"] = { fg = "#575861", ctermfg = 240 },
+  ["@punctuation.delimiter"] = { fg = "#575861", ctermfg = 240 },
+  ["@markup.strong"] = { fg = "#868690", ctermfg = 102 },
+  ["@markup.italic"] = { fg = "#868690", ctermfg = 102 },
+  TermCursor = { fg = "#7c829d", ctermfg = 103 },
+  Question = { fg = "#b6bac8", ctermfg = 250 },
+  WildMenu = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  SpecialComment = { link = "Special" },
+  Macro = { link = "Function" },
+  Debug = { link = "Special" },
+  ["@module"] = { link = "Type" },
+  ["@label"] = { link = "Label" },
+  TelescopeNormal = { link = "Normal" },
+  TelescopeBorder = { link = "FloatBorder" },
+  TelescopeMatching = { link = "Search" },
+  NvimTreeNormal = { link = "Normal" },
+  GitSignsAdd = { link = "Added" },
+  GitSignsChange = { link = "Changed" },
+  GitSignsDelete = { link = "Removed" },
+  VisualNOS = { bg = "#131317", ctermbg = 233, underline = true },
+  DiagnosticVirtualTextError = { fg = "#999eb2", ctermfg = 247 },
+  DiagnosticVirtualTextWarn = { fg = "#b6bac8", ctermfg = 250 },
+  DiagnosticVirtualTextInfo = { fg = "#7c829d", ctermfg = 103 },
+  DiagnosticVirtualTextHint = { fg = "#626983", ctermfg = 60 },
+  DiagnosticFloatingError = { fg = "#999eb2", ctermfg = 247 },
+  DiagnosticFloatingWarn = { fg = "#b6bac8", ctermfg = 250 },
+  DiagnosticFloatingInfo = { fg = "#7c829d", ctermfg = 103 },
+  DiagnosticFloatingHint = { fg = "#626983", ctermfg = 60 },
+  DiagnosticSignError = { fg = "#999eb2", ctermfg = 247 },
+  DiagnosticSignWarn = { fg = "#b6bac8", ctermfg = 250 },
+  DiagnosticSignInfo = { fg = "#7c829d", ctermfg = 103 },
+  DiagnosticSignHint = { fg = "#626983", ctermfg = 60 },
+  TSPunctDelimiter = { fg = "#868690", ctermfg = 102 },
+  TSVariable = { fg = "#b6bac8", ctermfg = 250, italic = true },
+  TSType = { fg = "#7c829d", ctermfg = 103 },
+  TSFunction = { fg = "#999eb2", ctermfg = 247, italic = true },
+  TSComment = { fg = "#43444d", ctermfg = 238, italic = true },
+  TSString = { fg = "#d3d5de", ctermfg = 188 },
+  TSKeyword = { fg = "#626983", ctermfg = 60 },
+  TSOperator = { fg = "#626983", ctermfg = 60 },
+  LspCodeLensSeparator = { fg = "#575861", ctermfg = 240 },
+  LspSignatureActiveParameter = { fg = "#b6bac8", ctermfg = 250, bold = true },
+  FloatFooter = { fg = "#43444d", bg = "#111216", ctermfg = 238, ctermbg = 233 },
+  FloatShadow = { bg = "#000000", ctermbg = 16 },
+  FloatShadowThrough = { bg = "#000000", ctermbg = 16 },
+  TermCursorNC = { fg = "#575861", ctermfg = 240 },
+  NotifyERRORBorder = { fg = "#999eb2", ctermfg = 247 },
+  NotifyWARNBorder = { fg = "#b6bac8", ctermfg = 250 },
+  NotifyINFOBorder = { fg = "#626983", ctermfg = 60 },
+  NotifyDEBUGBorder = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACEBorder = { fg = "#7c829d", ctermfg = 103 },
+  NotifyERRORIcon = { fg = "#999eb2", ctermfg = 247 },
+  NotifyWARNIcon = { fg = "#b6bac8", ctermfg = 250 },
+  NotifyINFOIcon = { fg = "#626983", ctermfg = 60 },
+  NotifyDEBUGIcon = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACEIcon = { fg = "#7c829d", ctermfg = 103 },
+  NotifyERRORTitle = { fg = "#999eb2", ctermfg = 247 },
+  NotifyWARNTitle = { fg = "#b6bac8", ctermfg = 250 },
+  NotifyINFOTitle = { fg = "#626983", ctermfg = 60 },
+  NotifyDEBUGTitle = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACETitle = { fg = "#7c829d", ctermfg = 103 },
+  PreCondit = { link = "PreProc" },
+  TSConstant = { link = "Constant" },
+  TSNumber = { link = "Number" },
+  TSFloat = { link = "Number" },
+  TSBoolean = { link = "Constant" },
+  TSConstructor = { link = "Type" },
+  TSField = { link = "Identifier" },
+  TSParameter = { link = "Identifier" },
+  TSParameterReference = { link = "TSParameter" },
+  TSProperty = { link = "TSField" },
+  TSMethod = { link = "Function" },
+  TSConditional = { link = "Conditional" },
+  TSRepeat = { link = "Repeat" },
+  TSLabel = { link = "Label" },
+  TSException = { link = "Exception" },
+  TSNamespace = { link = "Type" },
+  TSTag = { link = "Tag" },
+  TSTagDelimiter = { link = "Delimiter" },
+  TSPunctSpecial = { link = "TSPunctDelimiter" },
+  TelescopeTitle = { link = "FloatTitle" },
+  TelescopePromptPrefix = { link = "Identifier" },
+  TelescopePromptCounter = { link = "Comment" },
+  NvimTreeFolderName = { link = "Directory" },
+  NvimTreeRootFolder = { link = "Type" },
+  NvimTreeFolderIcon = { link = "Type" },
+  NvimTreeFileIcon = { link = "Type" },
+  NvimTreeSpecialFile = { link = "Type" },
+  NvimTreeOpenedFile = { link = "Type" },
+  NvimTreeIndentMarker = { link = "IndentBlanklineChar" },
+  NvimTreeWindowPicker = { link = "FloatTitle" },
+  BufferLineFill = { link = "TabLineFill" },
+  BufferLineBackground = { link = "TabLine" },
+  BufferLineBufferSelected = { link = "TabLineSel" },
+  IlluminatedWordRead = { link = "LspReferenceRead" },
+  IlluminatedWordText = { link = "LspReferenceText" },
+  IlluminatedWordWrite = { link = "LspReferenceWrite" },
+  NavicIconsFile = { fg = "#626983", ctermfg = 60 },
+  NavicIconsModule = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsNamespace = { fg = "#626983", ctermfg = 60 },
+  NavicIconsPackage = { fg = "#575861", ctermfg = 240 },
+  NavicIconsClass = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsMethod = { fg = "#999eb2", ctermfg = 247 },
+  NavicIconsProperty = { fg = "#d3d5de", ctermfg = 188 },
+  NavicIconsField = { fg = "#d3d5de", ctermfg = 188 },
+  NavicIconsConstructor = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsEnum = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsInterface = { fg = "#7c829d", ctermfg = 103 },
+  NavicIconsFunction = { fg = "#999eb2", ctermfg = 247 },
+  NavicIconsVariable = { fg = "#d3d5de", ctermfg = 188 },
+  NavicIconsConstant = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsString = { fg = "#d3d5de", ctermfg = 188 },
+  NavicIconsNumber = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsBoolean = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsArray = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsObject = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsKey = { fg = "#626983", ctermfg = 60 },
+  NavicIconsNull = { fg = "#43444d", ctermfg = 238 },
+  NavicIconsEnumMember = { fg = "#d3d5de", ctermfg = 188 },
+  NavicIconsStruct = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsEvent = { fg = "#b6bac8", ctermfg = 250 },
+  NavicIconsOperator = { fg = "#626983", ctermfg = 60 },
+  NavicIconsTypeParameter = { fg = "#d3d5de", ctermfg = 188 },
+  NavicText = { fg = "#868690", ctermfg = 102 },
+  NavicSeparator = { fg = "#575861", ctermfg = 240 },
+}
 
--- TreeSitter specific
-highlight('TSPunctDelimiter', nil, text_gray, nil)
-highlight('TSVariable', nil, light_mid_gray, 'italic')
-highlight('TSType', nil, mid_gray_blue, nil)
-highlight('TSFunction', nil, mid_gray, 'italic')
-highlight('TSComment', nil, comment_gray, 'italic')
-highlight('TSString', nil, light_gray_2, nil)
-highlight('TSKeyword', nil, blue_gray, nil)
-highlight('TSOperator', nil, blue_gray, nil)
-
--- LSP Specific (enhanced)
-highlight('LspReferenceText', selection_bg, nil, nil)
-highlight('LspReferenceRead', selection_bg, nil, nil)
-highlight('LspReferenceWrite', selection_bg, nil, 'bold')
-highlight('LspCodeLens', nil, comment_gray, 'italic')
-highlight('LspCodeLensSeparator', nil, light_gray, nil)
-highlight('LspSignatureActiveParameter', nil, light_mid_gray, 'bold')
-highlight('LspInlayHint', dark_gray, comment_gray, 'italic')
-
--- Floating windows (Neovim 0.9+)
-highlight('FloatBorder', nil, light_gray, nil)
-highlight('FloatTitle', dark_gray, light_mid_gray, 'bold')
-highlight('FloatFooter', dark_gray, comment_gray, nil)
-highlight('FloatShadow', '#000000', nil, nil)
-highlight('FloatShadowThrough', '#00000088', nil, nil)
-
--- Winbar (Neovim 0.9+)
-highlight('WinBar', black, text_gray, nil)
-highlight('WinBarNC', black, light_gray, nil)
-
--- Neovim terminal colors
-highlight('TermCursor', nil, mid_gray_blue, nil)
-highlight('TermCursorNC', nil, light_gray, nil)
-vim.g.terminal_color_0 = black
-vim.g.terminal_color_1 = mid_gray
-vim.g.terminal_color_2 = blue_gray
-vim.g.terminal_color_3 = light_mid_gray
-vim.g.terminal_color_4 = mid_gray_blue
-vim.g.terminal_color_5 = mid_gray
-vim.g.terminal_color_6 = light_gray_2
-vim.g.terminal_color_7 = text_gray
-vim.g.terminal_color_8 = light_gray
-vim.g.terminal_color_9 = mid_gray
-vim.g.terminal_color_10 = blue_gray
-vim.g.terminal_color_11 = light_mid_gray
-vim.g.terminal_color_12 = mid_gray_blue
-vim.g.terminal_color_13 = mid_gray
-vim.g.terminal_color_14 = light_gray_2
-vim.g.terminal_color_15 = whitish
-
--- Neovim notifications (0.9+)
-highlight('NotifyERRORBorder', nil, mid_gray, nil)
-highlight('NotifyWARNBorder', nil, light_mid_gray, nil)
-highlight('NotifyINFOBorder', nil, blue_gray, nil)
-highlight('NotifyDEBUGBorder', nil, light_gray, nil)
-highlight('NotifyTRACEBorder', nil, mid_gray_blue, nil)
-highlight('NotifyERRORIcon', nil, mid_gray, nil)
-highlight('NotifyWARNIcon', nil, light_mid_gray, nil)
-highlight('NotifyINFOIcon', nil, blue_gray, nil)
-highlight('NotifyDEBUGIcon', nil, light_gray, nil)
-highlight('NotifyTRACEIcon', nil, mid_gray_blue, nil)
-highlight('NotifyERRORTitle', nil, mid_gray, nil)
-highlight('NotifyWARNTitle', nil, light_mid_gray, nil)
-highlight('NotifyINFOTitle', nil, blue_gray, nil)
-highlight('NotifyDEBUGTitle', nil, light_gray, nil)
-highlight('NotifyTRACETitle', nil, mid_gray_blue, nil)
-
--- Links to standard groups
-link('NonText', 'Comment')
-link('Whitespace', 'Comment')
-link('Conditional', 'Keyword')
-link('Repeat', 'Conditional')
-link('Label', 'Keyword')
-link('Macro', 'Function')
-link('PreCondit', 'PreProc')
-link('Structure', 'Type')
-link('Typedef', 'Type')
-link('SpecialChar', 'Special')
-link('Tag', 'Special')
-link('Delimiter', 'Special')
-link('SpecialComment', 'Special')
-link('Debug', 'Special')
-
--- Additional TreeSitter links
-link('TSConstant', 'Constant')
-link('TSNumber', 'Number')
-link('TSFloat', 'Number')
-link('TSBoolean', 'Constant')
-link('TSConstructor', 'Type')
-link('TSField', 'Identifier')
-link('TSParameter', 'Identifier')
-link('TSParameterReference', 'TSParameter')
-link('TSProperty', 'TSField')
-link('TSMethod', 'Function')
-link('TSConditional', 'Conditional')
-link('TSRepeat', 'Repeat')
-link('TSLabel', 'Label')
-link('TSException', 'Exception')
-link('TSNamespace', 'Type')
-link('TSTag', 'Tag')
-link('TSTagDelimiter', 'Delimiter')
-link('TSPunctSpecial', 'TSPunctDelimiter')
-
--- UI elements for plugins
-link('TelescopeNormal', 'Normal')
-link('TelescopeBorder', 'FloatBorder')
-link('TelescopeTitle', 'FloatTitle')
-link('TelescopePromptPrefix', 'Identifier')
-link('TelescopeMatching', 'Search')
-link('TelescopePromptCounter', 'Comment')
-
-link('NvimTreeNormal', 'Normal')
-link('NvimTreeFolderName', 'Directory')
-link('NvimTreeRootFolder', 'Type')
-link('NvimTreeFolderIcon', 'Type')
-link('NvimTreeFileIcon', 'Type')
-link('NvimTreeSpecialFile', 'Type')
-link('NvimTreeOpenedFile', 'Type')
-link('NvimTreeIndentMarker', 'IndentBlanklineChar')
-link('NvimTreeWindowPicker', 'FloatTitle')
-
-link('BufferLineFill', 'TabLineFill')
-link('BufferLineBackground', 'TabLine')
-link('BufferLineBufferSelected', 'TabLineSel')
-
--- Additional Neovim 0.9+ highlights
-link('IlluminatedWordRead', 'LspReferenceRead')
-link('IlluminatedWordText', 'LspReferenceText')
-link('IlluminatedWordWrite', 'LspReferenceWrite')
+local set_hl = vim.api.nvim_set_hl
+for name, spec in pairs(groups) do
+  set_hl(0, name, spec)
+end
 
--- Navic (breadcrumbs) support
-highlight('NavicIconsFile', nil, blue_gray, nil)
-highlight('NavicIconsModule', nil, light_mid_gray, nil)
-highlight('NavicIconsNamespace', nil, blue_gray, nil)
-highlight('NavicIconsPackage', nil, light_gray, nil)
-highlight('NavicIconsClass', nil, light_mid_gray, nil)
-highlight('NavicIconsMethod', nil, mid_gray, nil)
-highlight('NavicIconsProperty', nil, light_gray_2, nil)
-highlight('NavicIconsField', nil, light_gray_2, nil)
-highlight('NavicIconsConstructor', nil, light_mid_gray, nil)
-highlight('NavicIconsEnum', nil, light_mid_gray, nil)
-highlight('NavicIconsInterface', nil, mid_gray_blue, nil)
-highlight('NavicIconsFunction', nil, mid_gray, nil)
-highlight('NavicIconsVariable', nil, light_gray_2, nil)
-highlight('NavicIconsConstant', nil, light_mid_gray, nil)
-highlight('NavicIconsString', nil, light_gray_2, nil)
-highlight('NavicIconsNumber', nil, light_mid_gray, nil)
-highlight('NavicIconsBoolean', nil, light_mid_gray, nil)
-highlight('NavicIconsArray', nil, light_mid_gray, nil)
-highlight('NavicIconsObject', nil, light_mid_gray, nil)
-highlight('NavicIconsKey', nil, blue_gray, nil)
-highlight('NavicIconsNull', nil, comment_gray, nil)
-highlight('NavicIconsEnumMember', nil, light_gray_2, nil)
-highlight('NavicIconsStruct', nil, light_mid_gray, nil)
-highlight('NavicIconsEvent', nil, light_mid_gray, nil)
-highlight('NavicIconsOperator', nil, blue_gray, nil)
-highlight('NavicIconsTypeParameter', nil, light_gray_2, nil)
-highlight('NavicText', nil, text_gray, nil)
-highlight('NavicSeparator', nil, light_gray, nil)
+vim.g.terminal_color_0 = "#000000"
+vim.g.terminal_color_1 = "#999eb2"
+vim.g.terminal_color_2 = "#626983"
+vim.g.terminal_color_3 = "#b6bac8"
+vim.g.terminal_color_4 = "#7c829d"
+vim.g.terminal_color_5 = "#999eb2"
+vim.g.terminal_color_6 = "#d3d5de"
+vim.g.terminal_color_7 = "#868690"
+vim.g.terminal_color_8 = "#575861"
+vim.g.terminal_color_9 = "#999eb2"
+vim.g.terminal_color_10 = "#626983"
+vim.g.terminal_color_11 = "#b6bac8"
+vim.g.terminal_color_12 = "#7c829d"
+vim.g.terminal_color_13 = "#999eb2"
+vim.g.terminal_color_14 = "#d3d5de"
+vim.g.terminal_color_15 = "#e2e4ed"
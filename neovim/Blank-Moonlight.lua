@@ -1,281 +1,268 @@
--- Blank-Moonlight.lua - Enhanced for Neovim
-vim.cmd[[highlight clear]]
-
-local highlight = function(group, bg, fg, attr)
-    fg = fg and 'guifg=' .. fg or ''
-    bg = bg and 'guibg=' .. bg or ''
-    attr = attr and 'gui=' .. attr or ''
-
-    vim.api.nvim_command('highlight ' .. group .. ' '.. fg .. ' ' .. bg .. ' '.. attr)
-end
-
-local link = function(target, group)
-    vim.api.nvim_command('highlight! link ' .. target .. ' '.. group)
+-- Blank-Moonlight.lua - generated by convert_theme.py from vscode-themes/Blank-Moonlight.json.
+-- Do not edit by hand; rerun convert_theme.py --neovim instead.
+vim.cmd("highlight clear")
+if vim.fn.exists("syntax_on") == 1 then
+  vim.cmd("syntax reset")
 end
+vim.g.colors_name = "Blank-Moonlight"
 
--- Core color palette
-local black = '#000000'       -- True black background
-local dark_gray = '#111216'   -- Slightly lighter black for UI elements
-local comment_gray = '#43444D'
-local light_gray = '#575861'
-local text_gray = '#868690'
-local inactive_gray = '#131317'
-
--- Accent colors
-local blue = '#8eb6f5'
-local purple = '#c58fff'
-local orange = '#ffbb88'
-local pink = '#f58ee0'
-local light_gray_2 = '#9898a6'
-local white = '#fdfdfe'
-
--- Additional UI colors
-local transparent = '#0000'
-local selection_bg = '#817c9c26'
-local highlight_bg = '#817c9c14'
-
--- Core editor elements
-highlight('Normal', black, text_gray, nil)
-highlight('NormalFloat', dark_gray, text_gray, nil)
-highlight('EndOfBuffer', black, comment_gray, nil)
-highlight('Cursor', nil, purple, nil)
-highlight('CursorLine', inactive_gray, nil, nil)
-highlight('CursorColumn', inactive_gray, nil, nil)
-highlight('ColorColumn', inactive_gray, nil, nil)
-highlight('SignColumn', black, nil, nil)
-highlight('LineNr', nil, light_gray, nil)
-highlight('CursorLineNr', nil, orange, nil)
-highlight('VertSplit', nil, light_gray, nil)
-highlight('WinSeparator', nil, light_gray, nil) -- Neovim 0.9+ idfk why it's not working
-highlight('Folded', black, comment_gray, nil)
-highlight('FoldColumn', black, light_gray, nil)
-
--- Status line and tabs
-highlight('StatusLine', light_gray, black, nil)
-highlight('StatusLineNC', black, light_gray, nil)
-highlight('TabLine', transparent, light_gray, nil)
-highlight('TabLineSel', text_gray, dark_gray, nil)
-highlight('TabLineFill', transparent, light_gray, nil)
-
--- Popups and menus
-highlight('Pmenu', black, text_gray, nil)
-highlight('PmenuSel', text_gray, dark_gray, nil)
-highlight('PmenuSbar', dark_gray, nil, nil)
-highlight('PmenuThumb', black, text_gray, nil)
-highlight('WildMenu', black, text_gray, nil)
-highlight('Question', nil, orange, nil)
-highlight('Title', nil, orange, 'bold')
-
--- Search and selection
-highlight('Visual', inactive_gray, nil, nil)
-highlight('VisualNOS', inactive_gray, nil, 'underline')
-highlight('Search', selection_bg, text_gray, nil)
-highlight('IncSearch', orange, black, nil)
-highlight('MatchParen', selection_bg, nil, 'bold')
-
--- Diagnostics and errors
-highlight('Error', nil, pink, nil)
-highlight('ErrorMsg', nil, pink, nil)
-highlight('WarningMsg', nil, orange, nil)
-highlight('DiagnosticError', nil, pink, nil)
-highlight('DiagnosticWarn', nil, orange, nil)
-highlight('DiagnosticInfo', nil, purple, nil)
-highlight('DiagnosticHint', nil, blue, nil)
-highlight('DiagnosticUnderlineError', nil, nil, 'undercurl,fg=' .. pink)
-highlight('DiagnosticUnderlineWarn', nil, nil, 'undercurl,fg=' .. orange)
-highlight('DiagnosticUnderlineInfo', nil, nil, 'undercurl,fg=' .. purple)
-highlight('DiagnosticUnderlineHint', nil, nil, 'undercurl,fg=' .. blue)
-highlight('DiagnosticVirtualTextError', nil, pink, nil)
-highlight('DiagnosticVirtualTextWarn', nil, orange, nil)
-highlight('DiagnosticVirtualTextInfo', nil, purple, nil)
-highlight('DiagnosticVirtualTextHint', nil, blue, nil)
-highlight('DiagnosticFloatingError', nil, pink, nil)
-highlight('DiagnosticFloatingWarn', nil, orange, nil)
-highlight('DiagnosticFloatingInfo', nil, purple, nil)
-highlight('DiagnosticFloatingHint', nil, blue, nil)
-highlight('DiagnosticSignError', nil, pink, nil)
-highlight('DiagnosticSignWarn', nil, orange, nil)
-highlight('DiagnosticSignInfo', nil, purple, nil)
-highlight('DiagnosticSignHint', nil, blue, nil)
-
--- Diffs
-highlight('DiffAdd', '#07090d', nil, nil)
-highlight('DiffChange', '#070a0c', nil, nil)
-highlight('DiffDelete', '#0a090b', nil, nil)
-highlight('DiffText', nil, text_gray, nil)
-
--- Syntax highlighting
-highlight('Comment', nil, comment_gray, 'italic')
-highlight('Constant', nil, blue, nil)
-highlight('Number', nil, orange, nil)
-highlight('String', nil, light_gray_2, nil)
-highlight('Identifier', nil, orange, 'italic')
-highlight('Function', nil, pink, 'italic')
-highlight('Statement', nil, blue, nil)
-highlight('Keyword', nil, blue, nil)
-highlight('Operator', nil, blue, nil)
-highlight('PreProc', nil, blue, nil)
-highlight('Type', nil, purple, nil)
-highlight('Special', nil, pink, nil)
-highlight('Underlined', nil, purple, 'underline')
-highlight('Todo', nil, orange, 'bold')
+local groups = {
+  Normal = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  NormalFloat = { fg = "#868690", bg = "#111216", ctermfg = 102, ctermbg = 233 },
+  NormalNC = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  EndOfBuffer = { fg = "#43444d", bg = "#000000", ctermfg = 238, ctermbg = 16 },
+  Cursor = { fg = "#c58fff", ctermfg = 141 },
+  CursorLine = { bg = "#131317", ctermbg = 233 },
+  CursorColumn = { bg = "#131317", ctermbg = 233 },
+  ColorColumn = { bg = "#131317", ctermbg = 233 },
+  SignColumn = { bg = "#000000", ctermbg = 16 },
+  LineNr = { fg = "#575861", ctermfg = 240 },
+  CursorLineNr = { fg = "#ffbb88", ctermfg = 216 },
+  WinSeparator = { fg = "#575861", ctermfg = 240 },
+  VertSplit = { fg = "#575861", ctermfg = 240 },
+  Folded = { fg = "#43444d", bg = "#000000", ctermfg = 238, ctermbg = 16 },
+  FoldColumn = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  NonText = { link = "Comment" },
+  Whitespace = { link = "Comment" },
+  Directory = { fg = "#fdfdfe", ctermfg = 231 },
+  Title = { fg = "#ffbb88", ctermfg = 216, bold = true },
+  StatusLine = { fg = "#000000", bg = "#575861", ctermfg = 16, ctermbg = 240 },
+  StatusLineNC = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  TabLine = { fg = "#575861", ctermfg = 240 },
+  TabLineSel = { fg = "#111216", bg = "#868690", ctermfg = 233, ctermbg = 102 },
+  TabLineFill = { fg = "#575861", ctermfg = 240 },
+  WinBar = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  WinBarNC = { fg = "#575861", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  Pmenu = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  PmenuSel = { fg = "#111216", bg = "#868690", ctermfg = 233, ctermbg = 102 },
+  PmenuSbar = { bg = "#111216", ctermbg = 233 },
+  PmenuThumb = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  FloatBorder = { fg = "#575861", ctermfg = 240 },
+  FloatTitle = { fg = "#ffbb88", bg = "#111216", ctermfg = 216, ctermbg = 233, bold = true },
+  Visual = { bg = "#131317", ctermbg = 233 },
+  Search = { fg = "#868690", bg = "#131217", ctermfg = 102, ctermbg = 233 },
+  CurSearch = { bg = "#27252f", ctermbg = 235 },
+  IncSearch = { fg = "#000000", bg = "#ffbb88", ctermfg = 16, ctermbg = 216 },
+  MatchParen = { bg = "#131217", ctermbg = 233, bold = true },
+  Error = { fg = "#f58ee0", ctermfg = 212 },
+  ErrorMsg = { fg = "#f58ee0", ctermfg = 212 },
+  WarningMsg = { fg = "#ffbb88", ctermfg = 216 },
+  DiagnosticError = { fg = "#f58ee0", ctermfg = 212 },
+  DiagnosticWarn = { fg = "#ffbb88", ctermfg = 216 },
+  DiagnosticInfo = { fg = "#c58fff", ctermfg = 141 },
+  DiagnosticHint = { fg = "#8eb6f5", ctermfg = 111 },
+  DiagnosticUnderlineError = { sp = "#f58ee0", undercurl = true },
+  DiagnosticUnderlineWarn = { sp = "#ffbb88", undercurl = true },
+  DiagnosticUnderlineInfo = { sp = "#c58fff", undercurl = true },
+  DiagnosticUnderlineHint = { sp = "#8eb6f5", undercurl = true },
+  LspInlayHint = { fg = "#43444d", bg = "#111216", ctermfg = 238, ctermbg = 233, italic = true },
+  LspCodeLens = { fg = "#43444d", ctermfg = 238, italic = true },
+  LspReferenceText = { bg = "#131217", ctermbg = 233 },
+  LspReferenceRead = { bg = "#131217", ctermbg = 233 },
+  LspReferenceWrite = { bg = "#131217", ctermbg = 233, bold = true },
+  DiffAdd = { bg = "#07090d", ctermbg = 232 },
+  DiffDelete = { bg = "#0a090b", ctermbg = 232 },
+  DiffChange = { bg = "#070a0c", ctermbg = 232 },
+  DiffText = { fg = "#868690", ctermfg = 102 },
+  Added = { fg = "#c58fff", ctermfg = 141 },
+  Changed = { fg = "#ffbb88", ctermfg = 216 },
+  Removed = { fg = "#f58ee0", ctermfg = 212 },
+  Comment = { fg = "#43444d", ctermfg = 238, italic = true },
+  Constant = { fg = "#8eb6f5", ctermfg = 111 },
+  String = { fg = "#9898a6", ctermfg = 247 },
+  Character = { fg = "#9898a6", ctermfg = 247 },
+  Number = { fg = "#ffbb88", ctermfg = 216 },
+  Float = { fg = "#ffbb88", ctermfg = 216 },
+  Boolean = { fg = "#ffbb88", ctermfg = 216 },
+  Identifier = { fg = "#ffbb88", ctermfg = 216, italic = true },
+  Function = { fg = "#f58ee0", ctermfg = 212, italic = true },
+  Statement = { fg = "#8eb6f5", ctermfg = 111 },
+  Keyword = { fg = "#8eb6f5", ctermfg = 111 },
+  Conditional = { link = "Keyword" },
+  Repeat = { link = "Conditional" },
+  Label = { link = "Keyword" },
+  Exception = { fg = "#8eb6f5", ctermfg = 111 },
+  Operator = { fg = "#8eb6f5", ctermfg = 111 },
+  PreProc = { fg = "#8eb6f5", ctermfg = 111 },
+  Type = { fg = "#c58fff", ctermfg = 141 },
+  StorageClass = { fg = "#8eb6f5", ctermfg = 111 },
+  Structure = { link = "Type" },
+  Typedef = { link = "Type" },
+  Special = { fg = "#f58ee0", ctermfg = 212 },
+  SpecialChar = { link = "Special" },
+  Tag = { link = "Special" },
+  Delimiter = { link = "Special" },
+  Underlined = { fg = "#c58fff", ctermfg = 141, underline = true },
+  Todo = { fg = "#ffbb88", ctermfg = 216, bold = true },
+  ["@comment"] = { fg = "#43444d", italic = true, ctermfg = 238 },
+  ["@string"] = { fg = "#9898a6", ctermfg = 247 },
+  ["@string.regexp"] = { fg = "#8eb6f5", ctermfg = 111 },
+  ["@string.escape"] = { fg = "#ffbb88", ctermfg = 216 },
+  ["@number"] = { fg = "#ffbb88", ctermfg = 216 },
+  ["@boolean"] = { fg = "#ffbb88", ctermfg = 216 },
+  ["@constant"] = { fg = "#8eb6f5", ctermfg = 111 },
+  ["@constant.builtin"] = { fg = "#ffbb88", ctermfg = 216 },
+  ["@function"] = { fg = "#ffbb88", ctermfg = 216 },
+  ["@function.call"] = { fg = "#ffbb88", ctermfg = 216 },
+  ["@function.method"] = { fg = "#ffbb88", ctermfg = 216 },
+  ["@constructor"] = { fg = "#8eb6f5", ctermfg = 111 },
+  ["@keyword"] = { fg = "#8eb6f5", ctermfg = 111 },
+  ["@operator"] = { fg = "#8eb6f5", ctermfg = 111 },
+  ["@type"] = { fg = "#c58fff", ctermfg = 141 },
+  ["@variable"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@variable.builtin"] = { fg = "#868690", italic = true, ctermfg = 102 },
+  ["@variable.parameter"] = { fg = "#ffffff", italic = true, ctermfg = 231 },
+  ["@variable.member"] = { fg = "#ffbb88", italic = true, ctermfg = 216 },
+  ["@property"] = { fg = "#ffbb88", italic = true, ctermfg = 216 },
+  ["@attribute"] = { fg = "#ffbb88", italic = true, ctermfg = 216 },
+  ["@tag"] = { fg = "#c58fff", ctermfg = 141 },
+  ["@tag.attribute"] = { fg = "#ffbb88", italic = true, ctermfg = 216 },
+  ["@punctuation"] = { fg = "#43444d", ctermfg = 238 },
+  ["@punctuation.bracket"] = { fg = "#575861", ctermfg = 240 },
+  ["@punctuation.delimiter"] = { fg = "#575861", ctermfg = 240 },
+  ["@markup.strong"] = { fg = "#ffffff", ctermfg = 231 },
+  ["@markup.italic"] = { fg = "#ffffff", ctermfg = 231 },
+  TermCursor = { fg = "#c58fff", ctermfg = 141 },
+  Question = { fg = "#ffbb88", ctermfg = 216 },
+  WildMenu = { fg = "#868690", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  SpecialComment = { link = "Special" },
+  Macro = { link = "Function" },
+  Debug = { link = "Special" },
+  ["@module"] = { link = "Type" },
+  ["@label"] = { link = "Label" },
+  TelescopeNormal = { link = "Normal" },
+  TelescopeBorder = { link = "FloatBorder" },
+  TelescopeMatching = { link = "Search" },
+  NvimTreeNormal = { link = "Normal" },
+  GitSignsAdd = { link = "Added" },
+  GitSignsChange = { link = "Changed" },
+  GitSignsDelete = { link = "Removed" },
+  VisualNOS = { bg = "#131317", ctermbg = 233, underline = true },
+  DiagnosticVirtualTextError = { fg = "#f58ee0", ctermfg = 212 },
+  DiagnosticVirtualTextWarn = { fg = "#ffbb88", ctermfg = 216 },
+  DiagnosticVirtualTextInfo = { fg = "#c58fff", ctermfg = 141 },
+  DiagnosticVirtualTextHint = { fg = "#8eb6f5", ctermfg = 111 },
+  DiagnosticFloatingError = { fg = "#f58ee0", ctermfg = 212 },
+  DiagnosticFloatingWarn = { fg = "#ffbb88", ctermfg = 216 },
+  DiagnosticFloatingInfo = { fg = "#c58fff", ctermfg = 141 },
+  DiagnosticFloatingHint = { fg = "#8eb6f5", ctermfg = 111 },
+  DiagnosticSignError = { fg = "#f58ee0", ctermfg = 212 },
+  DiagnosticSignWarn = { fg = "#ffbb88", ctermfg = 216 },
+  DiagnosticSignInfo = { fg = "#c58fff", ctermfg = 141 },
+  DiagnosticSignHint = { fg = "#8eb6f5", ctermfg = 111 },
+  TSPunctDelimiter = { fg = "#868690", ctermfg = 102 },
+  TSVariable = { fg = "#ffbb88", ctermfg = 216, italic = true },
+  TSType = { fg = "#c58fff", ctermfg = 141 },
+  TSFunction = { fg = "#f58ee0", ctermfg = 212, italic = true },
+  TSComment = { fg = "#43444d", ctermfg = 238, italic = true },
+  TSString = { fg = "#9898a6", ctermfg = 247 },
+  TSKeyword = { fg = "#8eb6f5", ctermfg = 111 },
+  TSOperator = { fg = "#8eb6f5", ctermfg = 111 },
+  LspCodeLensSeparator = { fg = "#575861", ctermfg = 240 },
+  LspSignatureActiveParameter = { fg = "#ffbb88", ctermfg = 216, bold = true },
+  FloatFooter = { fg = "#43444d", bg = "#111216", ctermfg = 238, ctermbg = 233 },
+  FloatShadow = { bg = "#000000", ctermbg = 16 },
+  FloatShadowThrough = { bg = "#000000", ctermbg = 16 },
+  TermCursorNC = { fg = "#575861", ctermfg = 240 },
+  NotifyERRORBorder = { fg = "#f58ee0", ctermfg = 212 },
+  NotifyWARNBorder = { fg = "#ffbb88", ctermfg = 216 },
+  NotifyINFOBorder = { fg = "#8eb6f5", ctermfg = 111 },
+  NotifyDEBUGBorder = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACEBorder = { fg = "#c58fff", ctermfg = 141 },
+  NotifyERRORIcon = { fg = "#f58ee0", ctermfg = 212 },
+  NotifyWARNIcon = { fg = "#ffbb88", ctermfg = 216 },
+  NotifyINFOIcon = { fg = "#8eb6f5", ctermfg = 111 },
+  NotifyDEBUGIcon = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACEIcon = { fg = "#c58fff", ctermfg = 141 },
+  NotifyERRORTitle = { fg = "#f58ee0", ctermfg = 212 },
+  NotifyWARNTitle = { fg = "#ffbb88", ctermfg = 216 },
+  NotifyINFOTitle = { fg = "#8eb6f5", ctermfg = 111 },
+  NotifyDEBUGTitle = { fg = "#575861", ctermfg = 240 },
+  NotifyTRACETitle = { fg = "#c58fff", ctermfg = 141 },
+  PreCondit = { link = "PreProc" },
+  TSConstant = { link = "Constant" },
+  TSNumber = { link = "Number" },
+  TSFloat = { link = "Number" },
+  TSBoolean = { link = "Constant" },
+  TSConstructor = { link = "Type" },
+  TSField = { link = "Identifier" },
+  TSParameter = { link = "Identifier" },
+  TSParameterReference = { link = "TSParameter" },
+  TSProperty = { link = "TSField" },
+  TSMethod = { link = "Function" },
+  TSConditional = { link = "Conditional" },
+  TSRepeat = { link = "Repeat" },
+  TSLabel = { link = "Label" },
+  TSException = { link = "Exception" },
+  TSNamespace = { link = "Type" },
+  TSTag = { link = "Tag" },
+  TSTagDelimiter = { link = "Delimiter" },
+  TSPunctSpecial = { link = "TSPunctDelimiter" },
+  TelescopeTitle = { link = "FloatTitle" },
+  TelescopePromptPrefix = { link = "Identifier" },
+  TelescopePromptCounter = { link = "Comment" },
+  NvimTreeFolderName = { link = "Directory" },
+  NvimTreeRootFolder = { link = "Type" },
+  NvimTreeFolderIcon = { link = "Type" },
+  NvimTreeFileIcon = { link = "Type" },
+  NvimTreeSpecialFile = { link = "Type" },
+  NvimTreeOpenedFile = { link = "Type" },
+  NvimTreeIndentMarker = { link = "IndentBlanklineChar" },
+  NvimTreeWindowPicker = { link = "FloatTitle" },
+  BufferLineFill = { link = "TabLineFill" },
+  BufferLineBackground = { link = "TabLine" },
+  BufferLineBufferSelected = { link = "TabLineSel" },
+  IlluminatedWordRead = { link = "LspReferenceRead" },
+  IlluminatedWordText = { link = "LspReferenceText" },
+  IlluminatedWordWrite = { link = "LspReferenceWrite" },
+  NavicIconsFile = { fg = "#8eb6f5", ctermfg = 111 },
+  NavicIconsModule = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsNamespace = { fg = "#8eb6f5", ctermfg = 111 },
+  NavicIconsPackage = { fg = "#575861", ctermfg = 240 },
+  NavicIconsClass = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsMethod = { fg = "#f58ee0", ctermfg = 212 },
+  NavicIconsProperty = { fg = "#9898a6", ctermfg = 247 },
+  NavicIconsField = { fg = "#9898a6", ctermfg = 247 },
+  NavicIconsConstructor = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsEnum = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsInterface = { fg = "#c58fff", ctermfg = 141 },
+  NavicIconsFunction = { fg = "#f58ee0", ctermfg = 212 },
+  NavicIconsVariable = { fg = "#9898a6", ctermfg = 247 },
+  NavicIconsConstant = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsString = { fg = "#9898a6", ctermfg = 247 },
+  NavicIconsNumber = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsBoolean = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsArray = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsObject = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsKey = { fg = "#8eb6f5", ctermfg = 111 },
+  NavicIconsNull = { fg = "#43444d", ctermfg = 238 },
+  NavicIconsEnumMember = { fg = "#9898a6", ctermfg = 247 },
+  NavicIconsStruct = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsEvent = { fg = "#ffbb88", ctermfg = 216 },
+  NavicIconsOperator = { fg = "#8eb6f5", ctermfg = 111 },
+  NavicIconsTypeParameter = { fg = "#9898a6", ctermfg = 247 },
+  NavicText = { fg = "#868690", ctermfg = 102 },
+  NavicSeparator = { fg = "#575861", ctermfg = 240 },
+}
 
--- TreeSitter specific
-highlight('TSPunctDelimiter', nil, text_gray, nil)
-highlight('TSVariable', nil, orange, 'italic')
-highlight('TSType', nil, purple, nil)
-highlight('TSFunction', nil, pink, 'italic')
-highlight('TSComment', nil, comment_gray, 'italic')
-highlight('TSString', nil, light_gray_2, nil)
-highlight('TSKeyword', nil, blue, nil)
-highlight('TSOperator', nil, blue, nil)
-
--- LSP Specific (enhanced)
-highlight('LspReferenceText', selection_bg, nil, nil)
-highlight('LspReferenceRead', selection_bg, nil, nil)
-highlight('LspReferenceWrite', selection_bg, nil, 'bold')
-highlight('LspCodeLens', nil, comment_gray, 'italic')
-highlight('LspCodeLensSeparator', nil, light_gray, nil)
-highlight('LspSignatureActiveParameter', nil, orange, 'bold')
-highlight('LspInlayHint', dark_gray, comment_gray, 'italic')
-
--- Floating windows (Neovim 0.9+)
-highlight('FloatBorder', nil, light_gray, nil)
-highlight('FloatTitle', dark_gray, orange, 'bold')
-highlight('FloatFooter', dark_gray, comment_gray, nil)
-highlight('FloatShadow', '#000000', nil, nil)
-highlight('FloatShadowThrough', '#00000088', nil, nil)
-
--- Winbar (Neovim 0.9+)
-highlight('WinBar', black, text_gray, nil)
-highlight('WinBarNC', black, light_gray, nil)
-
--- Neovim terminal colors
-highlight('TermCursor', nil, purple, nil)
-highlight('TermCursorNC', nil, light_gray, nil)
-vim.g.terminal_color_0 = black
-vim.g.terminal_color_1 = pink
-vim.g.terminal_color_2 = blue
-vim.g.terminal_color_3 = orange
-vim.g.terminal_color_4 = purple
-vim.g.terminal_color_5 = pink
-vim.g.terminal_color_6 = light_gray_2
-vim.g.terminal_color_7 = text_gray
-vim.g.terminal_color_8 = light_gray
-vim.g.terminal_color_9 = pink
-vim.g.terminal_color_10 = blue
-vim.g.terminal_color_11 = orange
-vim.g.terminal_color_12 = purple
-vim.g.terminal_color_13 = pink
-vim.g.terminal_color_14 = light_gray_2
-vim.g.terminal_color_15 = white
-
--- Neovim notifications (0.9+)
-highlight('NotifyERRORBorder', nil, pink, nil)
-highlight('NotifyWARNBorder', nil, orange, nil)
-highlight('NotifyINFOBorder', nil, blue, nil)
-highlight('NotifyDEBUGBorder', nil, light_gray, nil)
-highlight('NotifyTRACEBorder', nil, purple, nil)
-highlight('NotifyERRORIcon', nil, pink, nil)
-highlight('NotifyWARNIcon', nil, orange, nil)
-highlight('NotifyINFOIcon', nil, blue, nil)
-highlight('NotifyDEBUGIcon', nil, light_gray, nil)
-highlight('NotifyTRACEIcon', nil, purple, nil)
-highlight('NotifyERRORTitle', nil, pink, nil)
-highlight('NotifyWARNTitle', nil, orange, nil)
-highlight('NotifyINFOTitle', nil, blue, nil)
-highlight('NotifyDEBUGTitle', nil, light_gray, nil)
-highlight('NotifyTRACETitle', nil, purple, nil)
-
--- Links to standard groups
-link('NonText', 'Comment')
-link('Whitespace', 'Comment')
-link('Conditional', 'Keyword')
-link('Repeat', 'Conditional')
-link('Label', 'Keyword')
-link('Macro', 'Function')
-link('PreCondit', 'PreProc')
-link('Structure', 'Type')
-link('Typedef', 'Type')
-link('SpecialChar', 'Special')
-link('Tag', 'Special')
-link('Delimiter', 'Special')
-link('SpecialComment', 'Special')
-link('Debug', 'Special')
-
--- Additional TreeSitter links
-link('TSConstant', 'Constant')
-link('TSNumber', 'Number')
-link('TSFloat', 'Number')
-link('TSBoolean', 'Constant')
-link('TSConstructor', 'Type')
-link('TSField', 'Identifier')
-link('TSParameter', 'Identifier')
-link('TSParameterReference', 'TSParameter')
-link('TSProperty', 'TSField')
-link('TSMethod', 'Function')
-link('TSConditional', 'Conditional')
-link('TSRepeat', 'Repeat')
-link('TSLabel', 'Label')
-link('TSException', 'Exception')
-link('TSNamespace', 'Type')
-link('TSTag', 'Tag')
-link('TSTagDelimiter', 'Delimiter')
-link('TSPunctSpecial', 'TSPunctDelimiter')
-
--- UI elements for plugins
-link('TelescopeNormal', 'Normal')
-link('TelescopeBorder', 'FloatBorder')
-link('TelescopeTitle', 'FloatTitle')
-link('TelescopePromptPrefix', 'Identifier')
-link('TelescopeMatching', 'Search')
-link('TelescopePromptCounter', 'Comment')
-
-link('NvimTreeNormal', 'Normal')
-link('NvimTreeFolderName', 'Directory')
-link('NvimTreeRootFolder', 'Type')
-link('NvimTreeFolderIcon', 'Type')
-link('NvimTreeFileIcon', 'Type')
-link('NvimTreeSpecialFile', 'Type')
-link('NvimTreeOpenedFile', 'Type')
-link('NvimTreeIndentMarker', 'IndentBlanklineChar')
-link('NvimTreeWindowPicker', 'FloatTitle')
-
-link('BufferLineFill', 'TabLineFill')
-link('BufferLineBackground', 'TabLine')
-link('BufferLineBufferSelected', 'TabLineSel')
-
--- Additional Neovim 0.9+ highlights
-link('IlluminatedWordRead', 'LspReferenceRead')
-link('IlluminatedWordText', 'LspReferenceText')
-link('IlluminatedWordWrite', 'LspReferenceWrite')
+local set_hl = vim.api.nvim_set_hl
+for name, spec in pairs(groups) do
+  set_hl(0, name, spec)
+end
 
--- Navic (breadcrumbs) support
-highlight('NavicIconsFile', nil, blue, nil)
-highlight('NavicIconsModule', nil, orange, nil)
-highlight('NavicIconsNamespace', nil, blue, nil)
-highlight('NavicIconsPackage', nil, light_gray, nil)
-highlight('NavicIconsClass', nil, orange, nil)
-highlight('NavicIconsMethod', nil, pink, nil)
-highlight('NavicIconsProperty', nil, light_gray_2, nil)
-highlight('NavicIconsField', nil, light_gray_2, nil)
-highlight('NavicIconsConstructor', nil, orange, nil)
-highlight('NavicIconsEnum', nil, orange, nil)
-highlight('NavicIconsInterface', nil, purple, nil)
-highlight('NavicIconsFunction', nil, pink, nil)
-highlight('NavicIconsVariable', nil, light_gray_2, nil)
-highlight('NavicIconsConstant', nil, orange, nil)
-highlight('NavicIconsString', nil, light_gray_2, nil)
-highlight('NavicIconsNumber', nil, orange, nil)
-highlight('NavicIconsBoolean', nil, orange, nil)
-highlight('NavicIconsArray', nil, orange, nil)
-highlight('NavicIconsObject', nil, orange, nil)
-highlight('NavicIconsKey', nil, blue, nil)
-highlight('NavicIconsNull', nil, comment_gray, nil)
-highlight('NavicIconsEnumMember', nil, light_gray_2, nil)
-highlight('NavicIconsStruct', nil, orange, nil)
-highlight('NavicIconsEvent', nil, orange, nil)
-highlight('NavicIconsOperator', nil, blue, nil)
-highlight('NavicIconsTypeParameter', nil, light_gray_2, nil)
-highlight('NavicText', nil, text_gray, nil)
-highlight('NavicSeparator', nil, light_gray, nil)
+vim.g.terminal_color_0 = "#000000"
+vim.g.terminal_color_1 = "#f58ee0"
+vim.g.terminal_color_2 = "#8eb6f5"
+vim.g.terminal_color_3 = "#ffbb88"
+vim.g.terminal_color_4 = "#c58fff"
+vim.g.terminal_color_5 = "#f58ee0"
+vim.g.terminal_color_6 = "#9898a6"
+vim.g.terminal_color_7 = "#868690"
+vim.g.terminal_color_8 = "#575861"
+vim.g.terminal_color_9 = "#f58ee0"
+vim.g.terminal_color_10 = "#8eb6f5"
+vim.g.terminal_color_11 = "#ffbb88"
+vim.g.terminal_color_12 = "#c58fff"
+vim.g.terminal_color_13 = "#f58ee0"
+vim.g.terminal_color_14 = "#9898a6"
+vim.g.terminal_color_15 = "#fdfdfe"
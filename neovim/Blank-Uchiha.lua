@@ -0,0 +1,162 @@
+-- Blank-Uchiha.lua - generated by convert_theme.py from vscode-themes/Blank-Uchiha.json.
+-- Do not edit by hand; rerun convert_theme.py --neovim instead.
+vim.cmd("highlight clear")
+if vim.fn.exists("syntax_on") == 1 then
+  vim.cmd("syntax reset")
+end
+vim.g.colors_name = "Blank-Uchiha"
+
+local groups = {
+  Normal = { fg = "#868686", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  NormalFloat = { fg = "#575757", bg = "#111111", ctermfg = 240, ctermbg = 233 },
+  NormalNC = { fg = "#868686", bg = "#000000", ctermfg = 102, ctermbg = 16 },
+  EndOfBuffer = { fg = "#000000", ctermfg = 16 },
+  Cursor = { fg = "#000000", bg = "#a33b45", ctermfg = 16, ctermbg = 131 },
+  CursorLine = { bg = "#0a0909", ctermbg = 232 },
+  CursorColumn = { bg = "#0a0909", ctermbg = 232 },
+  ColorColumn = { bg = "#0a0909", ctermbg = 232 },
+  SignColumn = { bg = "#000000", ctermbg = 16 },
+  LineNr = { fg = "#575757", ctermfg = 240 },
+  CursorLineNr = { fg = "#868686", ctermfg = 102 },
+  WinSeparator = { fg = "#282323", ctermfg = 235 },
+  VertSplit = { fg = "#282323", ctermfg = 235 },
+  Folded = { fg = "#575757", bg = "#111111", ctermfg = 240, ctermbg = 233 },
+  FoldColumn = { fg = "#575757", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  NonText = { fg = "#434343", ctermfg = 238 },
+  Whitespace = { fg = "#434343", ctermfg = 238 },
+  Directory = { fg = "#f0f0f0", ctermfg = 255 },
+  Title = { fg = "#f0f0f0", ctermfg = 255, bold = true },
+  StatusLine = { fg = "#575757", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  StatusLineNC = { fg = "#575757", bg = "#000000", ctermfg = 240, ctermbg = 16 },
+  TabLine = { fg = "#575757", ctermfg = 240 },
+  TabLineSel = { fg = "#868686", bg = "#0a0909", ctermfg = 102, ctermbg = 232 },
+  TabLineFill = { bg = "#000000", ctermbg = 16 },
+  WinBar = { fg = "#434343", bg = "#0f0f0f", ctermfg = 238, ctermbg = 233 },
+  WinBarNC = { fg = "#434343", bg = "#0f0f0f", ctermfg = 238, ctermbg = 233 },
+  Pmenu = { fg = "#575757", bg = "#111111", ctermfg = 240, ctermbg = 233 },
+  PmenuSel = { fg = "#868686", bg = "#131111", ctermfg = 102, ctermbg = 233 },
+  PmenuSbar = { bg = "#111111", ctermbg = 233 },
+  PmenuThumb = { bg = "#282323", ctermbg = 235 },
+  FloatBorder = { fg = "#131313", bg = "#111111", ctermfg = 233, ctermbg = 233 },
+  FloatTitle = { fg = "#868686", bg = "#111111", ctermfg = 102, ctermbg = 233, bold = true },
+  Visual = { bg = "#131111", ctermbg = 233 },
+  Search = { bg = "#282323", ctermbg = 235 },
+  CurSearch = { bg = "#282323", ctermbg = 235 },
+  IncSearch = { bg = "#282323", ctermbg = 235 },
+  MatchParen = { bg = "#131111", ctermbg = 233, bold = true },
+  Error = { fg = "#bd4450", ctermfg = 167 },
+  ErrorMsg = { fg = "#bd4450", ctermfg = 167 },
+  WarningMsg = { fg = "#989898", ctermfg = 246 },
+  DiagnosticError = { fg = "#bd4450", ctermfg = 167 },
+  DiagnosticWarn = { fg = "#989898", ctermfg = 246 },
+  DiagnosticInfo = { fg = "#8c3037", ctermfg = 131 },
+  DiagnosticHint = { fg = "#575757", ctermfg = 240 },
+  DiagnosticUnderlineError = { sp = "#bd4450", undercurl = true },
+  DiagnosticUnderlineWarn = { sp = "#989898", undercurl = true },
+  DiagnosticUnderlineInfo = { sp = "#8c3037", undercurl = true },
+  DiagnosticUnderlineHint = { sp = "#575757", undercurl = true },
+  LspInlayHint = { fg = "#575757", bg = "#131313", ctermfg = 240, ctermbg = 233 },
+  LspCodeLens = { fg = "#a33b45", ctermfg = 131 },
+  LspReferenceText = { bg = "#131111", ctermbg = 233 },
+  LspReferenceRead = { bg = "#131111", ctermbg = 233 },
+  LspReferenceWrite = { bg = "#131111", ctermbg = 233, bold = true },
+  DiffAdd = { bg = "#0b0404", ctermbg = 232 },
+  DiffDelete = { bg = "#0f0506", ctermbg = 232 },
+  DiffChange = { bg = "#0a0909", ctermbg = 232 },
+  DiffText = { bg = "#131111", ctermbg = 233 },
+  Added = { fg = "#8c3037", ctermfg = 131 },
+  Changed = { fg = "#b87878", ctermfg = 174 },
+  Removed = { fg = "#bd4450", ctermfg = 167 },
+  Comment = { fg = "#253037", italic = true, ctermfg = 236 },
+  Constant = { fg = "#a33b45", ctermfg = 131 },
+  String = { fg = "#989898", ctermfg = 246 },
+  Character = { fg = "#989898", ctermfg = 246 },
+  Number = { fg = "#b87878", ctermfg = 174 },
+  Float = { fg = "#b87878", ctermfg = 174 },
+  Boolean = { fg = "#b87878", ctermfg = 174 },
+  Identifier = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  Function = { fg = "#b87878", ctermfg = 174 },
+  Statement = { fg = "#a33b45", ctermfg = 131 },
+  Keyword = { fg = "#a33b45", ctermfg = 131 },
+  Conditional = { fg = "#a33b45", ctermfg = 131 },
+  Repeat = { fg = "#a33b45", ctermfg = 131 },
+  Label = { fg = "#a33b45", ctermfg = 131 },
+  Exception = { fg = "#a33b45", ctermfg = 131 },
+  Operator = { fg = "#a33b45", ctermfg = 131 },
+  PreProc = { fg = "#a33b45", ctermfg = 131 },
+  Type = { fg = "#8c3037", ctermfg = 131 },
+  StorageClass = { fg = "#a33b45", ctermfg = 131 },
+  Structure = { fg = "#8c3037", ctermfg = 131 },
+  Typedef = { fg = "#8c3037", ctermfg = 131 },
+  Special = { fg = "#b87878", ctermfg = 174 },
+  SpecialChar = { fg = "#b87878", ctermfg = 174 },
+  Tag = { fg = "#8c3037", ctermfg = 131 },
+  Delimiter = { fg = "#434343", ctermfg = 238 },
+  Underlined = { fg = "#f0f0f0", ctermfg = 255, underline = true },
+  Todo = { fg = "#989898", ctermfg = 246, bold = true },
+  ["@comment"] = { fg = "#253037", italic = true, ctermfg = 236 },
+  ["@string"] = { fg = "#989898", ctermfg = 246 },
+  ["@string.regexp"] = { fg = "#989898", ctermfg = 246 },
+  ["@string.escape"] = { fg = "#b87878", ctermfg = 174 },
+  ["@number"] = { fg = "#b87878", ctermfg = 174 },
+  ["@boolean"] = { fg = "#b87878", ctermfg = 174 },
+  ["@constant"] = { fg = "#a33b45", ctermfg = 131 },
+  ["@constant.builtin"] = { fg = "#b87878", ctermfg = 174 },
+  ["@function"] = { fg = "#b87878", ctermfg = 174 },
+  ["@function.call"] = { fg = "#b87878", ctermfg = 174 },
+  ["@function.method"] = { fg = "#b87878", ctermfg = 174 },
+  ["@constructor"] = { fg = "#b87878", ctermfg = 174 },
+  ["@keyword"] = { fg = "#a33b45", ctermfg = 131 },
+  ["@operator"] = { fg = "#a33b45", ctermfg = 131 },
+  ["@type"] = { fg = "#8c3037", ctermfg = 131 },
+  ["@variable"] = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  ["@variable.builtin"] = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  ["@variable.parameter"] = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  ["@variable.member"] = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  ["@property"] = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  ["@attribute"] = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  ["@tag"] = { fg = "#8c3037", ctermfg = 131 },
+  ["@tag.attribute"] = { fg = "#b1bac9", italic = true, ctermfg = 250 },
+  ["@punctuation"] = { fg = "#434343", ctermfg = 238 },
+  ["@punctuation.bracket"] = { fg = "#575757", ctermfg = 240 },
+  ["@punctuation.delimiter"] = { fg = "#575757", ctermfg = 240 },
+  ["@markup.strong"] = { fg = "#868686", ctermfg = 102 },
+  ["@markup.italic"] = { fg = "#868686", ctermfg = 102 },
+  TermCursor = { link = "Cursor" },
+  Question = { link = "Title" },
+  WildMenu = { link = "PmenuSel" },
+  SpecialComment = { link = "Comment" },
+  Macro = { link = "Function" },
+  Debug = { link = "Special" },
+  ["@module"] = { link = "Type" },
+  ["@label"] = { link = "Label" },
+  TelescopeNormal = { link = "NormalFloat" },
+  TelescopeBorder = { link = "FloatBorder" },
+  TelescopeMatching = { link = "Search" },
+  NvimTreeNormal = { link = "Normal" },
+  GitSignsAdd = { link = "Added" },
+  GitSignsChange = { link = "Changed" },
+  GitSignsDelete = { link = "Removed" },
+}
+
+local set_hl = vim.api.nvim_set_hl
+for name, spec in pairs(groups) do
+  set_hl(0, name, spec)
+end
+
+vim.g.terminal_color_0 = "#131313"
+vim.g.terminal_color_1 = "#bd4450"
+vim.g.terminal_color_2 = "#8eb6f5"
+vim.g.terminal_color_3 = "#989898"
+vim.g.terminal_color_4 = "#8c3037"
+vim.g.terminal_color_5 = "#f0f0f0"
+vim.g.terminal_color_6 = "#b87878"
+vim.g.terminal_color_7 = "#868686"
+vim.g.terminal_color_8 = "#575757"
+vim.g.terminal_color_9 = "#bd4450"
+vim.g.terminal_color_10 = "#a33b45"
+vim.g.terminal_color_11 = "#989898"
+vim.g.terminal_color_12 = "#8c3037"
+vim.g.terminal_color_13 = "#f0f0f0"
+vim.g.terminal_color_14 = "#a33b45"
+vim.g.terminal_color_15 = "#868686"
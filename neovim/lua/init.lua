@@ -2,7 +2,7 @@
 
    -- Default config
    M.config = {
-     style = "Moonlight", -- "Moonlight", "Ghibli", or "Monochrome"
+     style = "Moonlight", -- "Moonlight", "Ghibli", "Monochrome" or "Uchiha"
      transparent = false  -- Allow for future transparent background option
    }
 
@@ -0,0 +1,96 @@
+import argparse
+import glob
+import json
+import os
+
+import colormath
+from jsonc import load as load_json
+
+# Color interning for theme files.
+#
+# Themes repeat a handful of hex values across hundreds of keys. intern()
+# collects every color in a theme document into a palette table, keyed by
+# the normalized color, with the keys that use it. The report shows how much
+# of a file is repetition, and --minify writes compact copies of the files
+# for packaging. JSON has no references, so compact JSON is as far as the
+# Zed and VS Code formats go; the Neovim emitter can reference a palette
+# table instead (convert_theme.py --compact).
+#
+#   python palette.py                          report on themes/*.json
+#   python palette.py vscode-themes/*.json --top 5
+#   python palette.py vscode-themes/*.json --minify dist/
+
+
+def walk_colors(node, path=""):
+    # Yields (key path, value) for every string that parses as a color
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from walk_colors(value, f"{path}.{key}" if path else key)
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            yield from walk_colors(value, f"{path}[{i}]")
+    elif colormath.parse(node) is not None:
+        yield path, node
+
+
+def normalize(value):
+    # "#FFF", "#ffffff" and "#FFFFFFFF" intern to the same entry
+    return colormath.to_hex(colormath.parse(value))
+
+
+def intern(doc):
+    # Normalized color -> [key paths], most used first (ties keep the order
+    # of first use, so the table is stable)
+    table = {}
+    for path, value in walk_colors(doc):
+        table.setdefault(normalize(value), []).append(path)
+    return dict(sorted(table.items(), key=lambda item: -len(item[1])))
+
+
+def compact_dumps(doc):
+    return json.dumps(doc, separators=(",", ":"), ensure_ascii=False)
+
+
+def summarize(table):
+    uses = sum(len(paths) for paths in table.values())
+    return {"colors": uses, "distinct": len(table), "repeated": uses - len(table)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report repeated colors in theme files and write compact copies.")
+    parser.add_argument("paths", nargs="*", help="theme files (default: themes/*.json)")
+    parser.add_argument("--top", type=int, default=10, help="colors to list per file (default: 10)")
+    parser.add_argument("--json", metavar="PATH", help="write the full palette table of every file to a JSON report")
+    parser.add_argument("--minify", metavar="DIR", help="write compact copies of the files to DIR")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob("themes/*.json"))
+    report = {}
+    for path in paths:
+        doc = load_json(path)
+        table = intern(doc)
+        summary = summarize(table)
+        report[path] = {"summary": summary, "palette": table}
+        print(f"{path}: {summary['colors']} color values, {summary['distinct']} distinct, "
+              f"{summary['repeated']} repeats")
+        for color, keys in list(table.items())[:args.top]:
+            sample = ", ".join(keys[:3]) + (", ..." if len(keys) > 3 else "")
+            print(f"  {color:<10} {len(keys):>4}x  {sample}")
+
+        if args.minify:
+            os.makedirs(args.minify, exist_ok=True)
+            out_path = os.path.join(args.minify, os.path.basename(path))
+            with open(out_path, 'w') as f:
+                f.write(compact_dumps(doc))
+            before = os.path.getsize(path)
+            after = os.path.getsize(out_path)
+            print(f"  -> Wrote {out_path} ({before} -> {after} bytes, {100 - after * 100 // max(before, 1)}% smaller)")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
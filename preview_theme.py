@@ -0,0 +1,359 @@
+import argparse
+import glob
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+
+import colormath
+from convert_theme import compile_selector, lookup_scope, scope_matches
+from jsonc import load as load_json
+
+# Headless previews of the sample files in every theme, as one HTML page and
+# as truecolor ANSI for the terminal.
+#
+# Tokenizing is the slow part, so each sample is tokenized once into
+# (text, TextMate scope) pairs and cached in .preview-cache.json, keyed by
+# the file's hash. Rendering then only styles the few dozen distinct scopes
+# per theme: the HTML markup of each file is built once and shared by every
+# theme, which only contributes a stylesheet, and ANSI output reuses the
+# same per-scope styles.
+#
+#   python preview_theme.py                       write preview.html for every theme
+#   python preview_theme.py --ansi --theme Uchiha print the samples in matching themes
+
+SAMPLE_FILES = ["example.ts", "trial.ts"]
+CACHE_PATH = ".preview-cache.json"
+OUTPUT_PATH = "preview.html"
+
+# Bump when the tokenizer's output changes
+TOKENIZER_VERSION = "1"
+
+KEYWORDS = {
+    "keyword.control.ts": "if else for while do return switch case default break continue try catch finally "
+                          "throw import export from as await yield of in",
+    "keyword.operator.expression.ts": "new typeof instanceof keyof delete void",
+    "storage.type.ts": "const let var function class interface enum type namespace module declare",
+    "storage.modifier.ts": "public private protected static readonly abstract async extends implements",
+    "constant.language.boolean.ts": "true false",
+    "constant.language.null.ts": "null undefined",
+    "variable.language.this.ts": "this super",
+    "support.type.primitive.ts": "string number boolean any void never unknown bigint symbol object",
+}
+KEYWORD_SCOPES = {word: scope for scope, words in KEYWORDS.items() for word in words.split()}
+
+# Keywords after which an identifier names a type
+TYPE_INTRODUCERS = {"class", "interface", "enum", "type", "extends", "implements", "new", "namespace"}
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<doc>/\*\*.*?\*/)
+  | (?P<block>/\*.*?\*/)
+  | (?P<line>//[^\n]*)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<template>`(?:\\.|[^`\\])*`)
+  | (?P<number>\b(?:0[xX][0-9a-fA-F_]+|0[bB][01_]+|0[oO][0-7_]+|\d[\d_]*(?:\.\d+)?(?:[eE][+-]?\d+)?)n?\b)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<space>\s+)
+  | (?P<arrow>=>)
+  | (?P<operator>[-+*/%=!<>&|^~?:]+)
+  | (?P<terminator>;)
+  | (?P<comma>,)
+  | (?P<dot>\.)
+  | (?P<brace>[{}])
+  | (?P<paren>[()])
+  | (?P<bracket>[\[\]])
+  | (?P<decorator>@)
+  | (?P<other>.)
+""", re.S | re.X)
+
+PUNCTUATION_SCOPES = {
+    "terminator": "punctuation.terminator.statement.ts",
+    "comma": "punctuation.separator.comma.ts",
+    "dot": "punctuation.accessor.ts",
+    "brace": "punctuation.definition.block.ts",
+    "paren": "punctuation.section.parens.ts",
+    "bracket": "punctuation.section.brackets.ts",
+    "decorator": "punctuation.decorator.ts",
+    "arrow": "storage.type.function.arrow.ts",
+    "operator": "keyword.operator.ts",
+    "doc": "comment.block.documentation.ts",
+    "block": "comment.block.ts",
+    "line": "comment.line.double-slash.ts",
+    "string": "string.quoted.ts",
+    "template": "string.template.ts",
+    "number": "constant.numeric.decimal.ts",
+}
+
+
+def tokenize(text):
+    # A small TypeScript lexer: enough to give the samples the scopes a
+    # TextMate grammar would. Returns lines of [text, scope or None].
+    tokens = []
+    previous = None  # last non-space token as (kind, text)
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+        scope = PUNCTUATION_SCOPES.get(kind)
+        if kind == "word":
+            following = text[match.end():match.end() + 64].lstrip()
+            if value in KEYWORD_SCOPES:
+                scope = KEYWORD_SCOPES[value]
+            elif previous and previous[1] in TYPE_INTRODUCERS:
+                scope = "entity.name.type.ts"
+            elif following.startswith("("):
+                scope = "entity.name.function.ts"
+            elif previous and previous[0] == "dot":
+                scope = "variable.other.property.ts"
+            elif previous and previous[0] == "decorator":
+                scope = "entity.name.function.decorator.ts"
+            elif value[:1].isupper() and previous and previous[1] == ":":
+                scope = "entity.name.type.ts"
+            else:
+                scope = "variable.other.readwrite.ts"
+        if kind in ("space", "other"):
+            scope = None
+        else:
+            previous = (kind, value)
+        tokens.append((value, scope))
+
+    # Split multi-line tokens (comments, template strings) into lines
+    lines = [[]]
+    for value, scope in tokens:
+        parts = value.split("\n")
+        for i, part in enumerate(parts):
+            if i:
+                lines.append([])
+            if part:
+                lines[-1].append([part, scope])
+    return lines
+
+
+def load_tokens(paths, cache_path=CACHE_PATH):
+    # path -> lines of tokens, tokenizing only files whose content changed.
+    # Returns (tokens, number of files tokenized).
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        cache = {}
+    tokens = {}
+    fresh = {}
+    tokenized = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        key = hashlib.sha256(TOKENIZER_VERSION.encode() + data).hexdigest()
+        entry = cache.get(path)
+        if not entry or entry.get("key") != key:
+            entry = {"key": key, "lines": tokenize(data.decode("utf-8"))}
+            tokenized += 1
+        fresh[path] = entry
+        tokens[path] = entry["lines"]
+    if fresh != cache:
+        with open(cache_path, 'w') as f:
+            json.dump(fresh, f)
+    return tokens, tokenized
+
+
+def vscode_styler(theme):
+    # scope -> (color, italic, bold) for a VS Code theme, matching its
+    # tokenColors rules the way convert_syntax ranks them (without ancestor
+    # context, which a flat token stream does not have)
+    colors = theme.get("colors", {})
+    rules = []
+    for index, rule in enumerate(theme.get("tokenColors", [])):
+        scope = rule.get("scope")
+        settings = rule.get("settings", {})
+        selectors = [scope] if isinstance(scope, str) else scope if isinstance(scope, list) else [""]
+        for selector in selectors:
+            for path, exclusions in compile_selector(selector):
+                if len(path) == 1:
+                    rules.append((path[0], exclusions, index, settings))
+        if scope is None:
+            # A rule without a scope sets the defaults
+            rules.append(("", (), index, settings))
+    default = colors.get("editor.foreground", "#cccccc")
+
+    def style(scope):
+        best_color = best_font = None
+        for element, exclusions, index, settings in rules:
+            if element and not (scope and scope_matches(element, scope)):
+                continue
+            if scope and any(scope_matches(x, scope) for x in exclusions):
+                continue
+            rank = (element.count(".") + 1 if element else 0, index)
+            if settings.get("foreground") and (best_color is None or rank > best_color[0]):
+                best_color = (rank, settings["foreground"])
+            if "fontStyle" in settings and (best_font is None or rank > best_font[0]):
+                best_font = (rank, settings["fontStyle"] or "")
+        font = best_font[1] if best_font and isinstance(best_font[1], str) else ""
+        return (best_color[1] if best_color else default, "italic" in font, "bold" in font)
+
+    return colors.get("editor.background", "#1e1e1e"), default, style
+
+
+def zed_styler(theme):
+    # scope -> (color, italic, bold) for a Zed theme family, through the
+    # same scope -> Zed key mapping the converter uses. Missing keys fall
+    # back to their dotted parent, as in Zed.
+    style_table = theme["themes"][0]["style"]
+    syntax = style_table.get("syntax", {})
+    default = style_table.get("editor.foreground") or style_table.get("text") or "#cccccc"
+
+    def style(scope):
+        zed_key = lookup_scope(scope) if scope else None
+        if isinstance(zed_key, list):
+            zed_key = zed_key[0]
+        entry = None
+        while zed_key and entry is None:
+            entry = syntax.get(zed_key)
+            zed_key = zed_key.rpartition(".")[0]
+        entry = entry or {}
+        return (entry.get("color") or default, entry.get("font_style") == "italic",
+                (entry.get("font_weight") or 0) >= 600)
+
+    background = style_table.get("editor.background") or style_table.get("background") or "#1e1e1e"
+    return background, default, style
+
+
+def load_styler(path):
+    # (label, background, foreground, scope -> style) for a Zed or VS Code theme
+    theme = load_json(path)
+    if "themes" in theme:
+        return (f"{theme.get('name', path)} (Zed)",) + zed_styler(theme)
+    return (f"{theme.get('name', path)} (VS Code)",) + vscode_styler(theme)
+
+
+def scope_classes(tokens):
+    # Every distinct scope in the token streams -> CSS class index
+    classes = {}
+    for lines in tokens.values():
+        for line in lines:
+            for _, scope in line:
+                if scope not in classes:
+                    classes[scope] = len(classes)
+    return classes
+
+
+def css_color(value, fallback):
+    # Theme values go into a <style> block, so only colors colormath can
+    # parse are emitted, normalized to hex; anything else is the fallback
+    color = colormath.parse(value)
+    return colormath.to_hex(color) if color is not None else fallback
+
+
+def render_html(tokens, themes):
+    # themes: list of (label, background, foreground, style)
+    classes = scope_classes(tokens)
+    bodies = {}
+    for path, lines in tokens.items():
+        out = []
+        for line in lines:
+            out.append("".join(f'<span class="s{classes[scope]}">{html.escape(text)}</span>'
+                               for text, scope in line))
+        bodies[path] = "\n".join(out)
+
+    css = ["body{margin:0;font:13px/1.45 ui-monospace,Menlo,Consolas,monospace;background:#202020;color:#ddd}",
+           ".grid{display:grid;grid-template-columns:repeat(auto-fill,minmax(560px,1fr));gap:12px;padding:12px}",
+           "section{border-radius:6px;overflow:hidden}",
+           "h2{margin:0;padding:6px 10px;font-size:12px;font-weight:600;background:rgba(127,127,127,.2)}",
+           "pre{margin:0;padding:10px;overflow:auto}"]
+    sections = []
+    for n, (label, background, foreground, style) in enumerate(themes):
+        foreground = css_color(foreground, "#cccccc")
+        css.append(f".t{n}{{background:{css_color(background, '#1e1e1e')};color:{foreground}}}")
+        for scope, i in classes.items():
+            color, italic, bold = style(scope)
+            # Font styles are fixed strings, never values from the theme
+            rule = f"color:{css_color(color, foreground)}"
+            if italic is True:
+                rule += ";font-style:italic"
+            if bold is True:
+                rule += ";font-weight:bold"
+            css.append(f".t{n} .s{i}{{{rule}}}")
+        for path, body in bodies.items():
+            sections.append(f'<section class="t{n}"><h2>{html.escape(label)} &middot; {html.escape(path)}</h2>'
+                            f"<pre>{body}</pre></section>")
+
+    return ("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Theme preview</title>\n"
+            f"<style>\n{chr(10).join(css)}\n</style></head>\n<body><div class=\"grid\">\n"
+            + "\n".join(sections) + "\n</div></body></html>\n")
+
+
+def ansi_color(value, background=None, layer=38):
+    color = colormath.parse(value)
+    if color is None:
+        return ""
+    if background is not None and color[3] < 1:
+        color = colormath.alpha_over(color, background)
+    r, g, b = (round(c * 255) for c in color[:3])
+    return f"\x1b[{layer};2;{r};{g};{b}m"
+
+
+def render_ansi(tokens, theme):
+    label, background, foreground, style = theme
+    bg = colormath.parse(background) or colormath.BLACK
+    base = ansi_color(background, layer=48) + ansi_color(foreground, bg)
+    codes = {}
+    out = []
+    for path, lines in tokens.items():
+        out.append(f"\x1b[1m{label} · {path}\x1b[0m")
+        for line in lines:
+            parts = [base]
+            for text, scope in line:
+                if scope not in codes:
+                    color, italic, bold = style(scope)
+                    codes[scope] = ansi_color(color, bg) + ("\x1b[3m" if italic else "\x1b[23m") + \
+                        ("\x1b[1m" if bold else "\x1b[22m")
+                parts.append(codes[scope] + text)
+            out.append("".join(parts) + "\x1b[K\x1b[0m")
+        out.append("")
+    return "\n".join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Preview the sample files in every theme, without an editor.")
+    parser.add_argument("themes", nargs="*", help="Zed or VS Code theme files "
+                                                  "(default: themes/*.json and vscode-themes/*.json)")
+    parser.add_argument("--files", nargs="+", default=SAMPLE_FILES,
+                        help=f"files to preview (default: {' '.join(SAMPLE_FILES)})")
+    parser.add_argument("--theme", metavar="TEXT", help="only themes whose name or path contains TEXT")
+    parser.add_argument("--html", default=OUTPUT_PATH, metavar="PATH",
+                        help=f"where to write the HTML preview (default: {OUTPUT_PATH})")
+    parser.add_argument("--ansi", action="store_true",
+                        help="print the previews to the terminal in truecolor instead of writing HTML")
+    args = parser.parse_args()
+
+    paths = args.themes or sorted(glob.glob("themes/*.json")) + sorted(glob.glob("vscode-themes/*.json"))
+
+    start = time.perf_counter()
+    tokens, tokenized = load_tokens(args.files)
+    themes = []
+    for path in paths:
+        theme = load_styler(path)
+        # The name is only known once the theme is loaded
+        if args.theme and not any(args.theme.lower() in text.lower() for text in (path, theme[0])):
+            continue
+        themes.append(theme)
+    if args.ansi:
+        output = "\n".join(render_ansi(tokens, theme) for theme in themes)
+        sys.stdout.write(output + "\n")
+    else:
+        with open(args.html, 'w') as f:
+            f.write(render_html(tokens, themes))
+    elapsed = time.perf_counter() - start
+
+    summary = (f"Rendered {len(themes)} themes x {len(tokens)} files in {elapsed * 1000:.1f} ms "
+               f"({tokenized} files tokenized, {len(tokens) - tokenized} from {CACHE_PATH})")
+    if args.ansi:
+        print(summary, file=sys.stderr)
+    else:
+        print(f"Wrote {os.path.abspath(args.html)}")
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+from functools import lru_cache
+
+import colormath
+
+# Nearest xterm-256 and ANSI-16 colors for terminals without truecolor.
+#
+# Distances are measured in CIELAB (CIE76 delta E), where equal distances
+# look roughly equally different. Each palette is indexed once in a k-d tree,
+# so a lookup visits a handful of nodes instead of every palette entry, and
+# results are memoized per hex value.
+
+# xterm's default 16 colors
+ANSI_16 = [
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+]
+
+
+def _xterm_256():
+    levels = [0, 95, 135, 175, 215, 255]
+    palette = list(ANSI_16)
+    palette += [(r, g, b) for r in levels for g in levels for b in levels]
+    palette += [(8 + 10 * i,) * 3 for i in range(24)]
+    return palette
+
+
+XTERM_256 = _xterm_256()
+
+
+def _linear(c):
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _f(t):
+    return t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116
+
+
+def to_lab(rgb):
+    # rgb: 0..1 floats, sRGB with a D65 white point
+    r, g, b = (_linear(c) for c in rgb)
+    x = (0.4124 * r + 0.3576 * g + 0.1805 * b) / 0.95047
+    y = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    z = (0.0193 * r + 0.1192 * g + 0.9505 * b) / 1.08883
+    fx, fy, fz = _f(x), _f(y), _f(z)
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def _build(points, depth=0):
+    # points: list of (lab, palette index); node = (lab, index, axis, left, right)
+    if not points:
+        return None
+    axis = depth % 3
+    points.sort(key=lambda p: p[0][axis])
+    mid = len(points) // 2
+    lab, index = points[mid]
+    return (lab, index, axis, _build(points[:mid], depth + 1), _build(points[mid + 1:], depth + 1))
+
+
+def build_tree(palette, first=0):
+    # Indexes palette[first:], keeping the original palette indices
+    return _build([(to_lab(tuple(c / 255 for c in rgb)), i) for i, rgb in enumerate(palette) if i >= first])
+
+
+def nearest(tree, lab):
+    best = [None, float("inf")]
+
+    def visit(node):
+        if node is None:
+            return
+        point, index, axis, left, right = node
+        d = sum((a - b) ** 2 for a, b in zip(point, lab))
+        # Ties go to the lower palette index so results are stable
+        if d < best[1] or (d == best[1] and index < best[0]):
+            best[0], best[1] = index, d
+        diff = lab[axis] - point[axis]
+        near, far = (left, right) if diff < 0 else (right, left)
+        visit(near)
+        if diff * diff <= best[1]:
+            visit(far)
+
+    visit(tree)
+    return best[0]
+
+
+# Entries 0-15 of the 256-color palette are whatever the user's terminal
+# theme says, so 256-color lookups only use the fixed cube and gray ramp.
+TREE_256 = build_tree(XTERM_256, first=16)
+TREE_16 = build_tree(ANSI_16)
+
+
+@lru_cache(maxsize=4096)
+def quantize(value):
+    # Hex color -> (xterm-256 index, ANSI-16 index), or None if unparseable.
+    # Alpha is ignored; composite first if it matters.
+    color = colormath.parse(value)
+    if color is None:
+        return None
+    lab = to_lab(color[:3])
+    return (nearest(TREE_256, lab), nearest(TREE_16, lab))
+
+
+def quantize_style(style):
+    # Every color in a Zed style, including syntax colors, as
+    # key -> {"color", "xterm256", "ansi16"}
+    result = {}
+    for key, value in style.items():
+        if isinstance(value, str) and quantize(value):
+            result[key] = {"color": value, "xterm256": quantize(value)[0], "ansi16": quantize(value)[1]}
+    for key, entry in style.get("syntax", {}).items():
+        value = entry.get("color") if isinstance(entry, dict) else None
+        if quantize(value):
+            result[f"syntax.{key}"] = {"color": value, "xterm256": quantize(value)[0], "ansi16": quantize(value)[1]}
+    return result
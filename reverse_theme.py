@@ -0,0 +1,264 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from convert_theme import write_if_changed
+from jsonc import load as load_json
+from mapping import SYNTAX_MAPPING, UI_CHAINS
+
+# Zed -> VS Code: the inverse of convert_theme.py, for porting Zed themes to
+# VS Code and Cursor.
+#
+# The forward tables in mapping.jsonc are many-to-one (several Zed keys read
+# the same VS Code key) and, for syntax, one-to-many ("variable" sets both the Zed "variable"
+# and "property" keys). The inverted indexes below are built once at import,
+# and every conflict is resolved by table order, so the same Zed theme always
+# gives the same VS Code theme:
+#
+# - a VS Code color takes the first Zed key, in mapping order, whose chain
+#   starts with that color and that the theme defines; keys whose chain
+#   starts with a reference ("text" is "@editor.foreground") follow it to
+#   the color it copies and rank after the keys that read it directly;
+# - a VS Code scope takes the first Zed key in its syntax entry that the
+#   theme defines ("variable" prefers Zed "variable" over "property").
+
+
+def invert(mapping):
+    # value -> [keys in mapping order]; list values fan out to each element
+    inverse = {}
+    for key, value in mapping.items():
+        for v in value if isinstance(value, list) else [value]:
+            inverse.setdefault(v, []).append(key)
+    return inverse
+
+
+def head_key(zed_key, chains, depth=0):
+    # (VS Code key, number of references followed) that a Zed key copies
+    # when the first source of its chain resolves, or None when that source
+    # is a literal or a derived color. Later sources are fallbacks and are
+    # not inverted.
+    source = chains[zed_key][0]
+    if source[0] == "key":
+        return source[1], depth
+    if source[0] == "ref":
+        return head_key(source[1], chains, depth + 1)
+    return None
+
+
+def color_sources(ui_chains):
+    # VS Code color key -> Zed keys, highest priority first: direct readers
+    # in mapping order, then the keys that reach it through references
+    chains = dict(ui_chains)
+    heads = {}
+    for zed_key, _ in ui_chains:
+        head = head_key(zed_key, chains)
+        if head is not None:
+            heads.setdefault(head[0], []).append((head[1], zed_key))
+    return {vs_key: tuple(zed_key for _, zed_key in sorted(keys, key=lambda key: key[0]))
+            for vs_key, keys in heads.items()}
+
+
+# VS Code color key -> Zed keys, highest priority first
+COLOR_SOURCES = color_sources(UI_CHAINS)
+
+# Every Zed UI key that some VS Code color reads
+ALL_COLOR_SOURCES = {k for sources in COLOR_SOURCES.values() for k in sources}
+
+# VS Code scope -> Zed keys, highest priority first
+SCOPE_SOURCES = {scope: tuple(zed if isinstance(zed, list) else [zed]) for scope, zed in SYNTAX_MAPPING.items()}
+
+# Zed syntax key -> VS Code scopes it can supply, in SYNTAX_MAPPING order
+SYNTAX_TARGETS = invert(SYNTAX_MAPPING)
+
+# Zed keys written by convert() that have no VS Code counterpart
+IGNORED_KEYS = {"syntax", "players", "accents"}
+
+
+def vscode_name(name):
+    # File name, as in vscode-themes/Blank-Moonlight.json
+    return f"{name}.json".replace(" ", "-")
+
+
+def pick(style, sources):
+    # First source key with a value, or None
+    for key in sources:
+        value = style.get(key)
+        if value:
+            return key
+    return None
+
+
+def reverse_colors(style, counts):
+    colors = {}
+    used = set()
+    for vs_key, sources in COLOR_SOURCES.items():
+        zed_key = pick(style, sources)
+        if zed_key is None:
+            continue
+        colors[vs_key] = style[zed_key]
+        used.add(zed_key)
+        # Other sources that disagree with the winner are dropped
+        counts["conflicts"] += sum(1 for k in sources
+                                   if k != zed_key and style.get(k) and style[k] != colors[vs_key])
+    counts["unmapped"] += sum(1 for key in style if key not in used and key not in IGNORED_KEYS
+                              and key not in ALL_COLOR_SOURCES)
+    return colors
+
+
+def font_style(entry):
+    # Zed font_style/font_weight -> VS Code fontStyle, or None if plain
+    parts = []
+    if entry.get("font_style") in ("italic", "oblique"):
+        parts.append("italic")
+    if (entry.get("font_weight") or 0) >= 600:
+        parts.append("bold")
+    return " ".join(parts) or None
+
+
+def reverse_syntax(syntax, counts):
+    # One tokenColors rule per Zed key, listing every scope it won
+    owner = {}
+    for scope, sources in SCOPE_SOURCES.items():
+        zed_key = pick(syntax, sources)
+        if zed_key is not None:
+            owner[scope] = zed_key
+
+    rules = []
+    for zed_key, entry in syntax.items():
+        scopes = [scope for scope in SYNTAX_TARGETS.get(zed_key, []) if owner.get(scope) == zed_key]
+        if not scopes:
+            counts["unmapped"] += 1
+            continue
+        settings = {}
+        if isinstance(entry, dict) and entry.get("color"):
+            settings["foreground"] = entry["color"]
+        style = font_style(entry) if isinstance(entry, dict) else None
+        if style:
+            settings["fontStyle"] = style
+        if settings:
+            rules.append({"scope": scopes, "settings": settings})
+    return rules
+
+
+def to_vscode(zed_theme):
+    # Zed theme family -> ([VS Code theme per family member], counts)
+    counts = {"conflicts": 0, "unmapped": 0}
+    themes = []
+    for theme in zed_theme.get("themes", []):
+        style = theme.get("style", {})
+        appearance = theme.get("appearance", "dark")
+        themes.append({
+            "name": theme.get("name", "Untitled"),
+            "type": appearance if appearance in ("dark", "light") else "dark",
+            "colors": reverse_colors(style, counts),
+            "tokenColors": reverse_syntax(style.get("syntax", {}), counts),
+        })
+    return themes, counts
+
+
+def reverse_file(path, out_dir):
+    # Converts one Zed theme file; errors are returned, not raised, so one
+    # bad theme does not stop a bulk run
+    try:
+        themes, counts = to_vscode(load_json(path))
+        outputs = []
+        written = []
+        for theme in themes:
+            out_path = os.path.join(out_dir, vscode_name(theme["name"]))
+            outputs.append(out_path)
+            if write_if_changed(out_path, json.dumps(theme, indent="\t") + "\n"):
+                written.append(out_path)
+        return {"status": "ok", "path": path, "outputs": outputs, "written": written, "counts": counts}
+    except Exception as e:
+        return {"status": "error", "path": path, "error": str(e), "traceback": traceback.format_exc()}
+
+
+def check_manifest(package_path="package.json", zed_dir="themes"):
+    # Reverses each bundled Zed theme and returns "path: message" problems
+    # for the VS Code colors its style was read from (the source theme's
+    # colors that some set Zed key copies) but that do not come back, or
+    # that a Zed key reading them would not give back on its own
+    from convert_theme import output_name
+    pkg = load_json(package_path)
+    base_dir = os.path.dirname(package_path)
+    chains = dict(UI_CHAINS)
+    problems = []
+    for entry in pkg.get("contributes", {}).get("themes", []):
+        zed_path = os.path.join(base_dir, zed_dir, output_name(entry.get("label")))
+        source = load_json(os.path.join(base_dir, entry.get("path"))).get("colors", {})
+        zed_theme = load_json(zed_path)
+        reversed_themes, _ = to_vscode(zed_theme)
+        for theme, reversed_theme in zip(zed_theme.get("themes", []), reversed_themes):
+            readers = {}
+            for zed_key in theme.get("style", {}):
+                head = head_key(zed_key, chains) if zed_key in chains else None
+                if head is not None and head[0] in source:
+                    readers.setdefault(head[0], []).append(zed_key)
+            for vs_key, zed_keys in readers.items():
+                if vs_key not in reversed_theme["colors"]:
+                    problems.append(f"{zed_path}: {vs_key} (read by {', '.join(zed_keys)}) is not given back")
+                # Each reader on its own must give it back too, or a theme
+                # that only sets that key loses the color
+                for zed_key in zed_keys:
+                    if zed_key not in COLOR_SOURCES.get(vs_key, ()):
+                        problems.append(f"{zed_path}: {zed_key} is not reversed to {vs_key}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert Zed themes back to VS Code themes.")
+    parser.add_argument("paths", nargs="*", help="Zed theme files (default: themes/*.json)")
+    parser.add_argument("--out-dir", default="reversed",
+                        help="directory for the VS Code themes (default: reversed/)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="convert files in N worker processes (default: 1, serial)")
+    parser.add_argument("--check", action="store_true",
+                        help="check that reversing each theme in package.json gives back every VS Code color "
+                             "its Zed theme was read from, and write nothing")
+    args = parser.parse_args()
+
+    if args.check:
+        problems = check_manifest()
+        for problem in problems:
+            print(problem)
+        print(f"Round trip check: {len(problems)} problems")
+        if problems:
+            sys.exit(1)
+        return
+
+    paths = args.paths or sorted(glob.glob("themes/*.json"))
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    if args.jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(reverse_file, paths, [args.out_dir] * len(paths), chunksize=16))
+    else:
+        results = [reverse_file(path, args.out_dir) for path in paths]
+    elapsed = time.perf_counter() - start
+
+    errors = 0
+    for result in results:
+        if result["status"] == "error":
+            errors += 1
+            print(f"{result['path']}: Error: {result['error']}")
+            sys.stdout.flush()
+            sys.stderr.write(result["traceback"])
+            continue
+        counts = result["counts"]
+        print(f"{result['path']}: {counts['conflicts']} conflicts, {counts['unmapped']} unmapped keys")
+        for out_path in result["outputs"]:
+            print(f"  -> {'Generated' if out_path in result['written'] else 'Unchanged'} {out_path}")
+
+    print(f"Converted {len(results) - errors}/{len(results)} files in {elapsed * 1000:.1f} ms")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+import argparse
+import glob
+import hashlib
+import http.client
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from convert_theme import CONVERTER_VERSION, MAPPING_HASH, convert, dumps, to_cterm, to_neovim
+from jsonc import loads as parse_json
+from validate_theme import validate
+
+# A long-running conversion service for editors and tools that convert on
+# demand. Spawning convert_theme.py per request pays interpreter startup and
+# mapping setup every time; the daemon pays them once and keeps the compiled
+# mapping, the selector caches and an LRU cache of finished outputs warm.
+#
+# It speaks HTTP on localhost, or on a Unix socket with --socket:
+#
+#   POST /convert?format=zed|neovim|cterm&name=...&appearance=light|dark&compact=1
+#        body: a VS Code theme (JSON or JSONC)
+#        200 with the output, X-Cache: hit|miss
+#        400 when the body is not a theme, 413 when it is over MAX_BODY bytes,
+#        422 when the output fails the Zed schema
+#   GET  /stats   request and cache counters as JSON
+#
+#   python serve_theme.py --port 7878
+#   python serve_theme.py --socket /tmp/blank-theme.sock
+#   python serve_theme.py --load-test 2000 --concurrency 16 --port 7878
+
+DEFAULT_PORT = 7878
+CACHE_SIZE = 256
+# Largest request body read; real themes are well under 1 MB
+MAX_BODY = 4 * 1024 * 1024
+FORMATS = {
+    "zed": "application/json",
+    "neovim": "text/x-lua",
+    "cterm": "application/json",
+}
+
+
+class LRUCache:
+    # Bounded mapping of input hash -> response; the least recently used
+    # entry is dropped first. Shared by the handler threads.
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+
+def cache_key(body, params):
+    # Everything a response depends on; the converter and mapping hashes
+    # make a daemon restarted on a newer checkout ignore nothing stale
+    digest = hashlib.sha256()
+    digest.update(json.dumps([CONVERTER_VERSION, MAPPING_HASH, sorted(params.items())]).encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def check_shape(vs_theme):
+    # Raises ValueError unless vs_theme has the structure convert() reads
+    if not isinstance(vs_theme, dict):
+        raise ValueError("not a theme object")
+    if not isinstance(vs_theme.get("name", ""), str):
+        raise ValueError("name must be a string")
+    colors = vs_theme.get("colors", {})
+    if not isinstance(colors, dict):
+        raise ValueError("colors must be an object")
+    for key, value in colors.items():
+        if not isinstance(value, str):
+            raise ValueError(f"colors[{key!r}] must be a string")
+    rules = vs_theme.get("tokenColors", [])
+    if not isinstance(rules, list):
+        raise ValueError("tokenColors must be an array")
+    for i, rule in enumerate(rules):
+        if not isinstance(rule, dict) or not isinstance(rule.get("settings", {}), dict):
+            raise ValueError(f"tokenColors[{i}] must be an object with object settings")
+        scope = rule.get("scope")
+        if isinstance(scope, list) and not all(isinstance(s, str) for s in scope):
+            raise ValueError(f"tokenColors[{i}].scope must be a string or an array of strings")
+        for field in ("foreground", "fontStyle"):
+            if not isinstance(rule.get("settings", {}).get(field, ""), str):
+                raise ValueError(f"tokenColors[{i}].settings.{field} must be a string")
+
+
+def render(body, params):
+    # (status, content type, payload bytes) for one conversion request
+    fmt = params.get("format", "zed")
+    if fmt not in FORMATS:
+        return 400, "application/json", json.dumps({"error": f"unknown format {fmt!r}"}).encode()
+    try:
+        vs_theme = parse_json(body)
+        check_shape(vs_theme)
+    except ValueError as e:
+        return 400, "application/json", json.dumps({"error": f"invalid theme: {e}"}).encode()
+
+    theme_type = vs_theme.get("type", "dark")
+    appearance = params.get("appearance") or (
+        "light" if isinstance(theme_type, str) and "light" in theme_type else "dark")
+    compact = params.get("compact") in ("1", "true", "yes")
+    try:
+        zed_theme = convert(vs_theme, params.get("name"), params.get("author", "Unknown"), appearance)
+    except (TypeError, AttributeError) as e:
+        # A shape check_shape() does not know about yet; still the client's input
+        return 400, "application/json", json.dumps({"error": f"invalid theme: {e}"}).encode()
+    problems = validate(zed_theme)
+    if problems:
+        return 422, "application/json", json.dumps({"error": "output fails the Zed schema",
+                                                    "problems": problems}).encode()
+    if fmt == "neovim":
+        content = to_neovim(vs_theme, zed_theme, params.get("name"), compact)
+    elif fmt == "cterm":
+        content = to_cterm(zed_theme, compact)
+    else:
+        content = dumps(zed_theme, compact)
+    return 200, FORMATS[fmt], content.encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        # Headers and body go out as separate writes; without TCP_NODELAY,
+        # keep-alive clients wait on a delayed ACK for every response
+        self.disable_nagle_algorithm = isinstance(self.server, TCPHTTPServer)
+        super().setup()
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send(self, status, content_type, payload, headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/stats":
+            self.send(404, "application/json", b'{"error": "not found"}')
+            return
+        server = self.server
+        cache = server.cache
+        stats = {"requests": server.requests, "uptime": round(time.monotonic() - server.started, 3),
+                 "cache": {"entries": len(cache.entries), "size": cache.size, "hits": cache.hits,
+                           "misses": cache.misses}}
+        self.send(200, "application/json", json.dumps(stats).encode())
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/convert":
+            self.send(404, "application/json", b'{"error": "not found"}')
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            status = 400 if length < 0 else 413
+            error = "invalid Content-Length" if length < 0 else f"body is over {MAX_BODY} bytes"
+            self.send(status, "application/json", json.dumps({"error": error}).encode(),
+                      headers=[("Connection", "close")])
+            return
+        body = self.rfile.read(length)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        with self.server.lock:
+            self.server.requests += 1
+
+        key = cache_key(body, params)
+        response = self.server.cache.get(key)
+        if response is None:
+            try:
+                response = render(body, params)
+            except Exception as e:
+                self.send(500, "application/json", json.dumps({"error": f"{type(e).__name__}: {e}"}).encode())
+                return
+            # Client errors are cheap to recompute and not worth a slot
+            if response[0] in (200, 422):
+                self.server.cache.put(key, response)
+            self.send(*response, headers=[("X-Cache", "miss")])
+        else:
+            self.send(*response, headers=[("X-Cache", "hit")])
+
+
+class UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class TCPHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections under a burst of clients
+    request_queue_size = 128
+
+
+def make_server(port=DEFAULT_PORT, socket_path=None, cache_size=CACHE_SIZE, verbose=False):
+    if socket_path:
+        # Only clear a stale socket; never delete a regular file given by mistake
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, Handler)
+    else:
+        server = TCPHTTPServer(("127.0.0.1", port), Handler)
+    server.cache = LRUCache(cache_size)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.started = time.monotonic()
+    server.verbose = verbose
+    return server
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=30):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class TCPHTTPConnection(http.client.HTTPConnection):
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def connect(port=DEFAULT_PORT, socket_path=None):
+    if socket_path:
+        return UnixHTTPConnection(socket_path)
+    return TCPHTTPConnection("127.0.0.1", port, timeout=30)
+
+
+def percentile(sorted_values, p):
+    # Nearest-rank percentile of an ascending list
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(p / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+
+def load_test(requests, concurrency, payloads, port=DEFAULT_PORT, socket_path=None, fmt="zed", unique=0.0):
+    # Sends `requests` conversions from `concurrency` threads, each on its own
+    # keep-alive connection, cycling through payloads. A `unique` fraction of
+    # requests get a distinct name, so they miss the cache.
+    latencies = []
+    statuses = {}
+    cache_hits = 0
+    lock = threading.Lock()
+    counter = iter(range(requests))
+
+    def worker():
+        nonlocal cache_hits
+        conn = connect(port, socket_path)
+        local = []
+        try:
+            while True:
+                with lock:
+                    i = next(counter, None)
+                if i is None:
+                    break
+                query = f"/convert?format={fmt}"
+                if int((i + 1) * unique) != int(i * unique):
+                    query += f"&name=Load+test+{i}"
+                body = payloads[i % len(payloads)]
+                start = time.perf_counter()
+                conn.request("POST", query, body=body, headers={"Content-Type": "application/json"})
+                response = conn.getresponse()
+                response.read()
+                local.append(time.perf_counter() - start)
+                with lock:
+                    statuses[response.status] = statuses.get(response.status, 0) + 1
+                    cache_hits += response.getheader("X-Cache") == "hit"
+        finally:
+            conn.close()
+            with lock:
+                latencies.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "cache_hits": cache_hits,
+        "statuses": statuses,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve theme conversions over HTTP, or load-test a running server.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"localhost port to listen on or connect to (default: {DEFAULT_PORT})")
+    parser.add_argument("--socket", metavar="PATH", help="use a Unix socket instead of a TCP port")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE,
+                        help=f"converted outputs to keep in memory (default: {CACHE_SIZE})")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    parser.add_argument("--load-test", type=int, metavar="N",
+                        help="send N requests to a running server and report latency percentiles")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="with --load-test, parallel connections (default: 8)")
+    parser.add_argument("--payloads", nargs="+", metavar="PATH",
+                        help="with --load-test, VS Code themes to send (default: vscode-themes/*.json)")
+    parser.add_argument("--format", default="zed", choices=sorted(FORMATS),
+                        help="with --load-test, output format to request (default: zed)")
+    parser.add_argument("--unique", type=float, default=0.0, metavar="FRACTION",
+                        help="with --load-test, fraction of requests made distinct to miss the cache (default: 0)")
+    args = parser.parse_args()
+
+    if args.load_test:
+        payloads = []
+        for path in args.payloads or sorted(glob.glob("vscode-themes/*.json")):
+            with open(path, 'rb') as f:
+                payloads.append(f.read())
+        if not payloads:
+            parser.error("no payloads to send")
+        try:
+            result = load_test(args.load_test, args.concurrency, payloads, args.port, args.socket, args.format,
+                               args.unique)
+        except OSError as e:
+            print(f"Cannot reach the server: {e}")
+            sys.exit(1)
+        print(f"{result['requests']} requests in {result['seconds']}s ({result['requests_per_second']} req/s, "
+              f"{result['concurrency']} connections, {result['cache_hits']} cache hits)")
+        print(f"  p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, max {result['max_ms']} ms")
+        print(f"  statuses: {', '.join(f'{k}: {v}' for k, v in sorted(result['statuses'].items()))}")
+        return
+
+    try:
+        server = make_server(args.port, args.socket, args.cache_size, args.verbose)
+    except OSError as e:
+        print(f"Cannot listen on {args.socket or args.port}: {e}")
+        sys.exit(1)
+    where = args.socket or f"http://127.0.0.1:{args.port}"
+    print(f"Serving conversions on {where} (cache: {args.cache_size} outputs)")
+    sys.stdout.flush()
+    # Stop cleanly (and remove the socket) when a service manager stops us
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+
+from jsonc import load as load_json
+
+# Offline validation of Zed theme files against Zed's theme family schema
+# v0.2.0, kept in schema/. That file was rebuilt by hand from the theme
+# content types in Zed's source, not downloaded from
+# zed.dev/schema/themes/v0.2.0.json (see its "$comment"); swap in the
+# published file when it changes shape upstream.
+#
+# The schema is compiled once into a tree of checker functions, one per
+# schema node: property tables become dicts, patterns become compiled
+# regexes and every "$ref" is compiled a single time and shared. Checking a
+# theme is then a walk of the document that calls straight into those
+# closures, with no schema interpretation per document, which is cheap
+# enough for convert_theme.py to run on every theme it writes.
+#
+# The schema is as permissive as Zed itself: any string is a color and
+# unknown style keys are ignored. lint() adds this repo's stricter checks
+# (hex colors, known style keys, no null syntax colors) as warnings, which
+# are printed but never fail a theme that Zed would load.
+#
+#   python validate_theme.py                      check themes/*.json
+#   python validate_theme.py zed-corpus/ -j 8     check every .json under a directory
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema", "zed-theme-v0.2.0.json")
+
+# Annotations the compiler ignores
+IGNORED_KEYWORDS = {"$schema", "$id", "$comment", "title", "description", "default"}
+
+# Colors as this repo writes them: #rgb, #rgba, #rrggbb or #rrggbbaa
+HEX_COLOR = re.compile(r"#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})")
+
+JSON_TYPES = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "null": lambda v: v is None,
+}
+
+
+def child_path(path, key):
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else key
+
+
+def compile_schema(schema):
+    # Returns check(value, path, errors), which appends "path: message"
+    # strings to errors. Raises ValueError on keywords it does not support,
+    # so a schema update cannot be silently half-checked.
+    definitions = schema.get("definitions", {})
+    refs = {}
+
+    def compile_ref(ref):
+        if ref not in refs:
+            if not ref.startswith("#/definitions/") or ref[14:] not in definitions:
+                raise ValueError(f"unresolvable $ref {ref!r}")
+            # Placeholder first, so recursive definitions terminate
+            slot = []
+            refs[ref] = lambda value, path, errors: slot[0](value, path, errors)
+            slot.append(compile_node(definitions[ref[14:]]))
+            refs[ref] = slot[0]
+        return refs[ref]
+
+    def compile_node(node):
+        if "$ref" in node:
+            return compile_ref(node["$ref"])
+        unknown = set(node) - IGNORED_KEYWORDS - {"type", "enum", "pattern", "minimum", "maximum", "properties",
+                                                  "required", "additionalProperties", "items", "anyOf",
+                                                  "definitions"}
+        if unknown:
+            raise ValueError(f"unsupported schema keyword(s): {', '.join(sorted(unknown))}")
+        checks = []
+
+        if "type" in node:
+            names = node["type"] if isinstance(node["type"], list) else [node["type"]]
+            tests = [JSON_TYPES[name] for name in names]
+            expected = " or ".join(names)
+
+            def check_type(value, path, errors):
+                if not any(test(value) for test in tests):
+                    errors.append(f"{path}: expected {expected}, got {json.dumps(value)}")
+                    return False
+                return True
+            checks.append(check_type)
+
+        if "enum" in node:
+            allowed = node["enum"]
+
+            def check_enum(value, path, errors):
+                if value not in allowed:
+                    errors.append(f"{path}: {json.dumps(value)} is not one of {json.dumps(allowed)}")
+                    return False
+                return True
+            checks.append(check_enum)
+
+        if "pattern" in node:
+            match = re.compile(node["pattern"]).search
+
+            def check_pattern(value, path, errors):
+                if isinstance(value, str) and not match(value):
+                    errors.append(f"{path}: {json.dumps(value)} does not match {node['pattern']}")
+                    return False
+                return True
+            checks.append(check_pattern)
+
+        if "minimum" in node or "maximum" in node:
+            low = node.get("minimum", float("-inf"))
+            high = node.get("maximum", float("inf"))
+
+            def check_range(value, path, errors):
+                if JSON_TYPES["number"](value) and not low <= value <= high:
+                    errors.append(f"{path}: {value} is outside {low}..{high}")
+                    return False
+                return True
+            checks.append(check_range)
+
+        if "properties" in node or "required" in node or "additionalProperties" in node:
+            properties = {key: compile_node(sub) for key, sub in node.get("properties", {}).items()}
+            required = node.get("required", [])
+            additional = node.get("additionalProperties", True)
+            extra = compile_node(additional) if isinstance(additional, dict) else None
+
+            def check_object(value, path, errors):
+                if not isinstance(value, dict):
+                    return True
+                for key in required:
+                    if key not in value:
+                        errors.append(f"{child_path(path, key)}: missing")
+                for key, item in value.items():
+                    check = properties.get(key, extra)
+                    if check is not None:
+                        check(item, child_path(path, key), errors)
+                    elif additional is False:
+                        errors.append(f"{child_path(path, key)}: unknown key")
+                return True
+            checks.append(check_object)
+
+        if "anyOf" in node:
+            options = [compile_node(sub) for sub in node["anyOf"]]
+
+            def check_any(value, path, errors):
+                # Passes if one option does; otherwise reports the first
+                # option's problems, the non-null one in Zed's schema
+                first = None
+                for check in options:
+                    found = []
+                    check(value, path, found)
+                    if not found:
+                        return True
+                    first = found if first is None else first
+                errors.extend(first)
+                return False
+            checks.append(check_any)
+
+        if "items" in node:
+            check_item = compile_node(node["items"])
+
+            def check_array(value, path, errors):
+                if isinstance(value, list):
+                    for i, item in enumerate(value):
+                        check_item(item, child_path(path, i), errors)
+                return True
+            checks.append(check_array)
+
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value, path, errors):
+            # Stop at the first failing check: a wrong type makes the rest noise
+            for check in checks:
+                if not check(value, path, errors):
+                    return False
+            return True
+        return check_all
+
+    return compile_node(schema)
+
+
+@lru_cache(maxsize=None)
+def checker(schema_path=SCHEMA_PATH):
+    # Compiled once per process (and so once per worker with --jobs)
+    return compile_schema(load_json(schema_path))
+
+
+def validate(doc, schema_path=SCHEMA_PATH):
+    # Returns the problems in a Zed theme family as "path: message" strings
+    errors = []
+    checker(schema_path)(doc, "", errors)
+    return errors
+
+
+@lru_cache(maxsize=None)
+def style_keys(schema_path=SCHEMA_PATH):
+    return frozenset(load_json(schema_path)["definitions"]["ThemeStyleContent"]["properties"])
+
+
+def lint(doc, schema_path=SCHEMA_PATH):
+    # Warnings for what Zed accepts but this repo should not write, as
+    # "path: message" strings: colors that are not hex, style keys the
+    # schema does not list (Zed ignores them, often a typo) and syntax
+    # entries with a null color. Assumes doc passed validate().
+    warnings = []
+    known = style_keys(schema_path)
+
+    def check_color(value, path):
+        if isinstance(value, str) and not HEX_COLOR.fullmatch(value):
+            warnings.append(f"{path}: {json.dumps(value)} is not a hex color")
+
+    for i, theme in enumerate(doc.get("themes", [])):
+        style = theme.get("style", {})
+        base = f"themes[{i}].style"
+        for key, value in style.items():
+            path = child_path(base, key)
+            if key not in known:
+                warnings.append(f"{path}: unknown key")
+            elif key == "accents":
+                for j, accent in enumerate(value or []):
+                    check_color(accent, child_path(path, j))
+            elif key == "players":
+                for j, player in enumerate(value or []):
+                    for field, color in player.items():
+                        check_color(color, child_path(child_path(path, j), field))
+            elif key == "syntax":
+                for name, entry in (value or {}).items():
+                    entry_path = child_path(path, name)
+                    if "color" in entry and entry["color"] is None:
+                        warnings.append(f"{child_path(entry_path, 'color')}: null")
+                    for field in ("color", "background_color"):
+                        check_color(entry.get(field), child_path(entry_path, field))
+            elif key != "background.appearance":
+                check_color(value, path)
+    return warnings
+
+
+def validate_file(path):
+    # (path, errors, warnings)
+    try:
+        doc = load_json(path)
+        errors = validate(doc)
+        return path, errors, [] if errors else lint(doc)
+    except (OSError, ValueError) as e:
+        return path, [f"cannot read: {e}"], []
+
+
+def expand_paths(paths):
+    # Files as given, directories walked for .json files
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".json"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate Zed themes against Zed's v0.2.0 theme schema.")
+    parser.add_argument("paths", nargs="*", help="theme files or directories (default: themes/*.json)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="validate in N worker processes (default: 1, serial)")
+    parser.add_argument("--limit", type=int, default=20, metavar="N",
+                        help="problems and warnings to print per file (default: 20)")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit with status 1 on warnings too")
+    args = parser.parse_args()
+
+    paths = list(expand_paths(args.paths or sorted(glob.glob("themes/*.json"))))
+    start = time.perf_counter()
+    invalid = 0
+    warned = 0
+    if args.jobs > 1 and len(paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=args.jobs)
+        results = pool.map(validate_file, paths, chunksize=max(1, len(paths) // (args.jobs * 8)))
+    else:
+        pool = None
+        results = map(validate_file, paths)
+    try:
+        for path, errors, warnings in results:
+            if errors:
+                invalid += 1
+                print(f"{path}: {len(errors)} problem(s)")
+            elif warnings:
+                warned += 1
+                print(f"{path}: {len(warnings)} warning(s)")
+            lines = [f"  {error}" for error in errors] + [f"  warning: {warning}" for warning in warnings]
+            for line in lines[:args.limit]:
+                print(line)
+            if len(lines) > args.limit:
+                print(f"  ... {len(lines) - args.limit} more")
+    finally:
+        if pool:
+            pool.shutdown()
+    elapsed = time.perf_counter() - start
+
+    print(f"Validated {len(paths)} files in {elapsed * 1000:.1f} ms: {invalid} invalid, {warned} with warnings")
+    if invalid or (args.strict and warned):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
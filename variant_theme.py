@@ -0,0 +1,222 @@
+import argparse
+import colorsys
+import json
+import os
+import re
+import sys
+import time
+
+import colormath
+from convert_theme import convert, dumps, neovim_name, output_name, to_neovim, write_if_changed
+from jsonc import load as load_json
+from validate_theme import validate
+
+# Palette variants of one VS Code theme: hue rotation, contrast stretch and
+# light-mode inversion, written as VS Code, Zed and Neovim themes.
+#
+# The template is walked once. Every color in it is replaced by a slot
+# pointing into the deduplicated palette (a few dozen distinct colors behind
+# hundreds of keys), and the template is serialized once with those slots
+# in place. A variant is then one pass over the palette plus a string join:
+# no per-key work and no re-walking of the theme.
+#
+#   python variant_theme.py vscode-themes/Blank-Moonlight.json --variant hue=30 --variant light
+#   python variant_theme.py vscode-themes/Blank-Ghibli.json --hue-steps 120 --formats zed --audit
+
+OUT_DIR = "variants"
+FORMATS = ("vscode", "zed", "neovim")
+
+_SLOT = re.compile(r'"@@(\w+)@@"')
+
+
+def _slot(name):
+    return f"@@{name}@@"
+
+
+def compile_template(vs_theme):
+    # Returns (palette, pieces): palette is the list of distinct colors as
+    # (r, g, b, a) tuples, pieces alternate literal JSON text and slot names
+    # ("0", "1", ... for palette entries, "name" and "type")
+    palette = []
+    index = {}
+
+    def slot(value):
+        color = colormath.parse(value)
+        if color is None:
+            return value
+        key = value.lower()
+        if key not in index:
+            index[key] = len(palette)
+            palette.append(color)
+        return _slot(index[key])
+
+    template = dict(vs_theme)
+    template["name"] = _slot("name")
+    template["type"] = _slot("type")
+    template["colors"] = {key: slot(value) for key, value in vs_theme.get("colors", {}).items()}
+    rules = []
+    for rule in vs_theme.get("tokenColors", []):
+        settings = rule.get("settings", {})
+        rule = dict(rule)
+        rule["settings"] = {key: slot(value) if key in ("foreground", "background") else value
+                            for key, value in settings.items()}
+        rules.append(rule)
+    template["tokenColors"] = rules
+    pieces = _SLOT.split(json.dumps(template, indent="\t"))
+    return palette, pieces
+
+
+def render(pieces, values, name, theme_type):
+    # Fills the slots; values are hex strings in palette order
+    out = []
+    for i, piece in enumerate(pieces):
+        if i % 2 == 0:
+            out.append(piece)
+        elif piece == "name":
+            out.append(json.dumps(name))
+        elif piece == "type":
+            out.append(json.dumps(theme_type))
+        else:
+            out.append(json.dumps(values[int(piece)]))
+    return "".join(out) + "\n"
+
+
+def parse_variant(text):
+    # "hue=30,contrast=1.2,light" -> {"hue": 30.0, "contrast": 1.2, "light": True}
+    variant = {"hue": 0.0, "contrast": 1.0, "light": False}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        key, _, value = part.partition("=")
+        if key == "light":
+            variant["light"] = value.lower() not in ("0", "false", "no") if value else True
+        elif key in ("hue", "contrast"):
+            variant[key] = float(value)
+        else:
+            raise ValueError(f"unknown transform {key!r} in {text!r}")
+    return variant
+
+
+def variant_suffix(variant):
+    parts = []
+    if variant["hue"] % 360:
+        parts.append(f"Hue {variant['hue'] % 360:g}")
+    if variant["contrast"] != 1.0:
+        parts.append(f"Contrast {variant['contrast']:g}")
+    if variant["light"]:
+        parts.append("Light")
+    return " ".join(parts) or "Copy"
+
+
+def transform_palette(hls, alphas, variant):
+    # hls: the palette in (h, l, s), computed once per template. Rotation is
+    # in degrees; contrast scales lightness away from 0.5; light mirrors
+    # lightness so dark backgrounds become light ones and text turns dark.
+    shift = (variant["hue"] % 360) / 360
+    k = variant["contrast"]
+    light = variant["light"]
+    values = []
+    for (h, l, s), a in zip(hls, alphas):
+        l = min(1.0, max(0.0, 0.5 + (l - 0.5) * k))
+        if light:
+            l = 1.0 - l
+        r, g, b = colorsys.hls_to_rgb((h + shift) % 1.0, l, s)
+        values.append(colormath.to_hex((r, g, b, a)))
+    return values
+
+
+def generate(vs_theme, variants, formats=FORMATS, source=None, zed=False):
+    # Yields (label, zed_theme, outputs, problems) per variant, where outputs
+    # maps a format to (file name, content). zed_theme is None unless zed is
+    # set or the Zed or Neovim format is requested. A Zed theme that fails
+    # the schema is listed in problems and has no Zed or Neovim output.
+    palette, pieces = compile_template(vs_theme)
+    hls = [colorsys.rgb_to_hls(*color[:3]) for color in palette]
+    alphas = [color[3] for color in palette]
+    base_name = vs_theme.get("name", "Untitled")
+
+    for variant in variants:
+        label = f"{base_name} {variant_suffix(variant)}"
+        appearance = "light" if variant["light"] else "dark"
+        text = render(pieces, transform_palette(hls, alphas, variant), label, appearance)
+        outputs = {}
+        if "vscode" in formats:
+            outputs["vscode"] = (f"{label}.json".replace(" ", "-"), text)
+        zed_theme = None
+        problems = []
+        if zed or "zed" in formats or "neovim" in formats:
+            variant_theme = json.loads(text)
+            zed_theme = convert(variant_theme, label, appearance=appearance)
+            problems = validate(zed_theme)
+            if problems:
+                yield label, zed_theme, outputs, problems
+                continue
+            if "zed" in formats:
+                outputs["zed"] = (output_name(label), dumps(zed_theme))
+            if "neovim" in formats:
+                outputs["neovim"] = (f"{neovim_name(label)}.lua", to_neovim(variant_theme, zed_theme, source))
+        yield label, zed_theme, outputs, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate palette variants of a VS Code theme.")
+    parser.add_argument("template", help="VS Code theme to vary, e.g. vscode-themes/Blank-Moonlight.json")
+    parser.add_argument("--variant", action="append", default=[], metavar="SPEC",
+                        help="comma-separated transforms: hue=DEGREES, contrast=FACTOR, light "
+                             "(repeatable)")
+    parser.add_argument("--hue-steps", type=int, default=0, metavar="N",
+                        help="split the hue wheel into N steps and add a variant for each rotation but 0")
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        help=f"outputs to write (default: {','.join(FORMATS)})")
+    parser.add_argument("--out-dir", default=OUT_DIR,
+                        help=f"directory for the variants, one subdirectory per format (default: {OUT_DIR}/)")
+    parser.add_argument("--audit", action="store_true",
+                        help="print the contrast failures of each variant's Zed theme")
+    args = parser.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(unknown)}")
+    try:
+        variants = [parse_variant(spec) for spec in args.variant]
+    except ValueError as e:
+        parser.error(str(e))
+    for i in range(1, args.hue_steps):
+        variants.append({"hue": 360 * i / args.hue_steps, "contrast": 1.0, "light": False})
+    if not variants:
+        parser.error("no variants requested; use --variant or --hue-steps")
+
+    for fmt in formats:
+        os.makedirs(os.path.join(args.out_dir, fmt), exist_ok=True)
+
+    if args.audit:
+        from audit_theme import audit, failures
+
+    start = time.perf_counter()
+    written = 0
+    invalid = 0
+    for label, zed_theme, outputs, problems in generate(load_json(args.template), variants, formats,
+                                                        os.path.normpath(args.template), args.audit):
+        for fmt, (name, content) in outputs.items():
+            written += write_if_changed(os.path.join(args.out_dir, fmt, name), content)
+        if problems:
+            # As in convert_theme.py: nothing Zed-derived is written for it
+            invalid += 1
+            print(f"{label}: Zed and Neovim outputs not written, output fails the Zed schema")
+            for problem in problems:
+                print(f"  -> Schema: {problem}")
+            continue
+        if args.audit:
+            rows = audit(zed_theme)
+            bad = failures(rows)
+            lowest = f", lowest {rows[0]['ratio']:.2f}" if rows else ""
+            print(f"{label}: {len(bad)} of {len(rows)} pairs below the required contrast{lowest}")
+    elapsed = time.perf_counter() - start
+
+    print(f"Generated {len(variants)} variants ({written} files written, {invalid} invalid) "
+          f"in {elapsed * 1000:.1f} ms")
+    if invalid:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()